@@ -0,0 +1,409 @@
+import math
+
+from noyau_kruskal import MSTResult, kruskal_mst
+
+# Arbre lien-coupure (link-cut tree) : forêt d'arbres non enracinés, chaque arbre découpé en chemins préférés
+# stockés dans des arbres splay. Chaque nœud porte une valeur ; best[x] est le nœud de valeur maximale du
+# sous-arbre splay de x, ce qui donne le maximum sur un chemin. Toutes les opérations sont en O(log n) amorti
+class LinkCutTree:
+    def __init__(self):
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.flip = []
+        self.value = []
+        self.best = []
+        self.free = []  # Nœuds libérés, réutilisés par add_node
+
+    def add_node(self, value=-math.inf):
+        if self.free:
+            x = self.free.pop()
+            self.left[x] = self.right[x] = self.parent[x] = -1
+            self.flip[x] = False
+            self.value[x] = value
+            self.best[x] = x
+            return x
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flip.append(False)
+        self.value.append(value)
+        self.best.append(len(self.best))
+        return len(self.best) - 1
+
+    # Libérer un nœud isolé (arête retirée de la forêt)
+    def remove_node(self, x):
+        self.free.append(x)
+
+    def _is_root(self, x):
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _update(self, x):
+        value, best = self.value, self.best
+        b = x
+        child = self.left[x]
+        if child != -1 and value[best[child]] > value[b]:
+            b = best[child]
+        child = self.right[x]
+        if child != -1 and value[best[child]] > value[b]:
+            b = best[child]
+        best[x] = b
+
+    # Propager une inversion de chemin en attente vers les enfants
+    def _push(self, x):
+        if self.flip[x]:
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            if left != -1:
+                self.flip[left] = not self.flip[left]
+            if right != -1:
+                self.flip[right] = not self.flip[right]
+            self.flip[x] = False
+
+    def _rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if not self._is_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        if left[p] == x:
+            child = right[x]
+            left[p] = child
+            right[x] = p
+        else:
+            child = left[x]
+            right[p] = child
+            left[x] = p
+        if child != -1:
+            parent[child] = p
+        parent[p] = x
+        parent[x] = g
+        self._update(p)
+        self._update(x)
+
+    def _splay(self, x):
+        # Propager les inversions depuis la racine du splay jusqu'à x (itératif, sans récursion)
+        path = [x]
+        y = x
+        while not self._is_root(y):
+            y = self.parent[y]
+            path.append(y)
+        for y in reversed(path):
+            self._push(y)
+        parent, left = self.parent, self.left
+        while not self._is_root(x):
+            p = parent[x]
+            if not self._is_root(p):
+                g = parent[p]
+                self._rotate(p if (left[g] == p) == (left[p] == x) else x)
+            self._rotate(x)
+
+    # Rendre préféré le chemin de la racine de l'arbre jusqu'à x ; x devient la racine de son splay
+    def access(self, x):
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._update(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def make_root(self, x):
+        self.access(x)
+        self.flip[x] = not self.flip[x]
+
+    def find_root(self, x):
+        self.access(x)
+        self._push(x)
+        while self.left[x] != -1:
+            x = self.left[x]
+            self._push(x)
+        self._splay(x)
+        return x
+
+    def connected(self, u, v):
+        return u == v or self.find_root(u) == self.find_root(v)
+
+    # Relier deux arbres distincts par l'arête (u, v)
+    def link(self, u, v):
+        self.make_root(u)
+        self.parent[u] = v
+
+    # Couper l'arête (u, v) de la forêt
+    def cut(self, u, v):
+        self.make_root(u)
+        self.access(v)
+        # u est alors l'unique nœud du sous-arbre gauche de v
+        self.left[v] = -1
+        self.parent[u] = -1
+        self._update(v)
+
+    # Nœud de valeur maximale sur le chemin entre u et v (qui doivent être reliés)
+    def path_max(self, u, v):
+        self.make_root(u)
+        self.access(v)
+        return self.best[v]
+
+    def set_value(self, x, value):
+        self.access(x)
+        self.value[x] = value
+        self._update(x)
+
+
+# ACM (forêt couvrante minimale) dynamique : l'arbre courant est maintenu dans un arbre lien-coupure où chaque
+# arête de l'arbre est un nœud portant son poids. Une arête insérée ou allégée remplace l'arête la plus lourde du
+# cycle qu'elle ferme (O(log n) amorti) ; une arête de l'arbre supprimée ou alourdie est remplacée par l'arête
+# hors arbre la plus légère qui reconnecte les deux morceaux, cherchée depuis le plus petit des deux. Cette recherche
+# parcourt les sommets du plus petit morceau et leurs arêtes hors arbre : son coût est linéaire en la taille de ce
+# morceau (jusqu'à la moitié de la composante), sans la borne polylogarithmique de Holm, de Lichtenberg et Thorup.
+# Les requêtes sur des sommets inconnus retournent False ; les modifications d'arêtes absentes lèvent KeyError,
+# sans rien ajouter à la structure
+class DynamicMST:
+    def __init__(self, graph=None):
+        self.forest = LinkCutTree()
+        self.vertices = []
+        self.index = {}  # Sommet -> indice 0..n-1
+        self.vertex_node = []  # Indice de sommet -> nœud de la forêt (les arêtes de l'arbre ont aussi leurs nœuds)
+        self.edges = {}  # (a, b) avec a < b (indices de sommets) -> [poids, nœud de l'arête dans la forêt ou -1]
+        self.edge_of_node = {}  # Nœud de la forêt -> (a, b)
+        self.tree_adjacency = []  # Voisins de chaque sommet dans l'arbre
+        self.non_tree_adjacency = []  # Voisins de chaque sommet par une arête hors de l'arbre
+        self.total_weight = 0
+        self.num_tree_edges = 0
+        if graph is not None:
+            self._build(graph)
+
+    # Construction initiale : un Kruskal complet, puis la forêt est écrite directement depuis un parcours de l'ACM
+    # (chaque nœud pointe vers son parent, chemins préférés de longueur nulle : un état valide, en O(V))
+    def _build(self, graph):
+        for vertex in graph.nodes():
+            self.add_vertex(vertex)
+        forest = self.forest
+        mst = kruskal_mst(graph)
+        # Les indices du résultat suivent l'ordre des sommets du graphe, comme self.index
+        vertices = self.vertices
+        for a, b in zip(mst.sources.tolist(), mst.targets.tolist()):
+            if a > b:
+                a, b = b, a
+            weight = graph[vertices[a]][vertices[b]].get('weight', 1)  # Poids d'origine (entier ou flottant)
+            node = forest.add_node(weight)
+            self.edges[(a, b)] = [weight, node]
+            self.edge_of_node[node] = (a, b)
+            self.tree_adjacency[a][b] = node
+            self.tree_adjacency[b][a] = node
+        self.total_weight = mst.total_weight
+        self.num_tree_edges = len(mst)
+        visited = [False] * len(self.vertices)
+        for root in range(len(self.vertices)):
+            if visited[root]:
+                continue
+            visited[root] = True
+            queue = [root]
+            for vertex in queue:
+                for neighbour, node in self.tree_adjacency[vertex].items():
+                    if not visited[neighbour]:
+                        visited[neighbour] = True
+                        forest.parent[self.vertex_node[neighbour]] = node
+                        forest.parent[node] = self.vertex_node[vertex]
+                        queue.append(neighbour)
+        index, edges, non_tree_adjacency = self.index, self.edges, self.non_tree_adjacency
+        for u, v, weight in graph.edges(data='weight', default=1):
+            a, b = index[u], index[v]
+            key = (a, b) if a < b else (b, a)
+            if key not in edges:
+                edges[key] = [weight, -1]
+                non_tree_adjacency[a].add(b)
+                non_tree_adjacency[b].add(a)
+
+    def add_vertex(self, vertex):
+        if vertex not in self.index:
+            self.index[vertex] = len(self.vertices)
+            self.vertex_node.append(self.forest.add_node())
+            self.vertices.append(vertex)
+            self.tree_adjacency.append({})
+            self.non_tree_adjacency.append(set())
+        return self.index[vertex]
+
+    # Clé (a, b) d'une nouvelle arête : ses extrémités sont ajoutées si besoin
+    def _new_key(self, u, v):
+        a, b = self.add_vertex(u), self.add_vertex(v)
+        if a == b:
+            raise ValueError(f"Boucle sur le sommet {u!r} : une boucle n'appartient jamais à un ACM")
+        return (a, b) if a < b else (b, a)
+
+    # Clé (a, b) d'une arête existante, sans rien ajouter : None si un sommet est inconnu, une boucle ou l'arête absente
+    def _find_key(self, u, v):
+        a, b = self.index.get(u), self.index.get(v)
+        if a is None or b is None or a == b:
+            return None
+        key = (a, b) if a < b else (b, a)
+        return key if key in self.edges else None
+
+    # Clé d'une arête existante à modifier ; KeyError si elle est absente
+    def _existing_key(self, u, v):
+        key = self._find_key(u, v)
+        if key is None:
+            raise KeyError(f"Arête ({u!r}, {v!r}) absente du graphe")
+        return key
+
+    def _link(self, a, b, weight):
+        node = self.forest.add_node(weight)
+        self.forest.link(self.vertex_node[a], node)
+        self.forest.link(node, self.vertex_node[b])
+        self.edges[(a, b)][1] = node
+        self.edge_of_node[node] = (a, b)
+        self.tree_adjacency[a][b] = node
+        self.tree_adjacency[b][a] = node
+        self.total_weight += weight
+        self.num_tree_edges += 1
+
+    def _cut(self, a, b):
+        entry = self.edges[(a, b)]
+        node = entry[1]
+        self.forest.cut(self.vertex_node[a], node)
+        self.forest.cut(node, self.vertex_node[b])
+        self.forest.remove_node(node)
+        del self.edge_of_node[node]
+        del self.tree_adjacency[a][b]
+        del self.tree_adjacency[b][a]
+        entry[1] = -1
+        self.total_weight -= entry[0]
+        self.num_tree_edges -= 1
+
+    def _add_non_tree(self, a, b):
+        self.non_tree_adjacency[a].add(b)
+        self.non_tree_adjacency[b].add(a)
+
+    def _remove_non_tree(self, a, b):
+        self.non_tree_adjacency[a].discard(b)
+        self.non_tree_adjacency[b].discard(a)
+
+    # Proposer l'arête (a, b) à l'arbre : elle le rejoint si elle relie deux arbres, ou si elle est plus légère
+    # que l'arête la plus lourde du cycle qu'elle ferme (qui sort alors de l'arbre)
+    def _offer(self, a, b, weight):
+        forest = self.forest
+        node_a, node_b = self.vertex_node[a], self.vertex_node[b]
+        if not forest.connected(node_a, node_b):
+            self._link(a, b, weight)
+            return True
+        heaviest = forest.path_max(node_a, node_b)
+        if forest.value[heaviest] > weight:
+            replaced = self.edge_of_node[heaviest]
+            self._cut(*replaced)
+            self._add_non_tree(*replaced)
+            self._link(a, b, weight)
+            return True
+        self._add_non_tree(a, b)
+        return False
+
+    # Sommets du plus petit des deux arbres contenant a et b (juste après une coupure) : deux parcours menés en
+    # alternance, arrêtés dès que l'un s'épuise, soit O(taille du plus petit morceau)
+    def _smaller_side(self, a, b):
+        adjacency = self.tree_adjacency
+        sides = [({a}, [a]), ({b}, [b])]
+        while True:
+            for seen, queue in sides:
+                if not queue:
+                    return seen
+                vertex = queue.pop()
+                for neighbour in adjacency[vertex]:
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        queue.append(neighbour)
+
+    # Après la coupure de l'arête (a, b) de l'arbre : l'arête hors arbre la plus légère qui sort du plus petit
+    # morceau reconnecte les deux (les arêtes hors arbre sont toujours internes à un arbre)
+    def _replace(self, a, b):
+        side = self._smaller_side(a, b)
+        best = None
+        for x in side:
+            for y in self.non_tree_adjacency[x]:
+                if y not in side:
+                    key = (x, y) if x < y else (y, x)
+                    weight = self.edges[key][0]
+                    if best is None or weight < best[0]:
+                        best = (weight, key)
+        if best is None:
+            return None
+        weight, key = best
+        self._remove_non_tree(*key)
+        self._link(*key, weight)
+        return (self.vertices[key[0]], self.vertices[key[1]], weight)
+
+    # Insérer une arête (ou modifier le poids d'une arête existante) ; retourne True si elle entre dans l'arbre
+    def insert_edge(self, u, v, weight=1):
+        key = self._new_key(u, v)
+        if key in self.edges:
+            return self.update_weight(u, v, weight)
+        self.edges[key] = [weight, -1]
+        return self._offer(*key, weight)
+
+    # Modifier le poids d'une arête ; retourne True si elle appartient à l'arbre après la modification
+    def update_weight(self, u, v, weight):
+        key = self._existing_key(u, v)
+        entry = self.edges[key]
+        old_weight, node = entry
+        if node == -1:
+            entry[0] = weight
+            if weight >= old_weight:
+                # Plus lourde qu'avant : elle ne peut pas remplacer une arête de l'arbre
+                return False
+            self._remove_non_tree(*key)
+            return self._offer(*key, weight)
+        entry[0] = weight
+        self.total_weight += weight - old_weight
+        if weight <= old_weight:
+            self.forest.set_value(node, weight)
+            return True
+        # Alourdie : la retirer, puis chercher la meilleure arête de reconnexion (elle-même comprise)
+        self.total_weight -= weight - old_weight
+        entry[0] = old_weight
+        self._cut(*key)
+        entry[0] = weight
+        self._add_non_tree(*key)
+        self._replace(*key)
+        return self.edges[key][1] != -1
+
+    # Supprimer une arête ; retourne l'arête de remplacement (u, v, poids), ou None
+    def delete_edge(self, u, v):
+        key = self._existing_key(u, v)
+        weight, node = self.edges[key]
+        if node == -1:
+            self._remove_non_tree(*key)
+            del self.edges[key]
+            return None
+        self._cut(*key)
+        del self.edges[key]
+        return self._replace(*key)
+
+    def has_edge(self, u, v):
+        return self._find_key(u, v) is not None
+
+    def in_tree(self, u, v):
+        key = self._find_key(u, v)
+        return key is not None and self.edges[key][1] != -1
+
+    def connected(self, u, v):
+        if u not in self.index or v not in self.index:
+            return False
+        return self.forest.connected(self.vertex_node[self.index[u]], self.vertex_node[self.index[v]])
+
+    @property
+    def num_components(self):
+        return len(self.vertices) - self.num_tree_edges
+
+    # Arêtes de l'arbre courant (u, v, poids)
+    def tree_edges(self):
+        vertices = self.vertices
+        return [(vertices[a], vertices[b], self.edges[(a, b)][0]) for a, b in self.edge_of_node.values()]
+
+    # Instantané de l'arbre courant, au format des autres algorithmes ACM
+    def result(self):
+        roots = [self.forest.find_root(node) for node in self.vertex_node]
+        return MSTResult.from_edge_list(list(self.vertices), self.tree_edges(), self.total_weight, roots)
@@ -0,0 +1,77 @@
+from index_spatial import DEFAULT_LEAF_SIZE, KDTree
+from noyau_kruskal import EdgeArrays, kruskal_edge_arrays, _component_labels
+
+# Nombre de voisins conservés par point : la plupart des plus proches points étrangers y sont déjà
+DEFAULT_CACHED_NEIGHBOURS = 8
+
+# Plus proche point d'une autre composante pour chaque point (indice et distance, -1 et +inf si non requis).
+# D'abord dans la liste des k plus proches voisins (le premier voisin étranger de la liste est exact), puis, pour
+# les seuls points qui pourraient encore améliorer l'arête minimale de leur composante, par un parcours de l'arbre
+# k-d qui écarte les nœuds de même composante et partage la meilleure borne de chaque composante
+def _nearest_foreign(index, components, neighbours, neighbour_distances):
+    import numpy as np
+    num_points = len(components)
+    foreign = (components[neighbours] != components[:, None]) & (neighbours >= 0)
+    has_foreign = foreign.any(axis=1)
+    first = np.argmax(foreign, axis=1)
+    rows = np.arange(num_points)
+    targets = np.where(has_foreign, neighbours[rows, first], -1)
+    distances = np.where(has_foreign, neighbour_distances[rows, first], np.inf)
+
+    best = np.full(int(components.max()) + 1, np.inf)
+    np.minimum.at(best, components, distances)
+    # Sans voisin étranger dans la liste, tout point étranger est au-delà de la k-ième distance : un point dont
+    # cette borne inférieure atteint la meilleure arête de sa composante est inutile
+    pending = np.flatnonzero(~has_foreign)
+    pending = pending[neighbour_distances[pending, -1] < best[components[pending]]]
+    if len(pending):
+        found, gaps = index.nearest_other(pending, components, best[components[pending]], best)
+        better = gaps < distances[pending]
+        targets[pending[better]] = found[better]
+        distances[pending[better]] = gaps[better]
+    return targets, distances
+
+# ACM euclidien d'un nuage de points N×d (tableau numpy), sans construire le graphe complet. Borůvka exact sur un
+# arbre k-d : à chaque tour, l'arête la plus courte sortant de chaque composante (plus proche point étranger),
+# les k plus proches voisins servant de cache d'un tour à l'autre. Les arêtes candidates de tous les tours (au plus
+# 2N) passent ensuite par le noyau Kruskal, qui départage aussi les égalités de distance.
+# Retourne un MSTResult dont les arêtes candidates (EdgeArrays) sont pondérées par la distance euclidienne
+def euclidean_mst(points, neighbours=DEFAULT_CACHED_NEIGHBOURS, leaf_size=DEFAULT_LEAF_SIZE):
+    import numpy as np
+    index = KDTree(points, leaf_size)
+    num_points = len(index)
+    cached, cached_distances = index.knn(neighbours)
+
+    components = np.arange(num_points)
+    parent = list(range(num_points))
+    sources, targets, weights = [], [], []
+    num_components = num_points
+    while num_components > 1:
+        nearest, distances = _nearest_foreign(index, components, cached, cached_distances)
+        # Arête minimale de chaque composante : premier point de la composante dans l'ordre des distances
+        candidates = np.flatnonzero(np.isfinite(distances))
+        order = candidates[np.lexsort((distances[candidates], components[candidates]))]
+        first = np.concatenate(([True], components[order][1:] != components[order][:-1]))
+        chosen = order[first]
+        sources.append(chosen)
+        targets.append(nearest[chosen])
+        weights.append(distances[chosen])
+        for u, v in zip(chosen.tolist(), nearest[chosen].tolist()):
+            # Recherche avec réduction de moitié du chemin
+            while parent[u] != u:
+                parent[u] = parent[parent[u]]
+                u = parent[u]
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            if u != v:
+                parent[v] = u
+                num_components -= 1
+        components = _component_labels(parent)
+
+    if sources:
+        edges = EdgeArrays(num_points, np.concatenate(sources), np.concatenate(targets), np.concatenate(weights))
+    else:
+        empty = np.empty(0, dtype=np.int64)
+        edges = EdgeArrays(num_points, empty, empty, np.empty(0))
+    return kruskal_edge_arrays(edges)
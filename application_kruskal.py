@@ -1,16 +1,18 @@
 import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QPushButton, QComboBox, QSlider, QTextEdit, QFrame,
-                            QRadioButton, QGroupBox, QMessageBox, QDialog, QStatusBar, QProgressBar)
+                            QRadioButton, QGroupBox, QMessageBox, QDialog, QStatusBar, QProgressBar,
+                            QCheckBox)
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-import networkx as nx
+import os
 import time
 
 # Importer notre code existant
-from noyau_kruskal import DisjointSet, ensure_connectivity, create_test_graphs
+from noyau_kruskal import (DisjointSet, CountingDisjointSet, KruskalInstrumentation, MSTResult, ensure_connectivity,
+                           graph_components, spanning_forest, create_graph_catalog)
 from visualisation_graphe import CytoscapeGraphView
-from comparaison_graphes import GraphCompareDialog, GraphComparisonWindow
-from graphe_personnalise import CustomGraphDialog
+# Les fenêtres de comparaison et de création de graphe (et numpy, qu'elles utilisent)
+# ne sont importées qu'à leur première ouverture pour accélérer le démarrage
 
 class KruskalCytoscapeApp(QMainWindow):
     def __init__(self):
@@ -27,8 +29,10 @@ class KruskalCytoscapeApp(QMainWindow):
         self.kruskal_thread = None
         self.current_edge = None
         self.sorted_edges = []
-        self.test_graphs = create_test_graphs()
-        self.graph_names = [title for _, title, _ in self.test_graphs]
+        # Catalogue paresseux : les graphes ne sont construits qu'à leur sélection
+        self.test_graphs = create_graph_catalog()
+        self.file_thread = None
+        self.graph_names = self.test_graphs.names()
         
         # Configurer l'interface
         self.setup_ui()
@@ -52,7 +56,8 @@ class KruskalCytoscapeApp(QMainWindow):
         graph_layout = QVBoxLayout()
         
         self.graph_combo = QComboBox()
-        self.graph_combo.addItems(self.graph_names)
+        for index, name in enumerate(self.graph_names):
+            self.add_graph_combo_item(index, name)
         self.graph_combo.currentIndexChanged.connect(self.load_selected_graph)
         graph_layout.addWidget(self.graph_combo)
         
@@ -60,6 +65,10 @@ class KruskalCytoscapeApp(QMainWindow):
         self.custom_graph_btn.clicked.connect(self.create_custom_graph)
         graph_layout.addWidget(self.custom_graph_btn)
         
+        self.import_graph_btn = QPushButton("Importer un Graphe depuis un Fichier")
+        self.import_graph_btn.clicked.connect(self.import_graph_file)
+        graph_layout.addWidget(self.import_graph_btn)
+        
         graph_group.setLayout(graph_layout)
         left_layout.addWidget(graph_group)
         
@@ -94,6 +103,11 @@ class KruskalCytoscapeApp(QMainWindow):
         button_layout.addWidget(self.reset_btn)
         animation_layout.addLayout(button_layout)
         
+        # Instrumentation facultative : phases et compteurs union-find affichés dans le panneau de profil
+        self.instrumentation_check = QCheckBox("Instrumentation (profil d'exécution)")
+        self.instrumentation_check.toggled.connect(self.toggle_profile_panel)
+        animation_layout.addWidget(self.instrumentation_check)
+        
         animation_group.setLayout(animation_layout)
         left_layout.addWidget(animation_group)
         
@@ -124,6 +138,18 @@ class KruskalCytoscapeApp(QMainWindow):
         info_group.setLayout(info_layout)
         left_layout.addWidget(info_group)
         
+        # Panneau de profil, visible seulement quand l'instrumentation est activée
+        self.profile_group = QGroupBox("Profil d'Exécution")
+        profile_layout = QVBoxLayout()
+        self.profile_text = QTextEdit()
+        self.profile_text.setReadOnly(True)
+        self.profile_text.setStyleSheet("font-family: monospace;")
+        self.profile_text.setMaximumHeight(180)
+        profile_layout.addWidget(self.profile_text)
+        self.profile_group.setLayout(profile_layout)
+        self.profile_group.hide()
+        left_layout.addWidget(self.profile_group)
+        
         # Panneau droit pour la visualisation
         right_panel = QFrame()
         right_panel.setFrameShape(QFrame.StyledPanel)
@@ -151,11 +177,24 @@ class KruskalCytoscapeApp(QMainWindow):
         if self.graph_names:
             self.graph_combo.setCurrentIndex(0)
             
+    def add_graph_combo_item(self, index, name):
+        # Remplir le menu déroulant à partir des seules métadonnées du catalogue
+        metadata = self.test_graphs.metadata(index)
+        num_edges = metadata["num_edges"] if metadata["num_edges"] is not None else "?"
+        connectivity = "connexe" if metadata["connected"] else "déconnecté"
+        tooltip = f"{metadata['category']} - {metadata['num_vertices']} sommets, {num_edges} arêtes, {connectivity}"
+        if metadata["seed"] is not None:
+            tooltip += f", graine {metadata['seed']}"
+        self.graph_combo.addItem(name)
+        self.graph_combo.setItemData(self.graph_combo.count() - 1, tooltip, Qt.ToolTipRole)
+    
     def load_selected_graph(self, index):
         if index >= 0:
             self.load_graph(index)
             
     def create_custom_graph(self):
+        from graphe_personnalise import CustomGraphDialog
+        
         # Ouvrir la boîte de dialogue de graphe personnalisé
         dialog = CustomGraphDialog(self)
         if dialog.exec_() == QDialog.Accepted:
@@ -163,22 +202,43 @@ class KruskalCytoscapeApp(QMainWindow):
             custom_graph, graph_name = dialog.get_graph()
             
             if custom_graph:
-                # Vérifier si le graphe est déconnecté
-                is_disconnected = not nx.is_connected(custom_graph)
-                
-                # Ajouter le graphe personnalisé à la liste test_graphs
-                # Marquer les graphes déconnectés de manière appropriée pour qu'ils ne soient pas automatiquement connectés
-                graph_type = f"{graph_name} (Graphe Déconnecté)" if is_disconnected else graph_name
-                self.test_graphs.append((custom_graph, graph_type, "Personnalisé"))
-                
-                # Ajouter au menu déroulant
-                self.graph_combo.addItem(graph_type)
-                
-                # Sélectionner le nouveau graphe
-                self.graph_combo.setCurrentIndex(self.graph_combo.count() - 1)
+                self.add_graph(custom_graph, graph_name, "Personnalisé")
         else:
             # L'utilisateur a annulé
             pass
+    
+    def add_graph(self, graph, graph_name, category):
+        """Ajouter un graphe à la liste test_graphs et le sélectionner"""
+        # Vérifier si le graphe est déconnecté (une passe union-find, sans calculer d'ACM)
+        is_disconnected = len(graph_components(graph)) > 1
+        
+        # Marquer les graphes déconnectés de manière appropriée pour qu'ils ne soient pas automatiquement connectés
+        graph_type = f"{graph_name} (Graphe Déconnecté)" if is_disconnected else graph_name
+        self.test_graphs.add(graph, graph_type, category, connected=not is_disconnected)
+        self.graph_names.append(graph_type)
+        
+        # Ajouter au menu déroulant
+        self.add_graph_combo_item(len(self.test_graphs) - 1, graph_type)
+        
+        # Sélectionner le nouveau graphe
+        self.graph_combo.setCurrentIndex(self.graph_combo.count() - 1)
+    
+    def import_graph_file(self):
+        # Lire le fichier hors du thread de l'interface, le graphe est ajouté directement à test_graphs
+        from graphe_personnalise import GraphFileThread, ask_graph_import, start_graph_file_thread
+        
+        if self.file_thread and self.file_thread.isRunning():
+            return
+        choice = ask_graph_import(self)
+        if not choice:
+            return
+        filename, file_format, options = choice
+        graph_name = os.path.splitext(os.path.basename(filename))[0]
+        
+        self.file_thread = GraphFileThread(filename, file_format=file_format, options=options)
+        self.file_thread.result_ready.connect(
+            lambda graph: graph is not None and self.add_graph(graph, graph_name, "Importé"))
+        start_graph_file_thread(self, self.file_thread, f"Lecture de {os.path.basename(filename)}...")
         
     def update_speed(self):
         # Obtenir la valeur du curseur (10-300)
@@ -205,7 +265,8 @@ class KruskalCytoscapeApp(QMainWindow):
         self.stop_btn.setEnabled(True)
         
         # Start the algorithm in a separate thread
-        self.kruskal_thread = KruskalThread(self.graph, self.animation_speed)
+        instrumentation = KruskalInstrumentation() if self.instrumentation_check.isChecked() else None
+        self.kruskal_thread = KruskalThread(self.graph, self.animation_speed, instrumentation)
         self.kruskal_thread.update_signal.connect(self.update_visualization)
         self.kruskal_thread.finished_signal.connect(self.animation_finished)
         self.kruskal_thread.start()
@@ -251,19 +312,9 @@ class KruskalCytoscapeApp(QMainWindow):
             current_edge = None
             self.graph_view.draw_graph(graph, mst_edges, current_edge)
         
-        # Count connected components in the MST
+        # Count connected components in the MST: a forest with n vertices and k edges has n - k components
         if mst_edges:
-            vertices = list(graph.nodes())
-            ds = DisjointSet(vertices)
-            for u, v, _ in mst_edges:
-                ds.union(u, v)
-                
-            # Count unique representatives (connected components)
-            components = set()
-            for node in graph.nodes():
-                components.add(ds.find(node))
-            
-            component_count = len(components)
+            component_count = graph.number_of_nodes() - len(mst_edges)
             if component_count > 1:
                 self.component_label.setText(f"Composantes Connexes: {component_count} (Forêt)")
             else:
@@ -271,7 +322,7 @@ class KruskalCytoscapeApp(QMainWindow):
         else:
             self.component_label.setText("Composantes Connexes: N/A")
 
-    def animation_finished(self, graph, mst_edges, execution_time):
+    def animation_finished(self, graph, mst_edges, execution_time, result):
         # Hide progress bar
         self.progress_bar.hide()
         
@@ -280,20 +331,9 @@ class KruskalCytoscapeApp(QMainWindow):
         self.step_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         
-        # Calculate total MST weight
-        total_weight = sum(weight for _, _, weight in mst_edges)
-        
-        # Count connected components
-        vertices = list(graph.nodes())
-        ds = DisjointSet(vertices)
-        for u, v, _ in mst_edges:
-            ds.union(u, v)
-        
-        # Count unique representatives (connected components)
-        components = set()
-        for node in graph.nodes():
-            components.add(ds.find(node))
-        component_count = len(components)
+        # Total weight and components come from the thread's Kruskal pass (MSTResult)
+        total_weight = result.total_weight
+        component_count = result.num_components
         
         # Update status
         if component_count > 1:
@@ -301,10 +341,18 @@ class KruskalCytoscapeApp(QMainWindow):
         else:
             result_type = "Arbre Couvrant Minimal"
         
-        status_text = f"Algorithme terminé en {execution_time:.2f} secondes ! {result_type} trouvé avec:"
+        status_text = f"Algorithme terminé (calcul: {execution_time * 1000:.2f} ms, hors animation) ! {result_type} trouvé avec:"
         status_text += f"\nPoids total: {total_weight:.2f}"
         status_text += f"\nArêtes dans l'ACM: {len(mst_edges)}/{graph.number_of_edges()}"
         status_text += f"\nComposantes: {component_count}"
+        if component_count > 1:
+            sizes = result.component_sizes().tolist()
+            weights = result.component_weights().tolist()
+            shown = min(component_count, 10)
+            status_text += "\nPar composante (sommets, poids): " + ", ".join(
+                f"({size}, {weight:.2f})" for size, weight in zip(sizes[:shown], weights[:shown]))
+            if component_count > shown:
+                status_text += ", ..."
         
         # Final message stays blue
         self.update_info(status_text, "blue")
@@ -315,6 +363,14 @@ class KruskalCytoscapeApp(QMainWindow):
             self.component_label.setText(f"Composantes Connexes: {component_count} (Forêt)")
         else:
             self.component_label.setText("Composantes Connexes: 1 (Arbre)")
+        
+        if self.kruskal_thread and self.kruskal_thread.instrumentation is not None:
+            self.profile_text.setPlainText(self.kruskal_thread.instrumentation.report())
+    
+    def toggle_profile_panel(self, enabled):
+        self.profile_group.setVisible(enabled)
+        if enabled:
+            self.profile_text.setPlainText("Lancez l'animation pour mesurer les phases de l'algorithme.")
 
     def step_animation(self):
         if self.graph is None:
@@ -392,29 +448,35 @@ class KruskalCytoscapeApp(QMainWindow):
             self.update_info(status_text, "blue")
             
     def compare_graphs(self):
+        from comparaison_graphes import GraphCompareDialog, GraphComparisonWindow
+        
         # Open the graph comparison dialog
         dialog = GraphCompareDialog(self.graph_names, self)
         if dialog.exec_() == QDialog.Accepted:
             selected_graphs = dialog.get_selected_graphs()
+            selected_engines = dialog.get_selected_engines()
             
-            # Check if two different graphs were selected
-            if selected_graphs[0] == selected_graphs[1]:
-                QMessageBox.warning(self, "Sélection Invalide", "Veuillez sélectionner deux graphes différents à comparer.")
+            # Check that the selected graphs are all different
+            if len(set(selected_graphs)) != len(selected_graphs):
+                QMessageBox.warning(self, "Sélection Invalide", "Veuillez sélectionner des graphes différents à comparer.")
                 return
-                
-            # Get the graph objects
-            graph1 = self.test_graphs[selected_graphs[0]][0]
-            graph2 = self.test_graphs[selected_graphs[1]][0]
             
-            # Get the graph names
-            graph1_name = self.test_graphs[selected_graphs[0]][1]
-            graph2_name = self.test_graphs[selected_graphs[1]][1]
+            if not selected_engines:
+                QMessageBox.warning(self, "Sélection Invalide", "Veuillez sélectionner au moins un moteur ACM.")
+                return
+            
+            # One panel per (graph, engine) pair
+            entries = [(self.test_graphs[index][0], self.test_graphs[index][1], engine_name)
+                       for index in selected_graphs for engine_name in selected_engines]
+            if len(entries) < 2:
+                QMessageBox.warning(self, "Sélection Invalide", "Veuillez sélectionner au moins deux graphes ou deux moteurs à comparer.")
+                return
             
             # Get the selected category name
             category_name = dialog.get_selected_category()
             
             # Open the comparison window
-            self.comparison_window = GraphComparisonWindow(graph1, graph1_name, graph2, graph2_name, category_name, self)
+            self.comparison_window = GraphComparisonWindow(entries, category_name, self)
             self.comparison_window.show()
         
     def update_info(self, text, color="blue"):
@@ -429,6 +491,9 @@ class KruskalCytoscapeApp(QMainWindow):
         if self.kruskal_thread and self.kruskal_thread.isRunning():
             self.kruskal_thread.stop()
             self.kruskal_thread.wait()
+        if self.file_thread and self.file_thread.isRunning():
+            self.file_thread.cancel()
+            self.file_thread.wait()
         event.accept()
 
     def load_graph(self, index):
@@ -751,15 +816,15 @@ class KruskalCytoscapeApp(QMainWindow):
         info_text += f"• Sommets: {self.graph.number_of_nodes()}\n"
         info_text += f"• Arêtes: {self.graph.number_of_edges()}\n"
         
-        # Check if the graph is connected
-        is_connected = nx.is_connected(self.graph)
+        # Check if the graph is connected (components of the cached spanning forest)
+        forest = spanning_forest(self.graph)
+        is_connected = forest.num_components <= 1
         info_text += f"• Connexe: {'Oui' if is_connected else 'Non'}\n"
         
         if not is_connected:
-            # Count connected components
-            components = list(nx.connected_components(self.graph))
-            info_text += f"• Composantes Connexes: {len(components)}\n"
-            info_text += "• Tailles des Composantes: " + ", ".join([str(len(c)) for c in components]) + "\n"
+            info_text += f"• Composantes Connexes: {forest.num_components}\n"
+            info_text += "• Tailles des Composantes: " + ", ".join(map(str, forest.component_sizes().tolist())) + "\n"
+        info_text += f"• Poids de l'ACM: {forest.total_weight:.2f}\n"
         
         # Calculate edge weight statistics
         weights = [data['weight'] for _, _, data in self.graph.edges(data=True)]
@@ -774,55 +839,74 @@ class KruskalCytoscapeApp(QMainWindow):
 
 class KruskalThread(QThread):
     update_signal = pyqtSignal(object, object, int, bool)  # Graphe, arêtes ACM, indice d'arête, est_acceptée
-    finished_signal = pyqtSignal(object, list, float)
+    finished_signal = pyqtSignal(object, list, float, object)  # Graphe, arêtes ACM, temps de calcul, MSTResult
     
-    def __init__(self, graph, animation_speed):
+    def __init__(self, graph, animation_speed, instrumentation=None):
         super().__init__()
         self.graph = graph
         self.animation_speed = animation_speed
+        self.instrumentation = instrumentation
         self.running = True
         
     def run(self):
-        start_time = time.time()
+        start_time = time.perf_counter()
+        # Les pauses de l'animation sont exclues du temps de calcul rapporté
+        paused_time = 0.0
+        
+        instrumentation = self.instrumentation
         
         # Obtenir toutes les arêtes avec leurs poids
         edges = []
         for u, v, data in self.graph.edges(data=True):
             edges.append((u, v, data['weight']))
+        extracted_time = time.perf_counter()
         
         # Trier les arêtes par poids
         edges.sort(key=lambda x: x[2])
+        sorted_time = time.perf_counter()
         
-        # Initialiser l'ensemble disjoint
+        # Initialiser l'ensemble disjoint (compteur si l'instrumentation est active)
         vertices = list(self.graph.nodes())
-        ds = DisjointSet(vertices)
+        ds = CountingDisjointSet(vertices, instrumentation.counters) if instrumentation else DisjointSet(vertices)
         
         mst_edges = []
+        total_weight = 0
         
         # Traiter chaque arête par ordre de poids croissant
         for i, (u, v, weight) in enumerate(edges):
             if not self.running:
                 break
                 
-            # Vérifier si l'ajout de cette arête crée un cycle
-            if ds.find(u) != ds.find(v):  # Aucun cycle ne sera formé
+            # Vérifier si l'ajout de cette arête crée un cycle (union retourne False si u et v sont déjà reliés)
+            if ds.union(u, v):  # Aucun cycle ne sera formé
                 # Ajouter l'arête à l'ACM
-                ds.union(u, v)
                 mst_edges.append((u, v, weight))
+                total_weight += weight
                 
                 # Émettre un signal pour mettre à jour l'interface avec l'état actuel et l'acceptation
                 self.update_signal.emit(self.graph, mst_edges, i, True)  # True = Acceptée
+                paused_time += self.animation_speed
                 time.sleep(self.animation_speed)
             else:
                 # Émettre un signal pour montrer l'arête rejetée
                 self.update_signal.emit(self.graph, mst_edges, i, False)  # False = Rejetée
+                paused_time += self.animation_speed / 2
                 time.sleep(self.animation_speed / 2)  # Pause plus courte pour les arêtes rejetées
         
-        end_time = time.time()
-        execution_time = end_time - start_time
+        loop_time = time.perf_counter()
+        # Étiquettes et statistiques de composantes issues de cette même passe (représentants union-find)
+        result = MSTResult.from_edge_list(vertices, mst_edges, total_weight, [ds.find(v) for v in vertices])
+        end_time = time.perf_counter()
+        execution_time = max(0.0, end_time - start_time - paused_time)
+        if instrumentation:
+            instrumentation.add_phase("extraction", extracted_time - start_time)
+            instrumentation.add_phase("tri", sorted_time - extracted_time)
+            # Le temps de la boucle exclut les pauses ; l'envoi des signaux d'animation y reste compté
+            instrumentation.add_phase("union_find", max(0.0, loop_time - sorted_time - paused_time))
+            instrumentation.add_phase("construction", end_time - loop_time)
         
         # Signaler que l'algorithme est terminé
-        self.finished_signal.emit(self.graph, mst_edges, execution_time)
+        self.finished_signal.emit(self.graph, mst_edges, execution_time, result)
     
     def stop(self):
         self.running = False
@@ -0,0 +1,78 @@
+import heapq
+import math
+from itertools import count
+
+from noyau_kruskal import EdgeArrays, MSTResult, kruskal_edge_arrays
+from validation_acm import PathMaximum
+
+# Meilleur échange d'arêtes d'une partition : retirer f de l'arbre (f hors des arêtes imposées), ajouter g (hors
+# de l'arbre et des arêtes interdites), g fermant un cycle qui contient f. Minimise poids(g) - poids(f) en une
+# passe : requêtes de poids maximal sur les chemins de l'arbre, les arêtes imposées y pesant -inf.
+# Retourne (écart de poids, f, g), ou None si aucun échange n'est possible
+def best_exchange(edges, tree_mask, included, excluded):
+    import numpy as np
+    tree_edges = np.flatnonzero(tree_mask)
+    tree_weights = edges.weights[tree_edges].astype(np.float64)
+    tree_weights[included[tree_edges]] = -math.inf
+    path_maximum = PathMaximum(edges.num_vertices, edges.sources[tree_edges], edges.targets[tree_edges],
+                               tree_weights, edge_ids=tree_edges)
+
+    candidates = np.flatnonzero(~tree_mask & ~excluded)
+    if not len(candidates):
+        return None
+    maxima, removed = path_maximum.query(edges.sources[candidates], edges.targets[candidates], return_edges=True)
+    # Chemin sans arête échangeable (-inf), boucle ou extrémités dans deux arbres (nan) : pas d'échange
+    valid = np.isfinite(maxima)
+    if not valid.any():
+        return None
+    deltas = np.where(valid, edges.weights[candidates] - np.where(valid, maxima, 0.0), np.inf)
+    best = int(np.argmin(deltas))
+    return float(deltas[best]), int(removed[best]), int(candidates[best])
+
+# Les k arbres couvrants de poids minimal, produits un par un, par poids croissant (Katoh, Ibaraki et Mine).
+# Chaque partition de l'espace des arbres (arêtes imposées, arêtes interdites) garde son meilleur arbre ; son
+# second meilleur arbre s'en déduit par un seul échange d'arêtes, sans recalculer d'ACM. Quand il est produit,
+# la partition est coupée en deux : f interdite (meilleur arbre : le nouvel arbre) et f imposée (meilleur arbre :
+# l'ancien). graph est un nx.Graph ou des EdgeArrays ; k=None énumère tous les arbres couvrants
+def k_best_spanning_trees(graph, k=None):
+    import numpy as np
+    edges = graph if isinstance(graph, EdgeArrays) else EdgeArrays.from_networkx(graph)
+    if k is not None and k <= 0:
+        return
+
+    first = kruskal_edge_arrays(edges)
+    yield first
+    # Tous les arbres couvrants d'un même graphe ont les mêmes composantes
+    components = first.components
+
+    tree_mask = np.zeros(len(edges), dtype=bool)
+    tree_mask[first.edge_indices] = True
+    no_edges = np.zeros(len(edges), dtype=bool)
+    heap = []
+    tie_breaker = count()
+
+    def push(tree_mask, tree_weight, included, excluded):
+        exchange = best_exchange(edges, tree_mask, included, excluded)
+        if exchange is not None:
+            delta, removed, added = exchange
+            heapq.heappush(heap, (tree_weight + delta, next(tie_breaker), tree_mask, included, excluded,
+                                  removed, added))
+
+    push(tree_mask, first.total_weight, no_edges, no_edges)
+    produced = 1
+    while heap and (k is None or produced < k):
+        weight, _, tree_mask, included, excluded, removed, added = heapq.heappop(heap)
+        new_tree = tree_mask.copy()
+        new_tree[removed] = False
+        new_tree[added] = True
+        # Poids recalculé sur les arêtes : évite l'accumulation d'erreurs d'arrondi d'un échange à l'autre
+        indices = np.flatnonzero(new_tree)
+        yield MSTResult(edges, indices, float(edges.weights[indices].sum()), components)
+        produced += 1
+
+        with_removed_excluded = excluded.copy()
+        with_removed_excluded[removed] = True
+        with_removed_included = included.copy()
+        with_removed_included[removed] = True
+        push(new_tree, weight, included, with_removed_excluded)
+        push(tree_mask, weight - (edges.weights[added] - edges.weights[removed]), with_removed_included, excluded)
@@ -0,0 +1,395 @@
+import argparse
+import csv
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+# Importer notre code existant
+from noyau_kruskal import MST_ENGINES, EXAMINING_ENGINES
+
+# Colonnes des résultats, dans l'ordre de l'export CSV
+RESULT_FIELDS = [
+    "graph", "seed", "engine", "num_vertices", "num_edges", "repeats", "warmup",
+    "min_ms", "median_ms", "p90_ms", "p99_ms", "mean_ms",
+    "peak_memory_kb", "edges_examined", "total_weight"
+]
+
+# Centile par interpolation linéaire sur des valeurs déjà triées
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+# Mesurer une fonction sans argument : échauffement, exécutions chronométrées, puis une exécution sous tracemalloc.
+# Retourne les statistiques de temps (ms), le pic mémoire (Ko) et le résultat de la dernière exécution
+def measure(func, repeats=20, warmup=3):
+    # Échauffement (caches, allocations) non comptabilisé
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    value = None
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        value = func()
+        timings.append(time.perf_counter() - start_time)
+    timings.sort()
+
+    # La mémoire est mesurée à part : tracemalloc ralentit fortement l'exécution
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = {
+        "repeats": repeats,
+        "warmup": warmup,
+        "min_ms": timings[0] * 1000 if timings else 0.0,
+        "median_ms": percentile(timings, 0.5) * 1000,
+        "p90_ms": percentile(timings, 0.9) * 1000,
+        "p99_ms": percentile(timings, 0.99) * 1000,
+        "mean_ms": statistics.fmean(timings) * 1000 if timings else 0.0,
+        "stdev_ms": statistics.stdev(timings) * 1000 if len(timings) > 1 else 0.0,
+        "peak_memory_kb": peak / 1024
+    }
+    return stats, value
+
+# Mesurer un moteur sur un graphe networkx
+def benchmark_engine(graph, engine_name, repeats=20, warmup=3):
+    engine = MST_ENGINES[engine_name]
+    stats, trace = measure(lambda: engine(graph), repeats, warmup)
+    trace = trace or []
+
+    result = {
+        "engine": engine_name,
+        # Graine du catalogue (None pour un graphe personnalisé ou importé) : permet de rejouer la mesure
+        "seed": graph.graph.get("seed"),
+        "num_vertices": graph.number_of_nodes(),
+        "num_edges": graph.number_of_edges()
+    }
+    result.update(stats)
+    # Nombre d'arêtes examinées seulement si la trace du moteur les contient toutes (None sinon)
+    result["edges_examined"] = len(trace) if engine_name in EXAMINING_ENGINES else None
+    result["total_weight"] = sum(weight for _, _, weight, accepted in trace if accepted)
+    return result
+
+# Mesurer plusieurs moteurs sur le même graphe
+def run_benchmark(graph, graph_name, engines=None, repeats=20, warmup=3, progress_callback=None):
+    engines = list(engines or MST_ENGINES)
+    results = []
+    for i, engine_name in enumerate(engines):
+        result = benchmark_engine(graph, engine_name, repeats, warmup)
+        result["graph"] = graph_name
+        results.append(result)
+        if progress_callback:
+            progress_callback(i + 1, len(engines))
+    return results
+
+# Informations sur l'environnement pour suivre les régressions d'une version à l'autre
+def environment_metadata():
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine()
+    }
+
+def export_results_csv(results, filename):
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+def export_results_json(results, filename):
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump({"metadata": environment_metadata(), "results": results}, f, indent=2, ensure_ascii=False)
+
+# Distributions de poids de la suite, appliquées à des tableaux numpy (rng : numpy.random.Generator)
+SUITE_WEIGHT_DISTRIBUTIONS = {
+    "uniforme": lambda rng, size: rng.random(size) * 100,
+    "entiers": lambda rng, size: rng.integers(1, 11, size).astype("float64"),
+    "egaux": lambda rng, size: rng.integers(1, 2, size).astype("float64"),
+    "exponentielle": lambda rng, size: rng.exponential(10.0, size),
+}
+
+# Graphe connexe aléatoire de degré moyen donné, avec des poids tirés selon la distribution demandée
+def make_suite_graph(num_vertices, average_degree, distribution, seed=None):
+    import numpy as np
+    from noyau_kruskal import equal_weight_edges
+    edges = equal_weight_edges(num_vertices, average_degree, 1, seed)
+    rng = np.random.default_rng(None if seed is None else seed + 1)
+    edges.weights = SUITE_WEIGHT_DISTRIBUTIONS[distribution](rng, len(edges))
+    return edges
+
+# Opérations mesurées par la suite ; chacune reçoit le contexte de la configuration (arêtes, graphe, fichier)
+def _suite_kruskal_mst(context):
+    from noyau_kruskal import kruskal_mst
+    return kruskal_mst(context["graph"])
+
+def _suite_kruskal_edge_arrays(context):
+    from noyau_kruskal import kruskal_edge_arrays
+    return kruskal_edge_arrays(context["edges"])
+
+def _suite_prim_mst(context):
+    from noyau_kruskal import prim_mst
+    return prim_mst(context["graph"])
+
+def _suite_minimum_spanning_tree(context):
+    from noyau_kruskal import minimum_spanning_tree
+    return minimum_spanning_tree(context["graph"])
+
+def _suite_disjoint_set(context):
+    from noyau_kruskal import DisjointSet
+    ds = DisjointSet(range(context["edges"].num_vertices))
+    return sum(ds.union(u, v) for u, v in context["pairs"])
+
+def _suite_to_networkx(context):
+    return context["edges"].to_networkx()
+
+def _suite_read_file(context):
+    from fichiers_graphe import read_graph_file
+    return read_graph_file(context["filename"])
+
+SUITE_OPERATIONS = {
+    "kruskal_mst": _suite_kruskal_mst,
+    "kruskal_edge_arrays": _suite_kruskal_edge_arrays,
+    "prim_mst": _suite_prim_mst,
+    "acm_auto": _suite_minimum_spanning_tree,
+    "disjoint_set": _suite_disjoint_set,
+    "chargement_networkx": _suite_to_networkx,
+    "lecture_fichier": _suite_read_file,
+}
+
+# Préparer le contexte d'une configuration : seules les représentations utiles aux opérations demandées sont construites
+def _suite_context(edges, operations, directory):
+    context = {"edges": edges}
+    if "disjoint_set" in operations:
+        context["pairs"] = list(zip(edges.sources.tolist(), edges.targets.tolist()))
+    if {"kruskal_mst", "prim_mst", "acm_auto", "lecture_fichier"} & set(operations):
+        context["graph"] = edges.to_networkx()
+    if "lecture_fichier" in operations:
+        from fichiers_graphe import write_graph_file
+        context["filename"] = os.path.join(directory, "graphe.bin")
+        write_graph_file(context["graph"], context["filename"])
+    return context
+
+# Balayer tailles, degrés moyens (densité) et distributions de poids ; une ligne de résultat par opération
+def run_suite(sizes=(1000, 10000), degrees=(4, 16), distributions=("uniforme", "entiers"), operations=None,
+              repeats=5, warmup=1, seed=42, progress_callback=None):
+    operations = list(operations or SUITE_OPERATIONS)
+    configurations = [(n, d, w) for n in sizes for d in degrees for w in distributions]
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for i, (num_vertices, average_degree, distribution) in enumerate(configurations):
+            edges = make_suite_graph(num_vertices, average_degree, distribution, seed)
+            context = _suite_context(edges, operations, directory)
+            for operation in operations:
+                stats, _ = measure(lambda: SUITE_OPERATIONS[operation](context), repeats, warmup)
+                result = {
+                    "operation": operation,
+                    "num_vertices": num_vertices,
+                    "average_degree": average_degree,
+                    "num_edges": len(edges),
+                    "density": 2 * len(edges) / (num_vertices * (num_vertices - 1)) if num_vertices > 1 else 0.0,
+                    "distribution": distribution,
+                    "seed": seed
+                }
+                result.update(stats)
+                results.append(result)
+            if progress_callback:
+                progress_callback(i + 1, len(configurations))
+    return results
+
+# Charger un fichier de résultats JSON (format de export_results_json) : mesures de la suite (run_suite) ou des
+# moteurs de la fenêtre de comparaison (run_benchmark)
+def load_results(filename):
+    with open(filename, encoding="utf-8") as f:
+        data = json.load(f)
+    results = data.get("results") if isinstance(data, dict) else None
+    if not isinstance(results, list) or not all(isinstance(r, dict) and ("operation" in r or "engine" in r)
+                                                for r in results):
+        raise ValueError(f"{filename} n'est pas un fichier de résultats du banc d'essai")
+    return results
+
+# Clé d'appariement de deux mesures : opération et configuration pour la suite, moteur et graphe pour les moteurs
+def _result_key(result):
+    if "operation" in result:
+        return ("suite", result["operation"], result["num_vertices"], result["average_degree"],
+                result["distribution"])
+    return ("engine", result["engine"], result["graph"], result.get("seed"), result["num_vertices"],
+            result["num_edges"])
+
+# Description courte d'une mesure pour l'affichage en ligne de commande
+def _result_label(result):
+    if "operation" in result:
+        return (f"{result['operation']:<22} n={result['num_vertices']:<8} d={result['average_degree']:<4} "
+                f"{result['distribution']:<14}")
+    return f"{result['engine']:<22} {result['graph']:<30} n={result['num_vertices']:<8} m={result['num_edges']:<8}"
+
+# Comparer deux séries de résultats : variation relative de la médiane, du minimum et du pic mémoire.
+# Une variation au-delà du seuil est une régression (plus lent/plus gourmand) ou une amélioration
+def compare_results(baseline, current, threshold=0.10):
+    baseline_by_key = {_result_key(result): result for result in baseline}
+    comparisons = []
+    for result in current:
+        reference = baseline_by_key.get(_result_key(result))
+        if reference is None:
+            continue
+        # Champs d'identification de la mesure (suite ou moteur), repris tels quels
+        comparison = {field: result[field] for field in ("operation", "average_degree", "distribution", "engine",
+                                                         "graph", "seed", "num_vertices", "num_edges")
+                      if field in result}
+        comparison.update({
+            "base_median_ms": reference["median_ms"],
+            "median_ms": result["median_ms"],
+            "status": "stable"
+        })
+        for metric in ("median_ms", "min_ms", "peak_memory_kb"):
+            before, after = reference[metric], result[metric]
+            comparison[f"{metric}_change"] = (after - before) / before if before > 0 else 0.0
+        # Le temps n'est jugé que si la médiane et le minimum varient dans le même sens (robuste au bruit de la machine)
+        time_change = comparison["median_ms_change"], comparison["min_ms_change"]
+        memory_change = comparison["peak_memory_kb_change"]
+        if min(time_change) > threshold or memory_change > threshold:
+            comparison["status"] = "regression"
+        elif max(time_change) < -threshold or memory_change < -threshold:
+            comparison["status"] = "amelioration"
+        comparisons.append(comparison)
+    return comparisons
+
+# Modules coûteux dont on vérifie qu'ils ne sont pas chargés au démarrage
+STARTUP_HEAVY_MODULES = ["matplotlib", "numpy", "scipy", "comparaison_graphes", "graphe_personnalise", "banc_essai"]
+
+# Script exécuté dans un processus neuf : temps d'import, puis temps jusqu'à l'affichage de la fenêtre principale
+STARTUP_SCRIPT = """
+import json, os, sys, time
+start = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv)
+import application_kruskal
+imported = time.perf_counter()
+window = application_kruskal.KruskalCytoscapeApp()
+window.show()
+app.processEvents()
+shown = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_window_ms": (shown - start) * 1000,
+    "heavy_modules": [name for name in %r if name in sys.modules]
+}))
+sys.stdout.flush()
+os._exit(0)
+"""
+
+# Mesurer le temps d'ouverture de l'application (processus neuf à chaque exécution, caches disque chauds)
+def measure_startup(runs=5):
+    directory = os.path.dirname(os.path.abspath(__file__))
+    script = STARTUP_SCRIPT % (STARTUP_HEAVY_MODULES,)
+    samples = []
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", script], cwd=directory, capture_output=True,
+                                text=True, check=True).stdout
+        sample = json.loads(output.strip().splitlines()[-1])
+        # Le temps du processus inclut le démarrage de l'interpréteur
+        sample["process_ms"] = (time.perf_counter() - start_time) * 1000
+        samples.append(sample)
+
+    result = {"runs": runs, "heavy_modules": samples[-1]["heavy_modules"]}
+    for key in ("import_ms", "first_window_ms", "process_ms"):
+        values = sorted(sample[key] for sample in samples)
+        result[f"min_{key}"] = values[0]
+        result[f"median_{key}"] = percentile(values, 0.5)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai de l'application Kruskal")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    startup_parser = subparsers.add_parser("demarrage", help="Temps jusqu'à l'affichage de la fenêtre principale")
+    startup_parser.add_argument("--runs", type=int, default=5)
+    startup_parser.add_argument("--json", help="Fichier JSON de sortie")
+
+    suite_parser = subparsers.add_parser("suite", help="Suite de mesures du noyau ACM (sauvegarde JSON)")
+    suite_parser.add_argument("--tailles", type=int, nargs="+", default=[1000, 10000])
+    suite_parser.add_argument("--degres", type=int, nargs="+", default=[4, 16])
+    suite_parser.add_argument("--distributions", nargs="+", choices=list(SUITE_WEIGHT_DISTRIBUTIONS),
+                              default=["uniforme", "entiers"])
+    suite_parser.add_argument("--operations", nargs="+", choices=list(SUITE_OPERATIONS))
+    suite_parser.add_argument("--repeats", type=int, default=5)
+    suite_parser.add_argument("--warmup", type=int, default=1)
+    suite_parser.add_argument("--seed", type=int, default=42)
+    suite_parser.add_argument("--json", help="Fichier JSON de sortie")
+
+    compare_parser = subparsers.add_parser("comparer", help="Signaler les régressions entre deux fichiers de résultats")
+    compare_parser.add_argument("base", help="Résultats de référence (JSON)")
+    compare_parser.add_argument("courant", help="Nouveaux résultats (JSON)")
+    compare_parser.add_argument("--seuil", type=float, default=0.10, help="Variation relative tolérée (0.10 = 10 %%)")
+
+    profile_parser = subparsers.add_parser("profil", help="Phases et compteurs de kruskal_mst, avec profileur facultatif")
+    profile_parser.add_argument("--taille", type=int, default=10000)
+    profile_parser.add_argument("--degre", type=int, default=8)
+    profile_parser.add_argument("--distribution", choices=list(SUITE_WEIGHT_DISTRIBUTIONS), default="uniforme")
+    profile_parser.add_argument("--seed", type=int, default=42)
+    profile_parser.add_argument("--profileur", choices=["cprofile", "pyinstrument"],
+                                help="Profiler aussi l'appel (pyinstrument s'il est installé, sinon cProfile)")
+    profile_parser.add_argument("--json", help="Fichier JSON de sortie (phases et compteurs)")
+
+    args = parser.parse_args()
+    if args.command == "profil":
+        from noyau_kruskal import KruskalInstrumentation, kruskal_mst, profile_call
+        graph = make_suite_graph(args.taille, args.degre, args.distribution, args.seed).to_networkx()
+        instrumentation = KruskalInstrumentation()
+        kruskal_mst(graph, instrumentation)
+        print(instrumentation.report())
+        if args.profileur:
+            _, report = profile_call(kruskal_mst, graph, profiler=args.profileur)
+            print(report)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump({"metadata": environment_metadata(), "profile": instrumentation.as_dict()}, f, indent=2,
+                          ensure_ascii=False)
+    elif args.command == "suite":
+        results = run_suite(args.tailles, args.degres, args.distributions, args.operations, args.repeats,
+                            args.warmup, args.seed,
+                            lambda done, total: print(f"Configuration {done}/{total}", file=sys.stderr))
+        for result in results:
+            print(f"{_result_label(result)} médiane {result['median_ms']:10.2f} ms  "
+                  f"p90 {result['p90_ms']:10.2f} ms  mémoire {result['peak_memory_kb']:10.0f} Ko")
+        if args.json:
+            export_results_json(results, args.json)
+    elif args.command == "comparer":
+        try:
+            comparisons = compare_results(load_results(args.base), load_results(args.courant), args.seuil)
+        except ValueError as error:
+            parser.error(str(error))
+        regressions = [c for c in comparisons if c["status"] == "regression"]
+        for c in comparisons:
+            print(f"{c['status']:<12} {_result_label(c)} {c['base_median_ms']:.2f} -> {c['median_ms']:.2f} ms "
+                  f"({c['median_ms_change']:+.0%}, mémoire {c['peak_memory_kb_change']:+.0%})")
+        print(f"{len(regressions)} régression(s) sur {len(comparisons)} mesures comparées")
+        # Code de sortie non nul pour l'intégration continue
+        sys.exit(1 if regressions else 0)
+    elif args.command == "demarrage":
+        result = measure_startup(args.runs)
+        print(f"Import de l'application : {result['median_import_ms']:.0f} ms (médiane sur {args.runs})")
+        print(f"Première fenêtre : {result['median_first_window_ms']:.0f} ms (min {result['min_first_window_ms']:.0f} ms)")
+        print(f"Processus complet : {result['median_process_ms']:.0f} ms")
+        print(f"Modules coûteux chargés : {', '.join(result['heavy_modules']) or 'aucun'}")
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump({"metadata": environment_metadata(), "startup": result}, f, indent=2, ensure_ascii=False)
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,15 @@ import sys
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QPushButton, QComboBox, QStatusBar, QSlider, QTextEdit, QFrame,
                             QRadioButton, QGroupBox, QSplitter, QDialog, QButtonGroup,
-                            QDialogButtonBox)
-from PyQt5.QtCore import Qt, QTimer
-import networkx as nx
+                            QDialogButtonBox, QCheckBox, QSpinBox, QProgressBar, QTabWidget,
+                            QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox,
+                            QGridLayout)
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
 import time
 
 # Importer notre code existant
-from noyau_kruskal import DisjointSet
+from noyau_kruskal import MST_ENGINES, run_engines_parallel, forest_analytics
+from banc_essai import run_benchmark, export_results_csv, export_results_json
 from visualisation_graphe import CytoscapeGraphView
 
 # Catégories de comparaison et leurs descriptions
@@ -37,6 +39,17 @@ COMPARISON_CATEGORIES = [
         "name": "Propriétés Structurelles Différentes", 
         "description": "Visualisez comment l'algorithme de Kruskal se comporte sur des graphes avec des caractéristiques topologiques fondamentalement différentes",
         "graph_pairs": [(6, 10)]  # Graphe en Grille (7) vs Graphe avec Arête Pont (11)
+    },
+    {
+        "name": "Moteurs ACM sur un Même Graphe",
+        "description": "Exécutez plusieurs moteurs d'ACM (Kruskal et les références networkx) sur le même graphe et comparez leurs temps de calcul mesurés",
+        "graph_pairs": [(7,)],  # Grand Graphe (8)
+        "engines": list(MST_ENGINES)
+    },
+    {
+        "name": "Trois Topologies",
+        "description": "Comparez simultanément l'algorithme de Kruskal sur une grille, un graphe biparti et un réseau invariant d'échelle",
+        "graph_pairs": [(6, 12, 13)]  # Grille (7), Biparti (13), Invariant d'Échelle (14)
     }
 ]
 
@@ -48,6 +61,7 @@ class GraphCompareDialog(QDialog):
         
         self.graph_names = graph_names
         self.selected_graphs = [-1, -1]  # Par défaut aucune sélection
+        self.selected_engines = ["Kruskal"]
         self.selected_category_index = 0
         self.selected_category_name = COMPARISON_CATEGORIES[0]["name"]  # Stocker le nom de la catégorie
         
@@ -143,16 +157,23 @@ class GraphCompareDialog(QDialog):
         """)
         graph_display_layout = QVBoxLayout(graph_display)
         
-        self.graph1_label = QLabel("Premier Graphe: ")
-        self.graph1_label.setStyleSheet("font-size: 11pt;")
-        self.graph2_label = QLabel("Deuxième Graphe: ")
-        self.graph2_label.setStyleSheet("font-size: 11pt;")
-        
-        graph_display_layout.addWidget(self.graph1_label)
-        graph_display_layout.addWidget(self.graph2_label)
+        # Une ligne par graphe : une catégorie peut en comparer un, deux ou plus
+        self.graphs_label = QLabel()
+        self.graphs_label.setStyleSheet("font-size: 11pt;")
+        graph_display_layout.addWidget(self.graphs_label)
         
         layout.addWidget(graph_display)
         
+        # Moteurs ACM à exécuter sur chaque graphe sélectionné
+        engine_group = QGroupBox("Moteurs ACM")
+        engine_layout = QHBoxLayout(engine_group)
+        self.engine_checkboxes = {}
+        for engine_name in MST_ENGINES:
+            checkbox = QCheckBox(engine_name)
+            engine_layout.addWidget(checkbox)
+            self.engine_checkboxes[engine_name] = checkbox
+        layout.addWidget(engine_group)
+        
         # Boutons
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
@@ -184,77 +205,200 @@ class GraphCompareDialog(QDialog):
             self.selected_graphs = list(graph_pair)
             
             # Mettre à jour les étiquettes
-            if 0 <= graph_pair[0] < len(self.graph_names) and 0 <= graph_pair[1] < len(self.graph_names):
-                self.graph1_label.setText(f"Premier Graphe: {self.graph_names[graph_pair[0]]}")
-                self.graph2_label.setText(f"Deuxième Graphe: {self.graph_names[graph_pair[1]]}")
+            if all(0 <= index < len(self.graph_names) for index in graph_pair):
+                lines = [f"Graphe {i + 1}: {self.graph_names[index]}" for i, index in enumerate(graph_pair)]
+                self.graphs_label.setText("<br>".join(lines))
+            
+            # Cocher les moteurs proposés par la catégorie (Kruskal seul par défaut)
+            category_engines = category.get("engines", ["Kruskal"])
+            for engine_name, checkbox in self.engine_checkboxes.items():
+                checkbox.setChecked(engine_name in category_engines)
         
     def accept(self):
         # Utiliser les graphes de la catégorie actuellement sélectionnée
         if 0 <= self.selected_category_index < len(COMPARISON_CATEGORIES):
             self.selected_graphs = list(COMPARISON_CATEGORIES[self.selected_category_index]["graph_pairs"][0])
         
+        self.selected_engines = [name for name, checkbox in self.engine_checkboxes.items() if checkbox.isChecked()]
+        
         super().accept()
         
     def get_selected_graphs(self):
         return self.selected_graphs
 
+    def get_selected_engines(self):
+        return self.selected_engines
+
     def get_selected_category(self):
         return self.selected_category_name
 
+class ComparisonTraceThread(QThread):
+    """Thread qui calcule les traces de tous les moteurs dans un pool de processus"""
+    traces_ready = pyqtSignal(list)  # Liste de (trace, temps d'exécution), dans l'ordre des entrées
+    
+    def __init__(self, jobs):
+        super().__init__()
+        self.jobs = jobs
+        
+    def run(self):
+        results = run_engines_parallel(self.jobs)
+        self.traces_ready.emit(results)
+
+
+# Nombre maximal de rafraîchissements par seconde du panneau d'analyses en direct
+INSIGHTS_MAX_RATE = 4
+
+# Texte fixe du panneau d'analyses, rendu une seule fois
+INSIGHTS_HEADER_HTML = (
+    "📚 L'ALGORITHME DE KRUSKAL<br>" + "=" * 30 + "<br>"
+    "L'algorithme de Kruskal construit un Arbre Couvrant Minimal (ACM) en<br>"
+    "traitant les arêtes par ordre croissant de poids et en évitant les cycles.<br>"
+    "C'est un algorithme glouton qui garantit une solution optimale.<br><br>"
+    "Observez l'évolution de l'algorithme et attendez la fin pour<br>"
+    "des explications détaillées sur cette comparaison spécifique."
+)
+
+
+class InsightsState:
+    """État structuré du panneau d'analyses en direct : un texte par champ affiché"""
+    
+    def __init__(self, entries, traces_ready):
+        self.fields = {"phase": "Rejeu des traces" if traces_ready else "Calcul des traces en cours..."}
+        for i, entry in enumerate(entries):
+            total = len(entry["trace"])
+            if not traces_ready:
+                progress = "-"
+            elif entry["index"] >= total:
+                progress = "100% - TERMINÉ ✅"
+            else:
+                progress = f"{entry['index'] / total * 100:.0f}% ({entry['index']}/{total})"
+            self.fields[("progress", i)] = progress
+            self.fields[("mst", i)] = f"{len(entry['mst_edges'])} arêtes"
+            self.fields[("time", i)] = f"{entry['execution_time'] * 1000:.2f} ms" if traces_ready else "-"
+    
+    def changed_fields(self, previous):
+        """Champs dont le texte diffère de l'état précédemment affiché"""
+        if previous is None:
+            return dict(self.fields)
+        return {key: text for key, text in self.fields.items() if previous.fields.get(key) != text}
+
+
+class BenchmarkThread(QThread):
+    """Thread qui chronomètre tous les moteurs ACM sur un graphe sans bloquer l'interface"""
+    progress_signal = pyqtSignal(int, int)  # Moteurs terminés, nombre total de moteurs
+    results_ready = pyqtSignal(list)
+    
+    def __init__(self, graph, graph_name, repeats, warmup):
+        super().__init__()
+        self.graph = graph
+        self.graph_name = graph_name
+        self.repeats = repeats
+        self.warmup = warmup
+        
+    def run(self):
+        results = run_benchmark(self.graph, self.graph_name, repeats=self.repeats, warmup=self.warmup,
+                                progress_callback=self.progress_signal.emit)
+        self.results_ready.emit(results)
+
+
+# Colonnes du tableau de résultats du banc d'essai : (en-tête, clé du résultat, format)
+BENCHMARK_COLUMNS = [
+    ("Moteur", "engine", "{}"),
+    ("Médiane (ms)", "median_ms", "{:.3f}"),
+    ("P90 (ms)", "p90_ms", "{:.3f}"),
+    ("P99 (ms)", "p99_ms", "{:.3f}"),
+    ("Min (ms)", "min_ms", "{:.3f}"),
+    ("Mémoire max (Ko)", "peak_memory_kb", "{:.1f}"),
+    ("Arêtes examinées", "edges_examined", "{}"),
+    ("Poids total", "total_weight", "{:.2f}")
+]
+
+
 class GraphComparisonWindow(QMainWindow):
-    def __init__(self, graph1, graph1_name, graph2, graph2_name, category_name, parent=None):
+    def __init__(self, entries, category_name, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Comparaison Interactive des Graphes")
         self.resize(1280, 900)
         
-        # Initialiser les variables
-        self.graph1 = graph1
-        self.graph2 = graph2
-        self.graph1_name = graph1_name
-        self.graph2_name = graph2_name
+        # Une entrée par panneau : (graphe, nom, moteur). Le même graphe peut apparaître sous plusieurs moteurs
+        self.entries = [
+            {"graph": graph, "name": name, "engine": engine, "trace": [], "execution_time": 0.0}
+            for graph, name, engine in entries
+        ]
+        for entry in self.entries:
+            self._reset_entry(entry)
+        
+        # Les deux premières entrées servent à l'analyse par catégorie
+        self.graph1 = self.entries[0]["graph"]
+        self.graph2 = self.entries[1]["graph"] if len(self.entries) > 1 else self.graph1
+        self.graph1_name = self.entries[0]["name"]
+        self.graph2_name = self.entries[1]["name"] if len(self.entries) > 1 else self.graph1_name
         self.category_name = category_name  # Stocker le nom de la catégorie
         
-        self.mst_edges1 = []
-        self.mst_edges2 = []
-        self.current_edge_index1 = 0
-        self.current_edge_index2 = 0
-        
-        # Trier les arêtes pour les deux graphes
-        self.sorted_edges1 = sorted([(u, v, graph1[u][v]['weight']) for u, v in graph1.edges()], 
-                                   key=lambda x: x[2])
-        self.sorted_edges2 = sorted([(u, v, graph2[u][v]['weight']) for u, v in graph2.edges()], 
-                                   key=lambda x: x[2])
+        self.traces_ready = False
+        self.trace_thread = None
+        self.benchmark_thread = None
+        self.benchmark_results = []
         
-        # Initialiser DisjointSet pour les deux graphes
-        self.ds1 = DisjointSet(list(graph1.nodes()))
-        self.ds2 = DisjointSet(list(graph2.nodes()))
+        # Rafraîchissement limité du panneau d'analyses : au plus insights_max_rate fois par seconde
+        self.insights_max_rate = INSIGHTS_MAX_RATE
+        self.insights_state = None
+        self.last_insights_update = 0.0
+        self.insights_timer = QTimer()
+        self.insights_timer.setSingleShot(True)
+        self.insights_timer.timeout.connect(self._render_insights)
         
         self.animation_speed = 1.0  # secondes entre les étapes
         self.animation_timer = QTimer()
         self.animation_timer.timeout.connect(self.step_animation)
         
-        # Statistiques
-        self.stats1 = {
-            "edges_considered": 0,
-            "edges_accepted": 0,
-            "edges_rejected": 0
-        }
-        self.stats2 = {
+        # Configurer l'interface
+        self.setup_ui()
+        
+        # Calculer toutes les traces en parallèle ; l'interface ne fait ensuite que les rejouer
+        self.compute_traces()
+        
+        # Initialiser les visualisations avec un court délai pour assurer le chargement de JS
+        QTimer.singleShot(500, self.init_visualizations)
+    
+    def _reset_entry(self, entry):
+        """Remettre à zéro l'état de rejeu d'une entrée (la trace calculée est conservée)"""
+        entry["index"] = 0
+        entry["mst_edges"] = []
+        entry["stats"] = {
             "edges_considered": 0,
             "edges_accepted": 0,
             "edges_rejected": 0
         }
+    
+    def compute_traces(self):
+        """Lancer le calcul des traces de tous les moteurs hors du thread de l'interface"""
+        self.start_btn.setEnabled(False)
+        self.step_btn.setEnabled(False)
+        self.status_bar.showMessage("Calcul des traces en parallèle...")
         
-        # Configurer l'interface
-        self.setup_ui()
+        jobs = [(entry["graph"], entry["engine"]) for entry in self.entries]
+        self.trace_thread = ComparisonTraceThread(jobs)
+        self.trace_thread.traces_ready.connect(self.on_traces_ready)
+        self.trace_thread.start()
+    
+    def on_traces_ready(self, results):
+        """Stocker les traces calculées et activer le rejeu"""
+        for entry, (trace, execution_time) in zip(self.entries, results):
+            entry["trace"] = trace
+            entry["execution_time"] = execution_time
+        self.traces_ready = True
         
-        # Initialiser les visualisations avec un court délai pour assurer le chargement de JS
-        QTimer.singleShot(500, self.init_visualizations)
+        self.start_btn.setEnabled(True)
+        self.step_btn.setEnabled(True)
+        timings = ", ".join(f"{entry['engine']}: {entry['execution_time'] * 1000:.2f} ms" for entry in self.entries)
+        self.status_bar.showMessage(f"Traces prêtes ({timings})")
+        self.update_insights(force_update=True)
     
     def init_visualizations(self):
         """Initialiser les visualisations avec un délai pour assurer un chargement correct"""
-        self.graph_view1.draw_graph(self.graph1, self.mst_edges1, None)
-        self.graph_view2.draw_graph(self.graph2, self.mst_edges2, None)
+        for entry in self.entries:
+            entry["view"].draw_graph(entry["graph"], entry["mst_edges"], None)
         
         # Initialiser le panneau d'analyses avec les informations de l'algorithme
         self.update_insights(force_update=True)
@@ -267,43 +411,27 @@ class GraphComparisonWindow(QMainWindow):
         # La disposition principale est une disposition verticale
         main_layout = QVBoxLayout(central_widget)
         
-        # Section supérieure - Affichages des graphes
+        # Section supérieure - Affichages des graphes, un panneau par entrée
         top_section = QSplitter(Qt.Horizontal)
         
-        # Panneau gauche pour le graphe
-        left_panel = QFrame()
-        left_panel.setFrameShape(QFrame.StyledPanel)
-        left_layout = QVBoxLayout(left_panel)
-        
-        # Titre pour le premier graphe
-        graph1_title = QLabel(f"<b>{self.graph1_name}</b>")
-        graph1_title.setAlignment(Qt.AlignCenter)
-        graph1_title.setStyleSheet("font-size: 14px; margin-bottom: 10px;")
-        left_layout.addWidget(graph1_title)
-        
-        # Visualisation du graphe 1
-        self.graph_view1 = CytoscapeGraphView()
-        left_layout.addWidget(self.graph_view1)
-        
-        # Panneau droit pour le graphe
-        right_panel = QFrame()
-        right_panel.setFrameShape(QFrame.StyledPanel)
-        right_layout = QVBoxLayout(right_panel)
-        
-        # Titre pour le second graphe
-        graph2_title = QLabel(f"<b>{self.graph2_name}</b>")
-        graph2_title.setAlignment(Qt.AlignCenter)
-        graph2_title.setStyleSheet("font-size: 14px; margin-bottom: 10px;")
-        right_layout.addWidget(graph2_title)
-        
-        # Visualisation du graphe 2
-        self.graph_view2 = CytoscapeGraphView()
-        right_layout.addWidget(self.graph_view2)
-        
-        # Ajouter les panneaux au séparateur
-        top_section.addWidget(left_panel)
-        top_section.addWidget(right_panel)
-        top_section.setSizes([640, 640])  # Tailles égales
+        for entry in self.entries:
+            panel = QFrame()
+            panel.setFrameShape(QFrame.StyledPanel)
+            panel_layout = QVBoxLayout(panel)
+            
+            # Titre du graphe avec le moteur utilisé
+            title = QLabel(f"<b>{entry['name']}</b><br>Moteur : {entry['engine']}")
+            title.setAlignment(Qt.AlignCenter)
+            title.setStyleSheet("font-size: 14px; margin-bottom: 10px;")
+            panel_layout.addWidget(title)
+            
+            # Visualisation du graphe
+            entry["view"] = CytoscapeGraphView()
+            panel_layout.addWidget(entry["view"])
+            
+            top_section.addWidget(panel)
+        
+        top_section.setSizes([1280 // len(self.entries)] * len(self.entries))  # Tailles égales
         
         # Ajouter la section supérieure à la disposition principale
         main_layout.addWidget(top_section, 2)  # 2/3 de l'espace
@@ -350,17 +478,91 @@ class GraphComparisonWindow(QMainWindow):
         
         # Progression et statistiques supprimées comme demandé
         
+        # Banc d'essai : chronométrer tous les moteurs ACM sur un des graphes comparés
+        benchmark_group = QGroupBox("Banc d'Essai des Moteurs")
+        benchmark_layout = QVBoxLayout(benchmark_group)
+        
+        self.benchmark_graph_combo = QComboBox()
+        self.benchmark_graphs = []
+        for entry in self.entries:
+            if all(entry["graph"] is not graph for graph, _ in self.benchmark_graphs):
+                self.benchmark_graphs.append((entry["graph"], entry["name"]))
+                self.benchmark_graph_combo.addItem(entry["name"])
+        benchmark_layout.addWidget(self.benchmark_graph_combo)
+        
+        runs_layout = QHBoxLayout()
+        runs_layout.addWidget(QLabel("Répétitions:"))
+        self.benchmark_repeats = QSpinBox()
+        self.benchmark_repeats.setRange(1, 10000)
+        self.benchmark_repeats.setValue(20)
+        runs_layout.addWidget(self.benchmark_repeats)
+        runs_layout.addWidget(QLabel("Échauffement:"))
+        self.benchmark_warmup = QSpinBox()
+        self.benchmark_warmup.setRange(0, 1000)
+        self.benchmark_warmup.setValue(3)
+        runs_layout.addWidget(self.benchmark_warmup)
+        benchmark_layout.addLayout(runs_layout)
+        
+        benchmark_buttons = QHBoxLayout()
+        self.benchmark_btn = QPushButton("Lancer le Banc d'Essai")
+        self.benchmark_btn.clicked.connect(self.run_benchmark)
+        self.export_csv_btn = QPushButton("Exporter CSV")
+        self.export_csv_btn.clicked.connect(lambda: self.export_benchmark("csv"))
+        self.export_json_btn = QPushButton("Exporter JSON")
+        self.export_json_btn.clicked.connect(lambda: self.export_benchmark("json"))
+        self.export_csv_btn.setEnabled(False)
+        self.export_json_btn.setEnabled(False)
+        benchmark_buttons.addWidget(self.benchmark_btn)
+        benchmark_buttons.addWidget(self.export_csv_btn)
+        benchmark_buttons.addWidget(self.export_json_btn)
+        benchmark_layout.addLayout(benchmark_buttons)
+        
+        self.benchmark_progress = QProgressBar()
+        self.benchmark_progress.hide()
+        benchmark_layout.addWidget(self.benchmark_progress)
+        
+        controls_layout.addWidget(benchmark_group)
+        
         # Côté droit - Analyse
         analysis_group = QGroupBox("Analyse Comparative")
         analysis_layout = QVBoxLayout(analysis_group)
-        
-        # Zone de texte pour les analyses
+        self.analysis_tabs = QTabWidget()
+        analysis_layout.addWidget(self.analysis_tabs)
+        
+        analysis_tab = QWidget()
+        analysis_tab_layout = QVBoxLayout(analysis_tab)
+        self.analysis_tabs.addTab(analysis_tab, "Analyse")
+        
+        # Panneau en direct : une étiquette par champ, mise à jour uniquement quand son texte change
+        live_panel = QFrame()
+        live_layout = QGridLayout(live_panel)
+        self.insights_labels = {"phase": QLabel()}
+        self.insights_labels["phase"].setStyleSheet("font-weight: bold;")
+        live_layout.addWidget(self.insights_labels["phase"], 0, 0, 1, 4)
+        for column, header in enumerate(["Graphe", "Progression", "Arêtes ACM", "Temps de calcul"]):
+            header_label = QLabel(f"<b>{header}</b>")
+            live_layout.addWidget(header_label, 1, column)
+        for i, entry in enumerate(self.entries):
+            live_layout.addWidget(QLabel(f"Graphe {i + 1} ({entry['engine']})"), i + 2, 0)
+            for column, field in enumerate(["progress", "mst", "time"], start=1):
+                label = QLabel()
+                self.insights_labels[(field, i)] = label
+                live_layout.addWidget(label, i + 2, column)
+        analysis_tab_layout.addWidget(live_panel)
+        
+        # Zone de texte pour les analyses : en-tête fixe puis rapport final
         self.insights_text = QTextEdit()
         self.insights_text.setReadOnly(True)
         self.insights_text.setStyleSheet("font-size: 14px; line-height: 1.4;")
-        analysis_layout.addWidget(self.insights_text)
+        self.insights_text.setHtml(INSIGHTS_HEADER_HTML)
+        analysis_tab_layout.addWidget(self.insights_text)
         
-        # Le texte d'analyse par défaut n'est pas défini ici - sera défini dans init_visualizations
+        # Tableau des résultats du banc d'essai
+        self.benchmark_table = QTableWidget(0, len(BENCHMARK_COLUMNS))
+        self.benchmark_table.setHorizontalHeaderLabels([header for header, _, _ in BENCHMARK_COLUMNS])
+        self.benchmark_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.benchmark_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.analysis_tabs.addTab(self.benchmark_table, "Banc d'Essai")
         
         # Ajouter les deux côtés à la disposition inférieure
         bottom_layout.addWidget(controls_group, 1)
@@ -397,6 +599,9 @@ class GraphComparisonWindow(QMainWindow):
         
     def start_animation(self):
         """Démarrer l'animation"""
+        if not self.traces_ready:
+            return
+        
         # Désactiver les boutons pendant l'animation
         self.start_btn.setEnabled(False)
         self.step_btn.setEnabled(False)
@@ -409,80 +614,49 @@ class GraphComparisonWindow(QMainWindow):
         self.animation_timer.start()
         
     def step_animation(self):
-        """Avancer d'une étape dans l'algorithme sur les deux graphes"""
-        # Variables pour suivre si l'un des graphes a terminé pendant ce tour
-        graph1_just_finished = False
-        graph2_just_finished = False
-        
-        # Traitement du graphe 1
-        if self.current_edge_index1 < len(self.sorted_edges1):
-            # Obtenir l'arête courante
-            u, v, w = self.sorted_edges1[self.current_edge_index1]
-            current_edge = (u, v, w)
-            
-            # Mettre à jour les statistiques
-            self.stats1["edges_considered"] += 1
-            
-            # Vérifier si l'ajout de cette arête crée un cycle
-            if self.ds1.find(u) != self.ds1.find(v):
-                # Pas de cycle - ajouter à l'ACM
-                self.ds1.union(u, v)
-                self.mst_edges1.append(current_edge)
-                self.stats1["edges_accepted"] += 1
-            else:
-                # Un cycle serait formé - rejeter
-                self.stats1["edges_rejected"] += 1
-            
-            # Mettre à jour la visualisation
-            self.graph_view1.draw_graph(self.graph1, self.mst_edges1, current_edge)
+        """Rejouer une étape de la trace précalculée de chaque entrée"""
+        if not self.traces_ready:
+            return
+        
+        # Suivre si l'une des entrées a terminé pendant ce tour
+        any_just_finished = False
+        
+        for entry in self.entries:
+            trace = entry["trace"]
+            if entry["index"] >= len(trace):
+                continue
             
-            # Passer à l'arête suivante
-            self.current_edge_index1 += 1
-            
-            # Vérifier si on vient juste de terminer le premier graphe
-            if self.current_edge_index1 >= len(self.sorted_edges1):
-                graph1_just_finished = True
-                # Mettre à jour l'état final du graphe 1
-                self.graph_view1.draw_graph(self.graph1, self.mst_edges1, None)
-        
-        # Traitement du graphe 2
-        if self.current_edge_index2 < len(self.sorted_edges2):
-            # Obtenir l'arête courante
-            u, v, w = self.sorted_edges2[self.current_edge_index2]
+            # Obtenir l'arête courante et la décision déjà calculée par le moteur
+            u, v, w, accepted = trace[entry["index"]]
             current_edge = (u, v, w)
             
             # Mettre à jour les statistiques
-            self.stats2["edges_considered"] += 1
-            
-            # Vérifier si l'ajout de cette arête crée un cycle
-            if self.ds2.find(u) != self.ds2.find(v):
-                # Pas de cycle - ajouter à l'ACM
-                self.ds2.union(u, v)
-                self.mst_edges2.append(current_edge)
-                self.stats2["edges_accepted"] += 1
+            entry["stats"]["edges_considered"] += 1
+            if accepted:
+                entry["mst_edges"].append(current_edge)
+                entry["stats"]["edges_accepted"] += 1
             else:
-                # Un cycle serait formé - rejeter
-                self.stats2["edges_rejected"] += 1
-            
-            # Mettre à jour la visualisation
-            self.graph_view2.draw_graph(self.graph2, self.mst_edges2, current_edge)
+                entry["stats"]["edges_rejected"] += 1
             
             # Passer à l'arête suivante
-            self.current_edge_index2 += 1
+            entry["index"] += 1
             
-            # Vérifier si on vient juste de terminer le deuxième graphe
-            if self.current_edge_index2 >= len(self.sorted_edges2):
-                graph2_just_finished = True
-                # Mettre à jour l'état final du graphe 2
-                self.graph_view2.draw_graph(self.graph2, self.mst_edges2, None)
+            if entry["index"] >= len(trace):
+                # Entrée terminée : afficher l'état final sans arête courante
+                any_just_finished = True
+                entry["view"].draw_graph(entry["graph"], entry["mst_edges"], None)
+            else:
+                entry["view"].draw_graph(entry["graph"], entry["mst_edges"], current_edge)
         
-        # Mettre à jour l'affichage des statistiques pour les deux graphes
+        # Mettre à jour l'affichage des statistiques
         self.update_stats_display()
         
-        # Vérifier si les deux algorithmes sont terminés
-        if (self.current_edge_index1 >= len(self.sorted_edges1) and 
-            self.current_edge_index2 >= len(self.sorted_edges2)):
-            # Arrêter le timer si les deux sont terminés
+        # Mise à jour des insights, limitée en fréquence quelle que soit la vitesse d'animation
+        self.update_insights(force_update=any_just_finished)
+        
+        # Vérifier si tous les rejeux sont terminés
+        if all(entry["index"] >= len(entry["trace"]) for entry in self.entries):
+            # Arrêter le timer si tout est terminé
             self.animation_timer.stop()
             self.start_btn.setEnabled(False)
             self.step_btn.setEnabled(False)
@@ -490,15 +664,6 @@ class GraphComparisonWindow(QMainWindow):
             
             # Afficher la comparaison finale
             self.show_final_comparison()
-        
-        # Mise à jour des insights dans différents scénarios
-        if graph1_just_finished or graph2_just_finished:
-            # Un des graphes vient juste de terminer, forcer une mise à jour des insights
-            self.update_insights(force_update=True)
-        elif (self.current_edge_index1 % 5 == 0 or 
-            self.current_edge_index2 % 5 == 0):
-            # Mise à jour périodique pendant l'exécution
-            self.update_insights()
     
     def stop_animation(self):
         """Arrêter l'animation"""
@@ -516,124 +681,131 @@ class GraphComparisonWindow(QMainWindow):
         if self.animation_timer.isActive():
             self.animation_timer.stop()
         
-        # Réinitialiser les variables pour le graphe 1
-        self.mst_edges1 = []
-        self.current_edge_index1 = 0
-        self.ds1 = DisjointSet(list(self.graph1.nodes()))
-        self.stats1 = {
-            "edges_considered": 0,
-            "edges_accepted": 0,
-            "edges_rejected": 0
-        }
-        
-        # Réinitialiser les variables pour le graphe 2
-        self.mst_edges2 = []
-        self.current_edge_index2 = 0
-        self.ds2 = DisjointSet(list(self.graph2.nodes()))
-        self.stats2 = {
-            "edges_considered": 0,
-            "edges_accepted": 0,
-            "edges_rejected": 0
-        }
-        
-        # Mettre à jour les visualisations
-        self.graph_view1.draw_graph(self.graph1)
-        self.graph_view2.draw_graph(self.graph2)
+        # Réinitialiser l'état de rejeu ; les traces restent valides
+        for entry in self.entries:
+            self._reset_entry(entry)
+            entry["view"].draw_graph(entry["graph"])
         
         # Mettre à jour l'affichage des statistiques
         self.update_stats_display()
         
         # Réinitialiser le texte des insights
-        self.insights_text.setHtml("<h3>Exécutez l'algorithme pour voir l'analyse détaillée</h3>")
+        self.insights_text.setHtml(INSIGHTS_HEADER_HTML)
+        self.update_insights(force_update=True)
         
-        # Activer les boutons démarrer/étape
-        self.start_btn.setEnabled(True)
-        self.step_btn.setEnabled(True)
+        # Activer les boutons démarrer/étape si les traces sont prêtes
+        self.start_btn.setEnabled(self.traces_ready)
+        self.step_btn.setEnabled(self.traces_ready)
         self.stop_btn.setEnabled(False)
     
+    def run_benchmark(self):
+        """Chronométrer tous les moteurs ACM sur le graphe choisi dans un thread séparé"""
+        if self.benchmark_thread and self.benchmark_thread.isRunning():
+            return
+        
+        graph, graph_name = self.benchmark_graphs[self.benchmark_graph_combo.currentIndex()]
+        
+        self.benchmark_btn.setEnabled(False)
+        self.benchmark_progress.setMaximum(len(MST_ENGINES))
+        self.benchmark_progress.setValue(0)
+        self.benchmark_progress.show()
+        self.status_bar.showMessage(f"Banc d'essai en cours sur '{graph_name}'...")
+        
+        self.benchmark_thread = BenchmarkThread(graph, graph_name, self.benchmark_repeats.value(),
+                                                self.benchmark_warmup.value())
+        self.benchmark_thread.progress_signal.connect(lambda done, _: self.benchmark_progress.setValue(done))
+        self.benchmark_thread.results_ready.connect(self.on_benchmark_finished)
+        self.benchmark_thread.start()
+    
+    def on_benchmark_finished(self, results):
+        """Afficher les résultats du banc d'essai dans le tableau"""
+        self.benchmark_results = results
+        self.benchmark_progress.hide()
+        self.benchmark_btn.setEnabled(True)
+        self.export_csv_btn.setEnabled(True)
+        self.export_json_btn.setEnabled(True)
+        
+        self.benchmark_table.setRowCount(len(results))
+        for row, result in enumerate(results):
+            for column, (_, key, fmt) in enumerate(BENCHMARK_COLUMNS):
+                # Valeur non fournie par le moteur (arêtes examinées des moteurs networkx et Borůvka)
+                text = "N/A" if result[key] is None else fmt.format(result[key])
+                self.benchmark_table.setItem(row, column, QTableWidgetItem(text))
+        
+        self.analysis_tabs.setCurrentWidget(self.benchmark_table)
+        fastest = min(results, key=lambda result: result["median_ms"])
+        self.status_bar.showMessage(f"Banc d'essai terminé - moteur le plus rapide : {fastest['engine']} ({fastest['median_ms']:.3f} ms en médiane)")
+    
+    def export_benchmark(self, file_format):
+        """Exporter les résultats du banc d'essai en CSV ou JSON"""
+        if not self.benchmark_results:
+            return
+        
+        file_filter = "CSV (*.csv)" if file_format == "csv" else "JSON (*.json)"
+        filename, _ = QFileDialog.getSaveFileName(self, "Exporter les Résultats", f"banc_essai.{file_format}", file_filter)
+        if not filename:
+            return
+        
+        try:
+            if file_format == "csv":
+                export_results_csv(self.benchmark_results, filename)
+            else:
+                export_results_json(self.benchmark_results, filename)
+        except OSError as error:
+            QMessageBox.warning(self, "Erreur d'Export", f"Impossible d'écrire le fichier : {error}")
+            return
+        self.status_bar.showMessage(f"Résultats exportés dans {filename}")
+    
     def update_insights(self, force_update=False):
-        """Générer des analyses en temps réel pendant l'exécution de l'algorithme"""
-        insights = []
-        
-        # Obtenir la progression de l'algorithme
-        progress1 = self.current_edge_index1 / len(self.sorted_edges1) if self.sorted_edges1 else 0
-        progress2 = self.current_edge_index2 / len(self.sorted_edges2) if self.sorted_edges2 else 0
-        
-        # Ajouter l'en-tête sur l'algorithme de Kruskal - TOUJOURS AFFICHER
-        insights.append("📚 L'ALGORITHME DE KRUSKAL")
-        insights.append("=" * 30)
-        insights.append("L'algorithme de Kruskal construit un Arbre Couvrant Minimal (ACM) en")
-        insights.append("traitant les arêtes par ordre croissant de poids et en évitant les cycles.")
-        insights.append("C'est un algorithme glouton qui garantit une solution optimale.")
-        insights.append("\nObservez l'évolution de l'algorithme et attendez la fin pour")
-        insights.append("des explications détaillées sur cette comparaison spécifique.")
-        
-        # Toujours ajouter les informations de progression
-        insights.append("\n• Progression:")
-        
-        if self.current_edge_index1 >= len(self.sorted_edges1):
-            insights.append(f"  Graphe 1: 100% - TERMINÉ ✅")
-        else:
-            insights.append(f"  Graphe 1: {progress1*100:.0f}% ({self.current_edge_index1}/{len(self.sorted_edges1)})")
-            
-        if self.current_edge_index2 >= len(self.sorted_edges2):
-            insights.append(f"  Graphe 2: 100% - TERMINÉ ✅")
-        else:
-            insights.append(f"  Graphe 2: {progress2*100:.0f}% ({self.current_edge_index2}/{len(self.sorted_edges2)})")
-        
-        # Toujours afficher la section des arêtes ACM
-        insights.append("\n• Arêtes ACM trouvées:")
-        insights.append(f"  Graphe 1: {len(self.mst_edges1)} arêtes")
-        insights.append(f"  Graphe 2: {len(self.mst_edges2)} arêtes")
-        
-        # Mettre à jour le texte des insights avec un espacement approprié
-        # Utiliser setHtml pour préserver la mise en forme
-        html_content = "<br>".join(insights).replace("\n", "<br>")
-        self.insights_text.setHtml(html_content)
+        """Demander un rafraîchissement du panneau d'analyses, au plus insights_max_rate fois par seconde"""
+        min_interval = 1.0 / self.insights_max_rate
+        elapsed = time.perf_counter() - self.last_insights_update
+        if force_update or elapsed >= min_interval:
+            self.insights_timer.stop()
+            self._render_insights()
+        elif not self.insights_timer.isActive():
+            # Différer pour que le dernier état soit toujours affiché
+            self.insights_timer.start(int((min_interval - elapsed) * 1000) + 1)
+    
+    def _render_insights(self):
+        """Écrire dans les étiquettes uniquement les champs modifiés depuis le dernier rendu"""
+        state = InsightsState(self.entries, self.traces_ready)
+        for key, text in state.changed_fields(self.insights_state).items():
+            self.insights_labels[key].setText(text)
+        self.insights_state = state
+        self.last_insights_update = time.perf_counter()
     
     def _count_current_components(self, graph, mst_edges):
         """Méthode auxiliaire pour compter les composantes connexes dans l'état actuel de l'ACM"""
-        # Créer un graphe avec uniquement les arêtes de l'ACM
-        g = nx.Graph()
-        g.add_nodes_from(graph.nodes())
-        g.add_edges_from([(u, v) for u, v, _ in mst_edges])
+        # Chaque arête acceptée par l'union-find fusionne exactement deux composantes
+        return graph.number_of_nodes() - len(mst_edges)
     
     def show_final_comparison(self):
         """Afficher la comparaison finale et les insights éducatifs"""
-        print("Fonction show_final_comparison() appelée") # Message de débogage
-        
-        # Forçons un message pour indiquer que les insights sont en cours de chargement
-        self.insights_text.setHtml("<h3 style='color:blue'>Préparation de l'analyse finale... veuillez patienter</h3>")
-        
-        # Petit délai pour s'assurer que l'interface se met à jour
-        QTimer.singleShot(100, self._do_show_final_comparison)
-        
-    def _do_show_final_comparison(self):
-        """Implémentation réelle de l'affichage des insights finaux après un court délai"""
-        print("Chargement des insights finaux") # Message de débogage
         final_insights = []
         
         # Effacer la ligne pointillée en redessinant sans current_edge
-        self.graph_view1.draw_graph(self.graph1, self.mst_edges1, None)
-        self.graph_view2.draw_graph(self.graph2, self.mst_edges2, None)
+        for entry in self.entries:
+            entry["view"].draw_graph(entry["graph"], entry["mst_edges"], None)
+        
+        # L'analyse par catégorie porte sur les deux premières entrées
+        first = self.entries[0]
+        second = self.entries[1] if len(self.entries) > 1 else first
+        mst_edges1, mst_edges2 = first["mst_edges"], second["mst_edges"]
+        stats1, stats2 = first["stats"], second["stats"]
         
         # Comparer les propriétés des ACM
-        if self.mst_edges1 and self.mst_edges2:
-            # Calculer les statistiques clés
-            mst_weight1 = sum(w for _, _, w in self.mst_edges1)
-            mst_weight2 = sum(w for _, _, w in self.mst_edges2)
-            
-            # Créer des objets graphe à partir des ACM pour analyser leurs propriétés
-            G1 = nx.Graph()
-            G1.add_nodes_from(self.graph1.nodes())
-            G1.add_edges_from([(u, v) for u, v, _ in self.mst_edges1])
-            
-            G2 = nx.Graph()
-            G2.add_nodes_from(self.graph2.nodes())
-            G2.add_edges_from([(u, v) for u, v, _ in self.mst_edges2])
+        if all(entry["mst_edges"] for entry in self.entries):
+            # Analyse de chaque forêt en une passe union-find sur les arêtes retenues
+            analytics = [forest_analytics(list(entry["graph"].nodes()), entry["mst_edges"]) for entry in self.entries]
+            analytics1 = analytics[0]
+            analytics2 = analytics[1] if len(analytics) > 1 else analytics1
             
-            comp1 = nx.number_connected_components(G1)
-            comp2 = nx.number_connected_components(G2)
+            # Calculer les statistiques clés
+            mst_weight1 = analytics1["total_weight"]
+            mst_weight2 = analytics2["total_weight"]
+            comp1 = analytics1["num_components"]
+            comp2 = analytics2["num_components"]
             
             # Ajouter le titre et le résumé
             final_insights.append(f"📊 Comparaison des ACM: {self.graph1_name} vs {self.graph2_name}")
@@ -651,8 +823,8 @@ class GraphComparisonWindow(QMainWindow):
                 disconnected_idx = 1 if connected_graph == "Graphe 1" else 0
                 
                 # Calculer les compteurs pour chaque graphe
-                conn_edges = len(self.mst_edges1 if connected_idx == 0 else self.mst_edges2)
-                disconn_edges = len(self.mst_edges2 if connected_idx == 0 else self.mst_edges1)
+                conn_edges = len(mst_edges1 if connected_idx == 0 else mst_edges2)
+                disconn_edges = len(mst_edges2 if connected_idx == 0 else mst_edges1)
                 disconn_comp = comp2 if disconnected_graph == "Graphe 2" else comp1
                 
                 # Ajouter des observations claires
@@ -683,8 +855,8 @@ class GraphComparisonWindow(QMainWindow):
                 sparse_idx = 1 if dense_graph == "Graphe 1" else 0
                 
                 # Calculer les statistiques
-                dense_stats = self.stats1 if dense_idx == 0 else self.stats2
-                sparse_stats = self.stats2 if dense_idx == 0 else self.stats1
+                dense_stats = stats1 if dense_idx == 0 else stats2
+                sparse_stats = stats2 if dense_idx == 0 else stats1
                 dense_reject_rate = dense_stats["edges_rejected"] / dense_stats["edges_considered"] * 100
                 sparse_reject_rate = sparse_stats["edges_rejected"] / sparse_stats["edges_considered"] * 100
                 
@@ -727,8 +899,8 @@ class GraphComparisonWindow(QMainWindow):
                 final_insights.append("----------------------------------------------------")
                 
                 # Calculer les statistiques de poids
-                weights1 = [w for _, _, w in self.sorted_edges1]
-                weights2 = [w for _, _, w in self.sorted_edges2]
+                weights1 = [data['weight'] for _, _, data in self.graph1.edges(data=True)]
+                weights2 = [data['weight'] for _, _, data in self.graph2.edges(data=True)]
                 avg1 = sum(weights1) / len(weights1) if weights1 else 0
                 avg2 = sum(weights2) / len(weights2) if weights2 else 0
                 
@@ -756,8 +928,8 @@ class GraphComparisonWindow(QMainWindow):
                 avg_deg2 = 2 * self.graph2.number_of_edges() / self.graph2.number_of_nodes()
                 
                 # Ajouter des observations claires
-                final_insights.append(f"• Graphe 1: Degré moyen {avg_deg1:.1f}, crée un ACM avec {len(self.mst_edges1)} arêtes")
-                final_insights.append(f"• Graphe 2: Degré moyen {avg_deg2:.1f}, crée un ACM avec {len(self.mst_edges2)} arêtes")
+                final_insights.append(f"• Graphe 1: Degré moyen {avg_deg1:.1f}, crée un ACM avec {len(mst_edges1)} arêtes")
+                final_insights.append(f"• Graphe 2: Degré moyen {avg_deg2:.1f}, crée un ACM avec {len(mst_edges2)} arêtes")
                 
                 # Ajouter des explications éducatives
                 final_insights.append("\nPoints Clés:")
@@ -770,33 +942,70 @@ class GraphComparisonWindow(QMainWindow):
                 final_insights.append("4. D'une perspective théorique, l'ACM représente la façon la plus économique")
                 final_insights.append("   de connecter tous les sommets avec le poids total minimum possible.")
             
+            elif self.category_name == "Moteurs ACM sur un Même Graphe":
+                final_insights.append("\n🔍 ANALYSE: Moteurs ACM sur un Même Graphe")
+                final_insights.append("------------------------------------------------")
+                
+                # Tous les moteurs doivent trouver le même poids total
+                weights = {entry["engine"]: sum(w for _, _, w in entry["mst_edges"]) for entry in self.entries}
+                fastest = min(self.entries, key=lambda entry: entry["execution_time"])
+                same_weight = len({round(weight, 9) for weight in weights.values()}) == 1
+                
+                # Ajouter des observations claires
+                for engine_name, weight in weights.items():
+                    final_insights.append(f"• {engine_name}: poids total {weight:.2f}")
+                final_insights.append(f"• Moteur le plus rapide: {fastest['engine']} ({fastest['execution_time'] * 1000:.3f} ms)")
+                
+                # Ajouter des explications éducatives
+                final_insights.append("\nPoints Clés:")
+                if same_weight:
+                    final_insights.append("1. Tous les moteurs trouvent un arbre de même poids total, même si les arêtes")
+                    final_insights.append("   choisies peuvent différer lorsque plusieurs poids sont égaux.")
+                else:
+                    final_insights.append("1. ⚠️ Les moteurs ne trouvent pas le même poids total : l'un d'eux est incorrect.")
+                final_insights.append("2. Les références networkx ne montrent que les arêtes retenues : leur trace")
+                final_insights.append("   ne contient aucun rejet, contrairement à celle de Kruskal.")
+                final_insights.append("3. Les temps sont mesurés dans des processus séparés, hors de l'animation.")
+            
             # Ajouter la comparaison statistique
             final_insights.append("\n📈 Comparaison Statistique")
             final_insights.append("-------------------------")
             
             # Comparaison des propriétés de base
-            final_insights.append(f"• Graphe 1: {self.graph1.number_of_nodes()} sommets, {self.graph1.number_of_edges()} arêtes")
-            final_insights.append(f"• Graphe 2: {self.graph2.number_of_nodes()} sommets, {self.graph2.number_of_edges()} arêtes")
+            for i, entry in enumerate(self.entries):
+                final_insights.append(f"• Graphe {i + 1}: {entry['graph'].number_of_nodes()} sommets, {entry['graph'].number_of_edges()} arêtes")
             
             # Comparaison des résultats des ACM
             final_insights.append(f"\nRésultats des ACM:")
-            final_insights.append(f"• Graphe 1: {len(self.mst_edges1)} arêtes dans l'ACM, poids total {mst_weight1:.2f}")
-            final_insights.append(f"• Graphe 2: {len(self.mst_edges2)} arêtes dans l'ACM, poids total {mst_weight2:.2f}")
+            for i, entry in enumerate(self.entries):
+                mst_weight = sum(w for _, _, w in entry["mst_edges"])
+                final_insights.append(f"• Graphe {i + 1}: {len(entry['mst_edges'])} arêtes dans l'ACM, poids total {mst_weight:.2f}")
             
             # Comparaison des performances
-            accept_rate1 = self.stats1["edges_accepted"] / self.stats1["edges_considered"] * 100
-            accept_rate2 = self.stats2["edges_accepted"] / self.stats2["edges_considered"] * 100
             final_insights.append(f"\nPerformance de l'Algorithme:")
-            final_insights.append(f"• Graphe 1: {accept_rate1:.1f}% taux d'acceptation d'arêtes")
-            final_insights.append(f"• Graphe 2: {accept_rate2:.1f}% taux d'acceptation d'arêtes")
+            for i, entry in enumerate(self.entries):
+                accept_rate = entry["stats"]["edges_accepted"] / entry["stats"]["edges_considered"] * 100
+                final_insights.append(f"• Graphe {i + 1}: {accept_rate:.1f}% taux d'acceptation d'arêtes")
+            
+            # Temps de calcul réels mesurés dans les processus de travail
+            final_insights.append(f"\nTemps de Calcul par Moteur:")
+            for i, entry in enumerate(self.entries):
+                final_insights.append(f"• Graphe {i + 1} ({entry['engine']}): {entry['execution_time'] * 1000:.3f} ms")
             
             # Information sur la connectivité
-            if comp1 > 1 or comp2 > 1:
+            if any(result["num_components"] > 1 for result in analytics):
                 final_insights.append(f"\nConnectivité:")
-                if comp1 > 1:
-                    final_insights.append(f"• Graphe 1 a produit une forêt avec {comp1} arbres")
-                if comp2 > 1:
-                    final_insights.append(f"• Graphe 2 a produit une forêt avec {comp2} arbres")
+                for i, result in enumerate(analytics):
+                    if result["num_components"] > 1:
+                        weights = ", ".join(f"{component['weight']:.2f}" for component in result["components"])
+                        final_insights.append(f"• Graphe {i + 1} a produit une forêt avec {result['num_components']} arbres (poids: {weights})")
+            
+            # Forme des arbres obtenus
+            final_insights.append(f"\nForme des Arbres:")
+            for i, result in enumerate(analytics):
+                degrees = ", ".join(f"{degree}: {n}" for degree, n in result["degree_distribution"].items())
+                final_insights.append(f"• Graphe {i + 1}: profondeur {result['depth']}, diamètre {result['diameter']}, degré max {result['max_degree']}")
+                final_insights.append(f"  Distribution des degrés (degré: sommets): {degrees}")
             
             # Ajouter la conclusion avec les principes fondamentaux démontrés
             final_insights.append("\n📝 PRINCIPES FONDAMENTAUX")
@@ -845,7 +1054,7 @@ class GraphComparisonWindow(QMainWindow):
             # Trouver la catégorie que nous montrons
             found_category = False
             for category_name, title, insights_list in graph_categories:
-                if category_name in self.graph1_name + self.graph2_name:
+                if category_name in "".join(entry["name"] for entry in self.entries):
                     final_insights.append(f"\n📊 {title}")
                     final_insights.append("=" * 25)
                     for insight in insights_list:
@@ -855,10 +1064,19 @@ class GraphComparisonWindow(QMainWindow):
             
             # Si aucune catégorie n'est trouvée, ajouter un message pour le débogage
             if not found_category:
-                print(f"Aucune catégorie trouvée pour: {self.graph1_name} + {self.graph2_name}")
+                print(f"Aucune catégorie trouvée pour: {' + '.join(entry['name'] for entry in self.entries)}")
                 
         # Mettre à jour le texte des insights avec l'analyse finale
         # Utiliser setHtml pour préserver la mise en forme avec un style amélioré
         html_content = "<div style='font-size: 14px; line-height: 1.5;'>" + "<br>".join(final_insights).replace("\n", "<br>") + "</div>"
         self.insights_text.setHtml(html_content)
-        print(f"Insights finaux affichés avec {len(final_insights)} lignes")
\ No newline at end of file
+        print(f"Insights finaux affichés avec {len(final_insights)} lignes")
+
+    def closeEvent(self, event):
+        # Attendre la fin des calculs en cours avant de détruire les threads
+        self.animation_timer.stop()
+        self.insights_timer.stop()
+        for thread in (self.trace_thread, self.benchmark_thread):
+            if thread and thread.isRunning():
+                thread.wait()
+        event.accept()
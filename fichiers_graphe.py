@@ -0,0 +1,482 @@
+import csv
+import io
+import json
+import os
+import re
+import struct
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
+
+import networkx as nx
+import numpy as np
+
+# Formats pris en charge : nom affiché -> (extensions, filtre de la boîte de dialogue)
+GRAPH_FILE_FORMATS = {
+    "edgelist": ("Liste d'arêtes", (".txt", ".edges", ".edgelist")),
+    "csv": ("CSV", (".csv",)),
+    "graphml": ("GraphML", (".graphml", ".xml")),
+    "binary": ("Binaire Kruskal", (".kgb",))
+}
+
+# Nombre de lignes (ou d'arêtes) traitées entre deux mises à jour de la progression
+DEFAULT_CHUNK_SIZE = 50000
+
+# Noms de colonnes reconnus automatiquement dans l'en-tête d'un CSV
+CSV_COLUMN_ALIASES = {
+    "source": ("source", "src", "from", "u", "node1", "origine", "depart", "départ"),
+    "target": ("target", "dst", "to", "v", "node2", "destination", "cible", "arrivee", "arrivée"),
+    "weight": ("weight", "w", "cost", "poids", "cout", "coût", "distance", "length")
+}
+
+# Format binaire : en-tête, identifiants des sommets en JSON, puis un enregistrement de 16 octets par arête
+BINARY_MAGIC = b"KGB1"
+BINARY_HEADER = struct.Struct("<4sQQQ")  # magique, sommets, arêtes, taille du JSON des identifiants
+BINARY_EDGE_DTYPE = np.dtype([("source", "<u4"), ("target", "<u4"), ("weight", "<f8")])
+
+# Attributs GraphML des sommets : type de leur identifiant ("int" ou "str"), et texte d'origine quand l'identifiant
+# XML a dû être rendu unique
+GRAPHML_ID_TYPE = "id_type"
+GRAPHML_ID_VALUE = "id_value"
+
+# Champs d'une ligne de liste d'arêtes contenant des guillemets : identifiant entre guillemets (échappements JSON),
+# début de commentaire, ou champ sans espace
+EDGE_LIST_FIELD = re.compile(r'\s*(?:("(?:[^"\\]|\\.)*")|(#)|([^\s"#]+)|(\S))')
+
+
+def file_dialog_filter():
+    """Filtre QFileDialog regroupant tous les formats"""
+    filters = [f"{label} (*{' *'.join(extensions)})" for label, extensions in GRAPH_FILE_FORMATS.values()]
+    all_extensions = " ".join(f"*{ext}" for _, extensions in GRAPH_FILE_FORMATS.values() for ext in extensions)
+    return ";;".join([f"Tous les graphes ({all_extensions})"] + filters)
+
+
+def detect_format(filename):
+    """Déduire le format d'un fichier de son extension (liste d'arêtes par défaut)"""
+    extension = os.path.splitext(filename)[1].lower()
+    for file_format, (_, extensions) in GRAPH_FILE_FORMATS.items():
+        if extension in extensions:
+            return file_format
+    return "edgelist"
+
+
+def parse_node(token):
+    """Identifiant de sommet : entier si possible, texte sinon"""
+    token = token.strip()
+    try:
+        return int(token)
+    except ValueError:
+        return token
+
+
+def split_edge_list_line(line):
+    """Champs d'une ligne de liste d'arêtes ; les identifiants entre guillemets peuvent contenir des espaces"""
+    if '"' not in line:
+        return line.split("#", 1)[0].split()
+    fields = []
+    for quoted, comment, plain, invalid in EDGE_LIST_FIELD.findall(line.rstrip()):
+        if comment:
+            break
+        if invalid:
+            raise ValueError("guillemet non fermé")
+        fields.append(quoted or plain)
+    return fields
+
+
+def parse_quoted_node(token):
+    """Identifiant de sommet d'une liste d'arêtes ou d'un CSV : un identifiant entre guillemets reste un texte"""
+    token = token.strip()
+    if len(token) >= 2 and token.startswith('"') and token.endswith('"'):
+        return json.loads(token, strict=False)
+    return parse_node(token)
+
+
+def format_quoted_node(node):
+    """Identifiant de sommet pour un CSV ou une liste d'arêtes : entre guillemets (échappements JSON) s'il ne serait
+    pas relu à l'identique par parse_quoted_node (texte vide, qui ressemble à un entier, avec des espaces en bordure
+    ou commençant par un guillemet)"""
+    text = str(node)
+    if isinstance(node, int):
+        return text
+    if not text or text.startswith('"') or parse_node(text) != text:
+        return json.dumps(text, ensure_ascii=False)
+    return text
+
+
+def format_edge_list_node(node):
+    """Identifiant de sommet pour une liste d'arêtes : aussi entre guillemets s'il contient un séparateur (espace),
+    un début de commentaire (#) ou un guillemet"""
+    if not isinstance(node, int) and any(char.isspace() or char in '#"' for char in str(node)):
+        return json.dumps(str(node), ensure_ascii=False)
+    return format_quoted_node(node)
+
+
+def parse_weight(token, default=1.0):
+    """Poids d'une arête (valeur par défaut si absent)"""
+    if token is None or not str(token).strip():
+        return default
+    return float(token)
+
+
+class _ChunkedReader:
+    """Accumule les arêtes par blocs, rapporte la progression et vérifie l'annulation"""
+
+    def __init__(self, graph, total_size, progress_callback, is_cancelled, chunk_size):
+        self.graph = graph
+        self.total_size = total_size
+        self.progress_callback = progress_callback
+        self.is_cancelled = is_cancelled
+        self.chunk_size = chunk_size
+        self.batch = []
+        self.cancelled = False
+
+    def add(self, source, target, weight, position):
+        """Ajouter une arête ; retourne False si la lecture doit s'arrêter"""
+        self.batch.append((source, target, weight))
+        if len(self.batch) >= self.chunk_size:
+            return self.flush(position)
+        return True
+
+    def flush(self, position):
+        """Ajouter le bloc courant au graphe"""
+        self.graph.add_weighted_edges_from(self.batch)
+        self.batch = []
+        if self.progress_callback:
+            self.progress_callback(position, self.total_size)
+        if self.is_cancelled and self.is_cancelled():
+            self.cancelled = True
+            return False
+        return True
+
+
+def read_edge_list(filename, progress_callback=None, is_cancelled=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Lire une liste d'arêtes « source destination [poids] » séparées par des espaces ou tabulations
+    (identifiants contenant des espaces entre guillemets)"""
+    graph = nx.Graph()
+    with open(filename, "r", encoding="utf-8") as f:
+        reader = _ChunkedReader(graph, os.fstat(f.fileno()).st_size, progress_callback, is_cancelled, chunk_size)
+        for line_number, line in enumerate(f, 1):
+            try:
+                fields = split_edge_list_line(line)
+                nodes = [parse_quoted_node(field) for field in fields[:2]]
+            except ValueError as error:
+                raise ValueError(f"Ligne {line_number} : identifiant invalide ({error})")
+            if not fields:
+                continue
+            if len(fields) == 1:
+                # Sommet isolé
+                graph.add_node(nodes[0])
+                continue
+            try:
+                weight = parse_weight(fields[2] if len(fields) > 2 else None)
+            except ValueError:
+                raise ValueError(f"Ligne {line_number} : poids invalide '{fields[2]}'")
+            if not reader.add(nodes[0], nodes[1], weight, f.buffer.tell()):
+                return None
+        if not reader.flush(reader.total_size):
+            return None
+    return graph
+
+
+def read_csv_header(filename):
+    """Lire la ligne d'en-tête d'un fichier CSV"""
+    with open(filename, "r", encoding="utf-8", newline="") as f:
+        dialect = _sniff_dialect(f)
+        return next(csv.reader(f, dialect), [])
+
+
+def guess_csv_mapping(header):
+    """Associer les colonnes source, destination et poids aux noms d'en-tête reconnus"""
+    normalized = [column.strip().lower() for column in header]
+    mapping = {}
+    for role, aliases in CSV_COLUMN_ALIASES.items():
+        for i, column in enumerate(normalized):
+            if column in aliases and i not in mapping.values():
+                mapping[role] = i
+                break
+    # Sans en-tête reconnu, utiliser les premières colonnes dans l'ordre
+    if "source" not in mapping or "target" not in mapping:
+        mapping = {"source": 0, "target": 1}
+        if len(header) > 2:
+            mapping["weight"] = 2
+    return mapping
+
+
+def _sniff_dialect(f):
+    """Détecter le séparateur à partir du début du fichier"""
+    sample = f.read(8192)
+    f.seek(0)
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        return csv.excel
+
+
+def read_csv(filename, mapping=None, has_header=True, progress_callback=None, is_cancelled=None,
+             chunk_size=DEFAULT_CHUNK_SIZE):
+    """Lire un CSV d'arêtes ; mapping associe 'source', 'target' et 'weight' (optionnel) à des indices de colonnes"""
+    graph = nx.Graph()
+    with open(filename, "r", encoding="utf-8", newline="") as f:
+        reader = _ChunkedReader(graph, os.fstat(f.fileno()).st_size, progress_callback, is_cancelled, chunk_size)
+        rows = csv.reader(f, _sniff_dialect(f))
+        header = next(rows, []) if has_header else []
+        if mapping is None:
+            mapping = guess_csv_mapping(header) if header else {"source": 0, "target": 1, "weight": 2}
+        source_column, target_column = mapping["source"], mapping["target"]
+        weight_column = mapping.get("weight")
+
+        for row in rows:
+            if not row or not any(field.strip() for field in row):
+                continue
+            try:
+                if not row[target_column].strip():
+                    # Sommet isolé (destination vide)
+                    graph.add_node(parse_quoted_node(row[source_column]))
+                    continue
+                weight = parse_weight(row[weight_column] if weight_column is not None and weight_column < len(row) else None)
+                source, target = parse_quoted_node(row[source_column]), parse_quoted_node(row[target_column])
+            except (IndexError, ValueError):
+                raise ValueError(f"Ligne {rows.line_num} : ligne CSV invalide {row}")
+            if not reader.add(source, target, weight, f.buffer.tell()):
+                return None
+        if not reader.flush(reader.total_size):
+            return None
+    return graph
+
+
+def read_graphml(filename, progress_callback=None, is_cancelled=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Lire un fichier GraphML en flux (iterparse), sans charger l'arbre XML complet. Les identifiants sont relus
+    avec leur type d'origine si le fichier l'indique (attribut 'id_type' de write_graphml), sinon par parse_node"""
+    graph = nx.Graph()
+    weight_keys = set()
+    type_keys = set()
+    value_keys = set()
+    nodes_by_id = {}
+    with open(filename, "rb") as f:
+        reader = _ChunkedReader(graph, os.fstat(f.fileno()).st_size, progress_callback, is_cancelled, chunk_size)
+        for _, element in ET.iterparse(f, events=("end",)):
+            tag = element.tag.rsplit("}", 1)[-1]
+            if tag == "key":
+                if element.get("for") in ("edge", "all") and element.get("attr.name") == "weight":
+                    weight_keys.add(element.get("id"))
+                elif element.get("for") in ("node", "all") and element.get("attr.name") == GRAPHML_ID_TYPE:
+                    type_keys.add(element.get("id"))
+                elif element.get("for") in ("node", "all") and element.get("attr.name") == GRAPHML_ID_VALUE:
+                    value_keys.add(element.get("id"))
+            elif tag == "node":
+                node_id = element.get("id")
+                text, id_type = node_id, None
+                for data in element:
+                    if data.tag.rsplit("}", 1)[-1] == "data":
+                        if data.get("key") in type_keys:
+                            id_type = (data.text or "").strip()
+                        elif data.get("key") in value_keys:
+                            text = data.text or ""
+                try:
+                    node = text if id_type == "str" else int(text) if id_type == "int" else parse_node(text)
+                except ValueError:
+                    raise ValueError(f"Identifiant de sommet {text!r} incompatible avec son type {id_type!r}")
+                nodes_by_id[node_id] = node
+                graph.add_node(node)
+                element.clear()
+            elif tag == "edge":
+                weight = None
+                for data in element:
+                    if data.tag.rsplit("}", 1)[-1] == "data" and data.get("key") in weight_keys:
+                        weight = data.text
+                # Extrémités déclarées comme sommets : même identifiant (et même type) que le sommet
+                source, target = element.get("source"), element.get("target")
+                source = nodes_by_id[source] if source in nodes_by_id else parse_node(source)
+                target = nodes_by_id[target] if target in nodes_by_id else parse_node(target)
+                if not reader.add(source, target, parse_weight(weight), f.tell()):
+                    return None
+                element.clear()
+        if not reader.flush(reader.total_size):
+            return None
+    return graph
+
+
+def read_binary(filename, progress_callback=None, is_cancelled=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Lire le format binaire compact (voir write_binary)"""
+    graph = nx.Graph()
+    with open(filename, "rb") as f:
+        magic, num_nodes, num_edges, labels_size = BINARY_HEADER.unpack(f.read(BINARY_HEADER.size))
+        if magic != BINARY_MAGIC:
+            raise ValueError("Fichier binaire invalide (signature inconnue)")
+        node_ids = json.loads(f.read(labels_size).decode("utf-8"))
+        if len(node_ids) != num_nodes:
+            raise ValueError("Fichier binaire invalide (nombre de sommets incohérent)")
+        graph.add_nodes_from(node_ids)
+
+        node_array = np.empty(num_nodes, dtype=object)
+        node_array[:] = node_ids
+        reader = _ChunkedReader(graph, num_edges, progress_callback, is_cancelled, chunk_size)
+        read_edges = 0
+        while read_edges < num_edges:
+            count = min(chunk_size, num_edges - read_edges)
+            records = np.frombuffer(f.read(count * BINARY_EDGE_DTYPE.itemsize), dtype=BINARY_EDGE_DTYPE)
+            if len(records) != count:
+                raise ValueError("Fichier binaire tronqué")
+            reader.batch = list(zip(node_array[records["source"]].tolist(),
+                                    node_array[records["target"]].tolist(),
+                                    records["weight"].tolist()))
+            read_edges += count
+            if not reader.flush(read_edges):
+                return None
+    return graph
+
+
+def read_graph_file(filename, file_format=None, progress_callback=None, is_cancelled=None, **options):
+    """Lire un graphe depuis un fichier ; retourne None si la lecture a été annulée"""
+    readers = {
+        "edgelist": read_edge_list,
+        "csv": read_csv,
+        "graphml": read_graphml,
+        "binary": read_binary
+    }
+    reader = readers[file_format or detect_format(filename)]
+    return reader(filename, progress_callback=progress_callback, is_cancelled=is_cancelled, **options)
+
+
+def _iter_edge_chunks(graph, chunk_size):
+    """Parcourir les arêtes du graphe par blocs (source, destination, poids)"""
+    batch = []
+    for source, target, weight in graph.edges(data="weight", default=1.0):
+        batch.append((source, target, weight))
+        if len(batch) >= chunk_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _write_atomically(filename, write_to, binary=False):
+    """Écrire dans un fichier temporaire voisin, mis à la place de filename seulement si write_to(f) retourne True :
+    une écriture annulée ou interrompue par une erreur laisse le fichier cible intact"""
+    temporary = f"{filename}.part"
+    try:
+        with (open(temporary, "wb") if binary else open(temporary, "w", encoding="utf-8", newline="")) as f:
+            completed = write_to(f)
+        if completed:
+            os.replace(temporary, filename)
+        return completed
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def _write_text_chunks(graph, filename, format_chunk, header, progress_callback, is_cancelled, chunk_size,
+                       footer=""):
+    """Écrire un fichier texte bloc par bloc ; retourne False si l'écriture a été annulée"""
+    total = graph.number_of_edges()
+
+    def write_to(f):
+        written = 0
+        f.write(header)
+        for batch in _iter_edge_chunks(graph, chunk_size):
+            f.write(format_chunk(batch))
+            written += len(batch)
+            if progress_callback:
+                progress_callback(written, total)
+            if is_cancelled and is_cancelled():
+                return False
+        f.write(footer)
+        return True
+
+    return _write_atomically(filename, write_to)
+
+
+def write_edge_list(graph, filename, progress_callback=None, is_cancelled=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Écrire une liste d'arêtes « source destination poids » (identifiants avec espaces entre guillemets)"""
+    # Les sommets isolés sont écrits seuls sur leur ligne
+    isolated = "".join(f"{format_edge_list_node(node)}\n" for node in nx.isolates(graph))
+    return _write_text_chunks(
+        graph, filename,
+        lambda batch: "".join(f"{format_edge_list_node(u)} {format_edge_list_node(v)} {w}\n" for u, v, w in batch),
+        isolated, progress_callback, is_cancelled, chunk_size)
+
+
+def write_csv(graph, filename, progress_callback=None, is_cancelled=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Écrire un CSV avec l'en-tête source,target,weight (identifiants textuels ambigus entre guillemets JSON)"""
+    def format_rows(rows):
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue()
+
+    def format_chunk(batch):
+        return format_rows((format_quoted_node(u), format_quoted_node(v), w) for u, v, w in batch)
+    # Les sommets isolés sont écrits avec une destination vide
+    header = "source,target,weight\n" + format_rows((format_quoted_node(node), "", "") for node in nx.isolates(graph))
+    return _write_text_chunks(graph, filename, format_chunk, header, progress_callback, is_cancelled, chunk_size)
+
+
+def write_graphml(graph, filename, progress_callback=None, is_cancelled=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Écrire un fichier GraphML (poids en attribut 'weight') en flux ; le type de chaque identifiant (entier ou
+    texte) est enregistré dans l'attribut 'id_type' des sommets. Deux sommets de même texte (1 et "1") reçoivent
+    des identifiants XML distincts, le texte d'origine étant conservé dans l'attribut 'id_value'"""
+    header = ['<?xml version="1.0" encoding="UTF-8"?>\n',
+              '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n',
+              '  <key id="weight" for="edge" attr.name="weight" attr.type="double"/>\n',
+              f'  <key id="id_type" for="node" attr.name="{GRAPHML_ID_TYPE}" attr.type="string"/>\n',
+              f'  <key id="id_value" for="node" attr.name="{GRAPHML_ID_VALUE}" attr.type="string"/>\n',
+              '  <graph edgedefault="undirected">\n']
+    seen = set()
+    xml_ids = {}
+    for node in graph.nodes():
+        text = str(node)
+        data = f'<data key="id_type">{"int" if isinstance(node, int) else "str"}</data>'
+        if text in seen:
+            xml_ids[node] = f"{text}#{len(xml_ids) + 1}"
+            data += f'<data key="id_value">{escape(text)}</data>'
+        seen.add(text)
+        header.append(f"    <node id={quoteattr(xml_ids.get(node, text))}>{data}</node>\n")
+
+    def xml_id(node):
+        return quoteattr(xml_ids[node] if node in xml_ids else str(node))
+
+    return _write_text_chunks(
+        graph, filename,
+        lambda batch: "".join(f'    <edge source={xml_id(u)} target={xml_id(v)}>'
+                              f'<data key="weight">{w}</data></edge>\n' for u, v, w in batch),
+        "".join(header), progress_callback, is_cancelled, chunk_size,
+        footer="  </graph>\n</graphml>\n")
+
+
+def write_binary(graph, filename, progress_callback=None, is_cancelled=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Écrire le format binaire compact : en-tête, identifiants en JSON, puis (source u32, destination u32, poids f64)"""
+    node_ids = list(graph.nodes())
+    index = {node: i for i, node in enumerate(node_ids)}
+    # Les identifiants autres qu'entiers ou textes (tuples d'une grille...) sont enregistrés sous forme de texte
+    labels = json.dumps([node if isinstance(node, (int, str)) else str(node) for node in node_ids],
+                        ensure_ascii=False).encode("utf-8")
+    total = graph.number_of_edges()
+
+    def write_to(f):
+        written = 0
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, len(node_ids), total, len(labels)))
+        f.write(labels)
+        for batch in _iter_edge_chunks(graph, chunk_size):
+            records = np.empty(len(batch), dtype=BINARY_EDGE_DTYPE)
+            records["source"] = [index[u] for u, _, _ in batch]
+            records["target"] = [index[v] for _, v, _ in batch]
+            records["weight"] = [w for _, _, w in batch]
+            f.write(records.tobytes())
+            written += len(batch)
+            if progress_callback:
+                progress_callback(written, total)
+            if is_cancelled and is_cancelled():
+                return False
+        return True
+
+    return _write_atomically(filename, write_to, binary=True)
+
+
+def write_graph_file(graph, filename, file_format=None, progress_callback=None, is_cancelled=None, **options):
+    """Écrire un graphe dans un fichier ; retourne False si l'écriture a été annulée"""
+    writers = {
+        "edgelist": write_edge_list,
+        "csv": write_csv,
+        "graphml": write_graphml,
+        "binary": write_binary
+    }
+    writer = writers[file_format or detect_format(filename)]
+    return writer(graph, filename, progress_callback=progress_callback, is_cancelled=is_cancelled, **options)
@@ -1,12 +1,24 @@
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-                         QLineEdit, QTableWidget, QTableWidgetItem, QMessageBox,
+                         QLineEdit, QTableView, QAbstractItemView, QMessageBox,
                          QGroupBox, QSpinBox, QDoubleSpinBox, QHeaderView, QSplitter,
-                         QFrame, QCheckBox, QComboBox)
-from PyQt5.QtCore import Qt
+                         QFrame, QCheckBox, QComboBox, QFileDialog, QProgressDialog,
+                         QFormLayout, QDialogButtonBox, QStackedWidget)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QThread, QTimer, pyqtSignal
+from contextlib import contextmanager
+import os
 import networkx as nx
-import random
 import numpy as np
 from visualisation_graphe import CytoscapeGraphView
+from fichiers_graphe import (read_graph_file, write_graph_file, read_csv_header, guess_csv_mapping,
+                             detect_format, file_dialog_filter)
+from noyau_kruskal import graph_components
+
+# Délai de regroupement des mises à jour de l'aperçu (ms)
+PREVIEW_DEBOUNCE_MS = 150
+
+# Au-delà de ce nombre d'éléments (sommets + arêtes), l'aperçu est remplacé par un résumé
+DEFAULT_PREVIEW_LIMIT = 2000
+
 
 class GraphDrawingArea(QFrame):
     """Widget pour visualiser le graphe pendant sa création"""
@@ -17,28 +29,81 @@ class GraphDrawingArea(QFrame):
         self.setFrameShape(QFrame.StyledPanel)
         self.setFrameShadow(QFrame.Sunken)
         
-        # Initialiser la visualisation du graphe
+        # Initialiser la visualisation du graphe, avec un résumé affiché à la place des grands graphes
         layout = QVBoxLayout(self)
+        self.stack = QStackedWidget()
         self.graph_view = CytoscapeGraphView()
-        layout.addWidget(self.graph_view)
+        self.summary_label = QLabel()
+        self.summary_label.setAlignment(Qt.AlignCenter)
+        self.summary_label.setWordWrap(True)
+        self.stack.addWidget(self.graph_view)
+        self.stack.addWidget(self.summary_label)
+        layout.addWidget(self.stack)
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Initialiser un graphe vide
         self.graph = nx.Graph()
+        self.preview_limit = DEFAULT_PREVIEW_LIMIT
+        
+        # Les demandes de mise à jour sont regroupées : seule la dernière est dessinée
+        self.pending = None
+        self.batch_depth = 0
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self.update_timer.timeout.connect(self.flush_update)
+        
+    def request_update(self, nodes, edges):
+        """Demander une mise à jour de l'aperçu (différée et regroupée avec les demandes suivantes)"""
+        self.pending = (nodes, edges)
+        if self.batch_depth == 0:
+            self.update_timer.start()
+    
+    @contextmanager
+    def batch(self):
+        """Regrouper toutes les demandes d'une opération en une seule mise à jour"""
+        self.batch_depth += 1
+        try:
+            yield
+        finally:
+            self.batch_depth -= 1
+            if self.batch_depth == 0 and self.pending is not None:
+                self.update_timer.start()
+    
+    def flush_update(self):
+        """Dessiner immédiatement la dernière demande en attente"""
+        self.update_timer.stop()
+        if self.pending is not None:
+            nodes, edges = self.pending
+            self.pending = None
+            self.update_graph(nodes, edges)
+    
+    def set_preview_limit(self, limit):
+        """Changer la taille maximale de l'aperçu et redessiner"""
+        self.preview_limit = limit
+        if self.pending is None:
+            self.pending = (list(self.graph.nodes()), list(self.graph.edges(data="weight")))
+        self.update_timer.start()
         
     def update_graph(self, nodes, edges):
         """Mettre à jour la visualisation du graphe avec les nouveaux sommets et arêtes"""
         self.graph = nx.Graph()
+        self.graph.add_nodes_from(nodes)
+        # S'assurer qu'on a source, destination, poids
+        self.graph.add_weighted_edges_from(edge[:3] for edge in edges if len(edge) >= 3)
+        
+        num_nodes, num_edges = self.graph.number_of_nodes(), self.graph.number_of_edges()
+        if num_nodes + num_edges > self.preview_limit:
+            # Graphe trop grand pour une mise en page interactive : afficher un résumé
+            average_degree = 2 * num_edges / num_nodes
+            self.summary_label.setText(
+                f"<b>Aperçu désactivé</b><br>{num_nodes} sommets, {num_edges} arêtes<br>"
+                f"Degré moyen: {average_degree:.2f}<br>"
+                f"<i>(limite de l'aperçu: {self.preview_limit} éléments)</i>")
+            self.stack.setCurrentWidget(self.summary_label)
+            return
         
-        # Ajouter les sommets
-        for node_id in nodes:
-            self.graph.add_node(node_id)
-            
-        # Ajouter les arêtes
-        for edge in edges:
-            if len(edge) >= 3:  # S'assurer qu'on a source, destination, poids
-                self.graph.add_edge(edge[0], edge[1], weight=edge[2])
-        
+        self.stack.setCurrentWidget(self.graph_view)
         # Redessiner si nous avons des sommets (éviter l'erreur "graphe nul")
         if nodes:
             self.graph_view.draw_graph(self.graph)
@@ -47,6 +112,316 @@ class GraphDrawingArea(QFrame):
             self.graph_view.reset_view()
 
 
+# Générateurs d'arêtes vectorisés : chacun retourne deux tableaux d'indices de sommets (sources, destinations)
+
+def complete_edge_indices(n):
+    """Toutes les paires de sommets"""
+    return np.triu_indices(n, 1)
+
+
+def gnp_edge_indices(n, p, rng, chunk_size=1 << 20):
+    """Graphe aléatoire G(n, p) par sauts géométriques (Batagelj-Brandes), sans énumérer les n(n-1)/2 paires"""
+    total_pairs = n * (n - 1) // 2
+    if p >= 1.0:
+        return complete_edge_indices(n)
+    if p <= 0.0 or total_pairs == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    
+    # Les écarts entre paires retenues suivent une loi géométrique : on tire les positions par blocs
+    positions = []
+    last = -1
+    while last < total_pairs:
+        gaps = rng.geometric(p, size=chunk_size)
+        block = last + np.cumsum(gaps)
+        positions.append(block[block < total_pairs])
+        last = block[-1]
+    linear = np.concatenate(positions)
+    
+    # Indice linéaire k -> paire (v, w) avec w < v, k = v(v-1)/2 + w
+    v = np.floor((1 + np.sqrt(1 + 8 * linear.astype(np.float64))) / 2).astype(np.int64)
+    v -= v * (v - 1) // 2 > linear  # Correction des erreurs d'arrondi de la racine carrée
+    v += (v + 1) * v // 2 <= linear
+    w = linear - v * (v - 1) // 2
+    return w, v
+
+
+def random_tree_edge_indices(n, rng):
+    """Arbre couvrant aléatoire : chaque sommet (dans un ordre aléatoire) se relie à un sommet déjà placé"""
+    if n < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    order = rng.permutation(n)
+    parents = (rng.random(n - 1) * np.arange(1, n)).astype(np.int64)
+    return order[1:], order[parents]
+
+
+def ring_edge_indices(n):
+    """Cycle passant par tous les sommets dans l'ordre"""
+    if n < 3:
+        return np.arange(n - 1), np.arange(1, n)
+    sources = np.arange(n)
+    return sources, np.roll(sources, -1)
+
+
+def merge_edge_indices(n, *edge_sets):
+    """Fusionner plusieurs ensembles d'arêtes en supprimant les doublons (non orientés)"""
+    sources = np.concatenate([edges[0] for edges in edge_sets]).astype(np.int64)
+    targets = np.concatenate([edges[1] for edges in edge_sets]).astype(np.int64)
+    keys = np.unique(np.minimum(sources, targets) * n + np.maximum(sources, targets))
+    return keys // n, keys % n
+
+
+def random_weights(count, rng):
+    """Poids aléatoires entre 1 et 10, arrondis au dixième"""
+    return np.round(rng.uniform(1, 10, count), 1)
+
+
+class NodeTableModel(QAbstractTableModel):
+    """Modèle des sommets : la vue ne crée que les lignes visibles"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.nodes = []
+        self.node_set = set()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.nodes)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self.nodes[index.row()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return "ID du Sommet"
+        return super().headerData(section, orientation, role)
+    
+    def append_nodes(self, nodes):
+        """Ajouter des sommets en fin de tableau (insertion incrémentale)"""
+        if not nodes:
+            return
+        first = len(self.nodes)
+        self.beginInsertRows(QModelIndex(), first, first + len(nodes) - 1)
+        self.nodes.extend(nodes)
+        self.node_set.update(nodes)
+        self.endInsertRows()
+    
+    def remove_node(self, node_id):
+        """Supprimer un sommet (suppression incrémentale de sa ligne)"""
+        row = self.nodes.index(node_id)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.nodes[row]
+        self.node_set.discard(node_id)
+        self.endRemoveRows()
+    
+    def clear(self):
+        self.beginResetModel()
+        self.nodes = []
+        self.node_set = set()
+        self.endResetModel()
+
+
+class EdgeTableModel(QAbstractTableModel):
+    """Modèle des arêtes avec un index haché pour détecter les doublons en temps constant"""
+    HEADERS = ["Source", "Destination", "Poids"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.edges = []
+        self.edge_keys = set()
+        
+    @staticmethod
+    def edge_key(source, target):
+        """Clé non orientée d'une arête"""
+        try:
+            ordered = source <= target
+        except TypeError:
+            # Identifiants de types différents (entier généré et texte saisi)
+            ordered = str(source) <= str(target)
+        return (source, target) if ordered else (target, source)
+    
+    def has_edge(self, source, target):
+        return self.edge_key(source, target) in self.edge_keys
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.edges)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            value = self.edges[index.row()][index.column()]
+            return str(value) if role == Qt.DisplayRole else value
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index):
+        flags = super().flags(index)
+        # Seul le poids est modifiable directement dans le tableau
+        if index.isValid() and index.column() == 2:
+            flags |= Qt.ItemIsEditable
+        return flags
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() != 2 or role != Qt.EditRole:
+            return False
+        try:
+            weight = float(value)
+        except (TypeError, ValueError):
+            return False
+        source, target, _ = self.edges[index.row()]
+        self.edges[index.row()] = (source, target, weight)
+        self.dataChanged.emit(index, index)
+        return True
+    
+    def append_edges(self, edges):
+        """Ajouter des arêtes en fin de tableau (insertion incrémentale)"""
+        if not edges:
+            return
+        first = len(self.edges)
+        self.beginInsertRows(QModelIndex(), first, first + len(edges) - 1)
+        self.edges.extend(edges)
+        self.edge_keys.update(self.edge_key(source, target) for source, target, _ in edges)
+        self.endInsertRows()
+    
+    def remove_rows(self, rows):
+        """Supprimer des lignes, par blocs contigus en partant de la fin"""
+        rows = sorted(set(rows), reverse=True)
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                i += 1
+                first = rows[i]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for source, target, _ in self.edges[first:last + 1]:
+                self.edge_keys.discard(self.edge_key(source, target))
+            del self.edges[first:last + 1]
+            self.endRemoveRows()
+            i += 1
+    
+    def set_edges(self, edges, edge_keys=None):
+        """Remplacer toutes les arêtes (réinitialisation du modèle, sans recréer de widgets)"""
+        self.beginResetModel()
+        self.edges = list(edges)
+        if edge_keys is None:
+            edge_keys = {self.edge_key(source, target) for source, target, _ in self.edges}
+        self.edge_keys = edge_keys
+        self.endResetModel()
+
+
+class GraphFileThread(QThread):
+    """Lecture (graph=None) ou écriture d'un fichier de graphe hors du thread de l'interface"""
+    progress_signal = pyqtSignal(int, int)
+    result_ready = pyqtSignal(object)  # graphe lu, True après écriture, None si annulé
+    error_signal = pyqtSignal(str)
+    
+    def __init__(self, filename, graph=None, file_format=None, options=None):
+        super().__init__()
+        self.filename = filename
+        self.graph = graph
+        self.file_format = file_format
+        self.options = options or {}
+        self.cancelled = False
+        
+    def run(self):
+        try:
+            if self.graph is None:
+                result = read_graph_file(self.filename, self.file_format, self.progress_signal.emit,
+                                         self.is_cancelled, **self.options)
+            else:
+                result = write_graph_file(self.graph, self.filename, self.file_format, self.progress_signal.emit,
+                                          self.is_cancelled, **self.options) or None
+        except Exception as e:  # Fichier introuvable, ligne invalide, XML mal formé...
+            self.error_signal.emit(f"{type(e).__name__}: {e}")
+            return
+        self.result_ready.emit(result)
+        
+    def is_cancelled(self):
+        return self.cancelled
+    
+    def cancel(self):
+        self.cancelled = True
+
+
+class CsvMappingDialog(QDialog):
+    """Choix des colonnes source, destination et poids d'un fichier CSV"""
+    
+    def __init__(self, header, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Colonnes du Fichier CSV")
+        guessed = guess_csv_mapping(header)
+        
+        layout = QFormLayout(self)
+        self.combos = {}
+        for role, label in (("source", "Source:"), ("target", "Destination:"), ("weight", "Poids:")):
+            combo = QComboBox()
+            if role == "weight":
+                combo.addItem("(aucun, poids 1)")
+            combo.addItems(header)
+            if role in guessed:
+                combo.setCurrentIndex(guessed[role] + (1 if role == "weight" else 0))
+            layout.addRow(label, combo)
+            self.combos[role] = combo
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow(buttons)
+        
+    def get_mapping(self):
+        """Retourner les indices de colonnes choisis"""
+        mapping = {"source": self.combos["source"].currentIndex(), "target": self.combos["target"].currentIndex()}
+        if self.combos["weight"].currentIndex() > 0:
+            mapping["weight"] = self.combos["weight"].currentIndex() - 1
+        return mapping
+
+
+def ask_graph_import(parent):
+    """Demander le fichier à importer (et les colonnes d'un CSV) ; retourne (fichier, format, options) ou None"""
+    filename, _ = QFileDialog.getOpenFileName(parent, "Importer un Graphe", "", file_dialog_filter())
+    if not filename:
+        return None
+    
+    file_format = detect_format(filename)
+    options = {}
+    if file_format == "csv":
+        try:
+            header = read_csv_header(filename)
+        except (OSError, UnicodeDecodeError) as e:
+            QMessageBox.warning(parent, "Erreur d'Import", str(e))
+            return None
+        dialog = CsvMappingDialog(header, parent)
+        if dialog.exec_() != QDialog.Accepted:
+            return None
+        options["mapping"] = dialog.get_mapping()
+    return filename, file_format, options
+
+
+def start_graph_file_thread(parent, thread, label):
+    """Lancer un thread de fichier avec une fenêtre de progression annulable"""
+    progress = QProgressDialog(label, "Annuler", 0, 1000, parent)
+    progress.setWindowModality(Qt.WindowModal)
+    progress.setMinimumDuration(300)
+    progress.setAutoClose(False)
+    progress.setAutoReset(False)
+    
+    thread.progress_signal.connect(lambda done, total: progress.setValue(int(done * 1000 / total) if total else 0))
+    progress.canceled.connect(thread.cancel)
+    thread.finished.connect(progress.close)
+    thread.error_signal.connect(lambda message: QMessageBox.warning(parent, "Erreur de Fichier", message))
+    thread.start()
+    return progress
+
+
 class CustomGraphDialog(QDialog):
     """Boîte de dialogue pour créer des graphes personnalisés"""
     
@@ -55,12 +430,22 @@ class CustomGraphDialog(QDialog):
         self.setWindowTitle("Créer un Graphe Personnalisé")
         self.resize(900, 700)  # Taille plus grande pour une meilleure édition de graphe
         
-        # Initialiser les données du graphe
-        self.nodes = []
-        self.edges = []
+        # Initialiser les données du graphe (les modèles sont la source de vérité)
+        self.node_model = NodeTableModel(self)
+        self.edge_model = EdgeTableModel(self)
+        self.file_thread = None
+        self.last_seed = None
         
         self.setup_ui()
         
+    @property
+    def nodes(self):
+        return self.node_model.nodes
+    
+    @property
+    def edges(self):
+        return self.edge_model.edges
+    
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
         
@@ -85,19 +470,24 @@ class CustomGraphDialog(QDialog):
         node_add_layout.addWidget(node_add_btn)
         node_layout.addLayout(node_add_layout)
         
-        # Node list
-        self.node_table = QTableWidget(0, 2)  # id, delete button
-        self.node_table.setHorizontalHeaderLabels(["ID du Sommet", "Actions"])
+        # Node list (virtualized view over the node model)
+        self.node_table = QTableView()
+        self.node_table.setModel(self.node_model)
         self.node_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.node_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Fixed)
-        self.node_table.setColumnWidth(1, 100)
+        self.node_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.node_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.node_table.verticalHeader().setDefaultSectionSize(22)
         node_layout.addWidget(self.node_table)
         
+        delete_nodes_btn = QPushButton("Supprimer la Sélection")
+        delete_nodes_btn.clicked.connect(self.delete_selected_nodes)
+        node_layout.addWidget(delete_nodes_btn)
+        
         # Quick node generation
         quick_node_layout = QHBoxLayout()
         quick_node_layout.addWidget(QLabel("Ajout rapide:"))
         self.num_nodes_spinbox = QSpinBox()
-        self.num_nodes_spinbox.setRange(1, 50)
+        self.num_nodes_spinbox.setRange(1, 1000000)
         self.num_nodes_spinbox.setValue(5)
         quick_node_layout.addWidget(self.num_nodes_spinbox)
         quick_add_btn = QPushButton("Générer Sommets")
@@ -114,10 +504,17 @@ class CustomGraphDialog(QDialog):
         
         # Edge creation
         edge_add_layout = QHBoxLayout()
+        # Both combo boxes share the node model: no repopulation on change
         self.edge_source = QComboBox()
         self.edge_source.setPlaceholderText("Source")
+        self.edge_source.setModel(self.node_model)
         self.edge_target = QComboBox()
         self.edge_target.setPlaceholderText("Destination")
+        self.edge_target.setModel(self.node_model)
+        for combo in (self.edge_source, self.edge_target):
+            # Avoid measuring every item to size the combo box on large graphs
+            combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+            combo.setMinimumContentsLength(6)
         self.edge_weight = QDoubleSpinBox()
         self.edge_weight.setRange(0.1, 100.0)
         self.edge_weight.setValue(1.0)
@@ -134,16 +531,20 @@ class CustomGraphDialog(QDialog):
         edge_add_layout.addWidget(edge_add_btn)
         edge_layout.addLayout(edge_add_layout)
         
-        # Edge list
-        self.edge_table = QTableWidget(0, 4)  # source, target, weight, delete
-        self.edge_table.setHorizontalHeaderLabels(["Source", "Destination", "Poids", "Actions"])
-        self.edge_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.edge_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.edge_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.edge_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Fixed)
-        self.edge_table.setColumnWidth(3, 100)
+        # Edge list (virtualized view over the edge model, weights editable in place)
+        self.edge_table = QTableView()
+        self.edge_table.setModel(self.edge_model)
+        self.edge_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.edge_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.edge_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.edge_table.verticalHeader().setDefaultSectionSize(22)
+        self.edge_model.dataChanged.connect(lambda *_: self.update_graph_view())
         edge_layout.addWidget(self.edge_table)
         
+        delete_edges_btn = QPushButton("Supprimer la Sélection")
+        delete_edges_btn.clicked.connect(self.delete_selected_edges)
+        edge_layout.addWidget(delete_edges_btn)
+        
         # Quick edge generation
         quick_edge_layout = QHBoxLayout()
         quick_edge_layout.addWidget(QLabel("Générer Arêtes:"))
@@ -154,17 +555,33 @@ class CustomGraphDialog(QDialog):
         edge_density_layout = QHBoxLayout()
         edge_density_layout.addWidget(QLabel("Densité d'Arêtes:"))
         self.edge_density = QDoubleSpinBox()
-        self.edge_density.setRange(0.1, 1.0)
+        self.edge_density.setDecimals(6)
+        self.edge_density.setRange(0.000001, 1.0)
         self.edge_density.setValue(0.3)
         self.edge_density.setSingleStep(0.1)
         edge_density_layout.addWidget(self.edge_density)
         
+        # Random spanning tree added under the random edges to guarantee connectivity
+        self.ensure_connected = QCheckBox("Garantir la Connexité")
+        self.ensure_connected.setChecked(False)
+        edge_density_layout.addWidget(self.ensure_connected)
+        
+        # Seed for reproducible generation ("Aléatoire" draws a new one, recorded with the graph)
+        seed_layout = QHBoxLayout()
+        seed_layout.addWidget(QLabel("Graine:"))
+        self.seed_input = QSpinBox()
+        self.seed_input.setRange(-1, 2147483647)
+        self.seed_input.setSpecialValueText("Aléatoire")
+        self.seed_input.setValue(-1)
+        seed_layout.addWidget(self.seed_input)
+        
         quick_edge_btn = QPushButton("Générer Arêtes")
         quick_edge_btn.clicked.connect(self.generate_edges)
         
         edge_gen_layout = QVBoxLayout()
         edge_gen_layout.addLayout(quick_edge_layout)
         edge_gen_layout.addLayout(edge_density_layout)
+        edge_gen_layout.addLayout(seed_layout)
         edge_gen_layout.addWidget(quick_edge_btn)
         
         edge_layout.addLayout(edge_gen_layout)
@@ -190,8 +607,19 @@ class CustomGraphDialog(QDialog):
         preview_layout.addLayout(graph_name_layout)
         left_layout.addLayout(preview_layout)
         
+        # Preview size limit (larger graphs show a summary instead of a layout)
+        preview_limit_layout = QHBoxLayout()
+        preview_limit_layout.addWidget(QLabel("Limite de l'Aperçu (éléments):"))
+        self.preview_limit = QSpinBox()
+        self.preview_limit.setRange(0, 10000000)
+        self.preview_limit.setSingleStep(500)
+        self.preview_limit.setValue(DEFAULT_PREVIEW_LIMIT)
+        preview_limit_layout.addWidget(self.preview_limit)
+        left_layout.addLayout(preview_limit_layout)
+        
         # Right panel - Graph visualization
         self.graph_drawing = GraphDrawingArea()
+        self.preview_limit.valueChanged.connect(self.graph_drawing.set_preview_limit)
         
         # Add panels to splitter
         splitter.addWidget(left_panel)
@@ -209,8 +637,14 @@ class CustomGraphDialog(QDialog):
         cancel_btn.clicked.connect(self.reject)
         clear_btn = QPushButton("Tout Effacer")
         clear_btn.clicked.connect(self.clear_all)
+        import_btn = QPushButton("Importer...")
+        import_btn.clicked.connect(self.import_graph_file)
+        export_btn = QPushButton("Exporter...")
+        export_btn.clicked.connect(self.export_graph_file)
         
         button_layout.addWidget(clear_btn)
+        button_layout.addWidget(import_btn)
+        button_layout.addWidget(export_btn)
         button_layout.addStretch()
         button_layout.addWidget(cancel_btn)
         button_layout.addWidget(create_btn)
@@ -225,25 +659,16 @@ class CustomGraphDialog(QDialog):
             QMessageBox.warning(self, "Erreur de Saisie", "Veuillez entrer un ID de sommet")
             return
         
-        if node_id in self.nodes:
+        # Les identifiants numériques sont des entiers, comme ceux des sommets générés
+        if node_id.isdigit():
+            node_id = int(node_id)
+        
+        if node_id in self.node_model.node_set:
             QMessageBox.warning(self, "Sommet en Double", f"Le sommet '{node_id}' existe déjà")
             return
         
-        # Ajouter à la liste interne
-        self.nodes.append(node_id)
-        
-        # Ajouter au tableau
-        row = self.node_table.rowCount()
-        self.node_table.insertRow(row)
-        self.node_table.setItem(row, 0, QTableWidgetItem(node_id))
-        
-        # Ajouter un bouton de suppression
-        delete_btn = QPushButton("Supprimer")
-        delete_btn.clicked.connect(lambda: self.delete_node(node_id))
-        self.node_table.setCellWidget(row, 1, delete_btn)
-        
-        # Mettre à jour les listes déroulantes
-        self.update_node_comboboxes()
+        # Ajouter au modèle (une seule ligne insérée ; les listes déroulantes partagent le modèle)
+        self.node_model.append_nodes([node_id])
         
         # Effacer le champ de saisie
         self.node_id_input.clear()
@@ -253,93 +678,70 @@ class CustomGraphDialog(QDialog):
     
     def delete_node(self, node_id):
         """Supprimer un sommet et toutes ses arêtes connectées"""
-        if node_id in self.nodes:
-            # Supprimer de la liste des sommets
-            self.nodes.remove(node_id)
-            
-            # Supprimer toutes les arêtes connectées à ce sommet
-            self.edges = [edge for edge in self.edges if edge[0] != node_id and edge[1] != node_id]
-            
-            # Mettre à jour les tableaux
-            self.update_tables()
+        if node_id in self.node_model.node_set:
+            self.delete_nodes([node_id])
+    
+    def delete_nodes(self, node_ids):
+        """Supprimer plusieurs sommets et toutes leurs arêtes connectées"""
+        removed = set(node_ids) & self.node_model.node_set
+        if not removed:
+            return
+        
+        # Une seule mise à jour de l'aperçu pour toute la suppression
+        with self.graph_drawing.batch():
+            # Supprimer toutes les arêtes connectées à ces sommets
+            incident_rows = [row for row, (source, target, _) in enumerate(self.edges)
+                             if source in removed or target in removed]
+            if len(incident_rows) > 64:
+                # Beaucoup de lignes éparses : une réinitialisation coûte moins que des suppressions successives
+                self.edge_model.set_edges([edge for edge in self.edges if edge[0] not in removed and edge[1] not in removed])
+            else:
+                self.edge_model.remove_rows(incident_rows)
             
-            # Mettre à jour les listes déroulantes
-            self.update_node_comboboxes()
+            # Supprimer les sommets
+            for node_id in removed:
+                self.node_model.remove_node(node_id)
             
             # Mettre à jour la visualisation
             self.update_graph_view()
     
+    def delete_selected_nodes(self):
+        """Supprimer les sommets sélectionnés dans le tableau"""
+        rows = {index.row() for index in self.node_table.selectionModel().selectedRows()}
+        self.delete_nodes([self.nodes[row] for row in rows])
+    
     def generate_nodes(self):
-        """Générer automatiquement un nombre spécifié de sommets"""
+        """Générer automatiquement un nombre spécifié de sommets à identifiants entiers"""
         num_nodes = self.num_nodes_spinbox.value()
         
-        # Générer des noms de sommets en fonction de ce qui existe déjà
-        existing_numeric = [n for n in self.nodes if n.isdigit()]
-        existing_alpha = [n for n in self.nodes if n.isalpha()]
-        
-        new_nodes = []
-        if len(existing_alpha) <= len(existing_numeric):
-            # Générer des identifiants alphabétiques
-            start_char = ord('A')
-            for i in range(num_nodes):
-                node_id = chr(start_char + i)
-                while node_id in self.nodes:
-                    start_char += 1
-                    node_id = chr(start_char)
-                new_nodes.append(node_id)
-        else:
-            # Générer des identifiants numériques
-            start_num = 1
-            for i in range(num_nodes):
-                node_id = str(start_num + i)
-                while node_id in self.nodes:
-                    start_num += 1
-                    node_id = str(start_num)
-                new_nodes.append(node_id)
-        
-        # Ajouter tous les nouveaux sommets
-        for node_id in new_nodes:
-            self.nodes.append(node_id)
+        # Poursuivre la numérotation après le plus grand identifiant entier existant
+        start = max((n for n in self.nodes if isinstance(n, int)), default=-1) + 1
         
-        # Mettre à jour les tableaux
-        self.update_tables()
-        
-        # Mettre à jour les listes déroulantes
-        self.update_node_comboboxes()
+        # Ajouter tous les nouveaux sommets en une seule insertion
+        self.node_model.append_nodes(list(range(start, start + num_nodes)))
         
         # Mettre à jour la visualisation
         self.update_graph_view()
     
     def add_edge(self):
         """Ajouter une nouvelle arête au graphe"""
-        source = self.edge_source.currentText()
-        target = self.edge_target.currentText()
+        if self.edge_source.currentIndex() < 0 or self.edge_target.currentIndex() < 0:
+            return
+        source = self.nodes[self.edge_source.currentIndex()]
+        target = self.nodes[self.edge_target.currentIndex()]
         weight = self.edge_weight.value()
         
         if source == target:
             QMessageBox.warning(self, "Arête Invalide", "Les boucles sur un même sommet ne sont pas autorisées")
             return
         
-        # Vérifier si l'arête existe déjà
-        for edge in self.edges:
-            if (edge[0] == source and edge[1] == target) or (edge[0] == target and edge[1] == source):
-                QMessageBox.warning(self, "Arête en Double", f"Une arête entre {source} et {target} existe déjà")
-                return
-        
-        # Ajouter à la liste interne
-        self.edges.append((source, target, weight))
-        
-        # Ajouter au tableau
-        row = self.edge_table.rowCount()
-        self.edge_table.insertRow(row)
-        self.edge_table.setItem(row, 0, QTableWidgetItem(source))
-        self.edge_table.setItem(row, 1, QTableWidgetItem(target))
-        self.edge_table.setItem(row, 2, QTableWidgetItem(str(weight)))
+        # Vérifier si l'arête existe déjà (recherche dans l'index haché)
+        if self.edge_model.has_edge(source, target):
+            QMessageBox.warning(self, "Arête en Double", f"Une arête entre {source} et {target} existe déjà")
+            return
         
-        # Ajouter un bouton de suppression
-        delete_btn = QPushButton("Supprimer")
-        delete_btn.clicked.connect(lambda: self.delete_edge(row))
-        self.edge_table.setCellWidget(row, 3, delete_btn)
+        # Ajouter au modèle (une seule ligne insérée)
+        self.edge_model.append_edges([(source, target, weight)])
         
         # Mettre à jour la visualisation
         self.update_graph_view()
@@ -347,132 +749,74 @@ class CustomGraphDialog(QDialog):
     def delete_edge(self, row):
         """Supprimer une arête en fonction de sa ligne dans le tableau"""
         if 0 <= row < len(self.edges):
-            # Supprimer de la liste des arêtes
-            del self.edges[row]
-            
-            # Mettre à jour les tableaux
-            self.update_tables()
+            self.edge_model.remove_rows([row])
             
             # Mettre à jour la visualisation
             self.update_graph_view()
     
+    def delete_selected_edges(self):
+        """Supprimer les arêtes sélectionnées dans le tableau"""
+        rows = [index.row() for index in self.edge_table.selectionModel().selectedRows()]
+        if rows:
+            self.edge_model.remove_rows(rows)
+            self.update_graph_view()
+    
     def generate_edges(self):
         """Générer des arêtes selon le modèle sélectionné"""
-        if len(self.nodes) < 2:
+        n = len(self.nodes)
+        if n < 2:
             QMessageBox.warning(self, "Pas Assez de Sommets", "Au moins 2 sommets sont requis pour créer des arêtes")
             return
         
-        # Effacer les arêtes existantes
-        self.edges = []
-        
+        rng = self.make_rng()
         edge_type = self.edge_type.currentText()
         
+        # Les générateurs travaillent sur des indices de sommets ; les arêtes générées remplacent les existantes
         if edge_type == "Graphe Complet":
             # Créer des arêtes entre toutes les paires de sommets
-            for i in range(len(self.nodes)):
-                for j in range(i + 1, len(self.nodes)):
-                    weight = round(random.uniform(1, 10), 1)
-                    self.edges.append((self.nodes[i], self.nodes[j], weight))
+            sources, targets = complete_edge_indices(n)
                     
         elif edge_type == "Arêtes Aléatoires":
-            # Créer des arêtes aléatoires selon la densité
-            density = self.edge_density.value()
-            max_edges = len(self.nodes) * (len(self.nodes) - 1) // 2
-            num_edges = int(max_edges * density)
-            
-            # Créer une liste de toutes les arêtes possibles
-            possible_edges = []
-            for i in range(len(self.nodes)):
-                for j in range(i + 1, len(self.nodes)):
-                    possible_edges.append((self.nodes[i], self.nodes[j]))
-            
-            # Sélectionner des arêtes aléatoirement
-            selected_edges = random.sample(possible_edges, min(num_edges, len(possible_edges)))
-            
-            # Ajouter des poids
-            for edge in selected_edges:
-                weight = round(random.uniform(1, 10), 1)
-                self.edges.append((edge[0], edge[1], weight))
+            # G(n, p) : chaque paire est retenue avec la probabilité donnée par la densité
+            sources, targets = gnp_edge_indices(n, self.edge_density.value(), rng)
+            if self.ensure_connected.isChecked():
+                sources, targets = merge_edge_indices(n, (sources, targets), random_tree_edge_indices(n, rng))
                 
         elif edge_type == "Arbre Couvrant Minimal":
             # Créer un graphe acyclique connexe (un arbre)
-            # D'abord créer une liste de tous les sommets
-            remaining_nodes = self.nodes[1:]
-            connected_nodes = [self.nodes[0]]
-            
-            # Connecter chaque sommet restant à un sommet aléatoire déjà dans l'arbre
-            for node in remaining_nodes:
-                connect_to = random.choice(connected_nodes)
-                weight = round(random.uniform(1, 10), 1)
-                self.edges.append((node, connect_to, weight))
-                connected_nodes.append(node)
+            sources, targets = random_tree_edge_indices(n, rng)
                 
         elif edge_type == "Cycle/Anneau":
             # Créer une connexion circulaire
-            for i in range(len(self.nodes)):
-                next_idx = (i + 1) % len(self.nodes)
-                weight = round(random.uniform(1, 10), 1)
-                self.edges.append((self.nodes[i], self.nodes[next_idx], weight))
+            sources, targets = ring_edge_indices(n)
+        
+        weights = random_weights(len(sources), rng)
         
-        # Mettre à jour le tableau des arêtes
-        self.update_tables()
+        # Convertir les indices en identifiants de sommets en une seule opération
+        node_ids = np.empty(n, dtype=object)
+        node_ids[:] = self.nodes
+        source_ids = node_ids[sources].tolist()
+        target_ids = node_ids[targets].tolist()
+        new_edges = list(zip(source_ids, target_ids, weights.tolist()))
+        edge_keys = {EdgeTableModel.edge_key(source, target) for source, target in zip(source_ids, target_ids)}
+        
+        # Mettre à jour le tableau des arêtes en une seule réinitialisation du modèle
+        self.edge_model.set_edges(new_edges, edge_keys)
         
         # Mettre à jour la visualisation
         self.update_graph_view()
     
-    def update_tables(self):
-        """Mettre à jour complètement les tableaux de sommets et d'arêtes"""
-        # Effacer et mettre à jour le tableau des sommets
-        self.node_table.setRowCount(0)
-        for node_id in self.nodes:
-            row = self.node_table.rowCount()
-            self.node_table.insertRow(row)
-            self.node_table.setItem(row, 0, QTableWidgetItem(node_id))
-            
-            # Ajouter un bouton de suppression
-            delete_btn = QPushButton("Supprimer")
-            delete_btn.clicked.connect(lambda checked, n=node_id: self.delete_node(n))
-            self.node_table.setCellWidget(row, 1, delete_btn)
-        
-        # Effacer et mettre à jour le tableau des arêtes
-        self.edge_table.setRowCount(0)
-        for i, (source, target, weight) in enumerate(self.edges):
-            row = self.edge_table.rowCount()
-            self.edge_table.insertRow(row)
-            self.edge_table.setItem(row, 0, QTableWidgetItem(source))
-            self.edge_table.setItem(row, 1, QTableWidgetItem(target))
-            self.edge_table.setItem(row, 2, QTableWidgetItem(str(weight)))
-            
-            # Ajouter un bouton de suppression
-            delete_btn = QPushButton("Supprimer")
-            delete_btn.clicked.connect(lambda checked, r=i: self.delete_edge(r))
-            self.edge_table.setCellWidget(row, 3, delete_btn)
-    
-    def update_node_comboboxes(self):
-        """Mettre à jour les listes déroulantes de sélection des sommets"""
-        # Stocker les sélections actuelles
-        current_source = self.edge_source.currentText()
-        current_target = self.edge_target.currentText()
-        
-        # Effacer et repeupler
-        self.edge_source.clear()
-        self.edge_target.clear()
-        
-        self.edge_source.addItems(self.nodes)
-        self.edge_target.addItems(self.nodes)
-        
-        # Restaurer les sélections si possible
-        source_idx = self.edge_source.findText(current_source)
-        if source_idx >= 0:
-            self.edge_source.setCurrentIndex(source_idx)
-        
-        target_idx = self.edge_target.findText(current_target)
-        if target_idx >= 0:
-            self.edge_target.setCurrentIndex(target_idx)
+    def make_rng(self):
+        """Générateur NumPy initialisé avec la graine choisie (ou une nouvelle graine, mémorisée)"""
+        seed = self.seed_input.value()
+        if seed < 0:
+            seed = int(np.random.SeedSequence().generate_state(1)[0] & 0x7FFFFFFF)
+        self.last_seed = seed
+        return np.random.default_rng(seed)
     
     def update_graph_view(self):
-        """Mettre à jour la visualisation du graphe"""
-        self.graph_drawing.update_graph(self.nodes, self.edges)
+        """Mettre à jour la visualisation du graphe (différée, voir GraphDrawingArea.request_update)"""
+        self.graph_drawing.request_update(self.nodes, self.edges)
     
     def clear_all(self):
         """Effacer tous les sommets et arêtes"""
@@ -481,11 +825,58 @@ class CustomGraphDialog(QDialog):
                                          "Êtes-vous sûr de vouloir effacer tous les sommets et arêtes?",
                                          QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.Yes:
-                self.nodes = []
-                self.edges = []
-                self.update_tables()
-                self.update_node_comboboxes()
-                self.update_graph_view()
+                with self.graph_drawing.batch():
+                    self.edge_model.set_edges([])
+                    self.node_model.clear()
+                    self.update_graph_view()
+    
+    def import_graph_file(self):
+        """Charger un graphe depuis un fichier (remplace le graphe en cours d'édition)"""
+        if self.file_thread and self.file_thread.isRunning():
+            return
+        choice = ask_graph_import(self)
+        if not choice:
+            return
+        filename, file_format, options = choice
+        
+        self.file_thread = GraphFileThread(filename, file_format=file_format, options=options)
+        self.file_thread.result_ready.connect(lambda graph: self.on_graph_imported(graph, filename))
+        start_graph_file_thread(self, self.file_thread, f"Lecture de {os.path.basename(filename)}...")
+    
+    def on_graph_imported(self, graph, filename):
+        """Remplacer le contenu des modèles par le graphe importé"""
+        if graph is None:
+            return
+        with self.graph_drawing.batch():
+            self.node_model.clear()
+            self.node_model.append_nodes(list(graph.nodes()))
+            self.edge_model.set_edges(graph.edges(data="weight", default=1.0))
+            self.graph_name.setText(os.path.splitext(os.path.basename(filename))[0])
+            self.update_graph_view()
+    
+    def export_graph_file(self):
+        """Enregistrer le graphe en cours d'édition dans un fichier"""
+        if self.file_thread and self.file_thread.isRunning():
+            return
+        if not self.nodes:
+            QMessageBox.warning(self, "Graphe Vide", "Veuillez ajouter au moins un sommet")
+            return
+        filename, _ = QFileDialog.getSaveFileName(self, "Exporter le Graphe", self.graph_name.text(), file_dialog_filter())
+        if not filename:
+            return
+        
+        graph = nx.Graph()
+        graph.add_nodes_from(self.nodes)
+        graph.add_weighted_edges_from(self.edges)
+        self.file_thread = GraphFileThread(filename, graph=graph)
+        start_graph_file_thread(self, self.file_thread, f"Écriture de {os.path.basename(filename)}...")
+    
+    def reject(self):
+        """Interrompre une lecture ou écriture en cours avant de fermer"""
+        if self.file_thread and self.file_thread.isRunning():
+            self.file_thread.cancel()
+            self.file_thread.wait()
+        super().reject()
     
     def create_graph(self):
         """Créer et retourner le graphe final"""
@@ -497,15 +888,18 @@ class CustomGraphDialog(QDialog):
         graph = nx.Graph()
         
         # Ajouter les sommets
-        for node_id in self.nodes:
-            graph.add_node(node_id)
+        graph.add_nodes_from(self.nodes)
         
         # Ajouter les arêtes
-        for source, target, weight in self.edges:
-            # Si l'option de poids aléatoires est cochée, remplacer les poids
-            if self.randomize_weights.isChecked():
-                weight = round(random.uniform(1, 10), 1)
-            graph.add_edge(source, target, weight=weight)
+        # Si l'option de poids aléatoires est cochée, remplacer les poids
+        if self.randomize_weights.isChecked():
+            weights = random_weights(len(self.edges), self.make_rng()).tolist()
+            graph.add_weighted_edges_from((source, target, weight) for (source, target, _), weight in zip(self.edges, weights))
+        else:
+            graph.add_weighted_edges_from(self.edges)
+        
+        # Graine de la dernière génération (None si le graphe a été saisi à la main)
+        graph.graph["seed"] = self.last_seed
         
         # Valider le graphe
         if not self.validate_graph(graph):
@@ -524,7 +918,7 @@ class CustomGraphDialog(QDialog):
             return False
         
         # Avertir des graphes déconnectés
-        if not nx.is_connected(graph) and graph.number_of_nodes() > 1:
+        if len(graph_components(graph)) > 1:
             reply = QMessageBox.question(self, "Graphe Déconnecté", 
                                          "Votre graphe a des composantes déconnectées. Cela donnera une forêt plutôt qu'un arbre. Continuer quand même?",
                                          QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
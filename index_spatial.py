@@ -0,0 +1,398 @@
+import math
+
+from noyau_kruskal import EdgeArrays
+
+# Nombre moyen de points par cellule visé par la grille
+DEFAULT_POINTS_PER_CELL = 4
+# Nombre maximal de points par feuille de l'arbre k-d
+DEFAULT_LEAF_SIZE = 16
+# Budget de cases (requêtes × candidats) des matrices de candidats, traitées par blocs
+DEFAULT_BLOCK_ENTRIES = 1 << 22
+# Marge relative des élagages de l'arbre k-d : une borne (racine d'une somme de carrés) remise au carré, ou une
+# distance de boîtes sommée dans un autre ordre, peut différer de quelques ulp et écarter un voisin situé
+# exactement à la borne
+PRUNING_SLACK = 1e-9
+
+# k plus proches candidats de chaque requête, en positions dans l'ordre de l'index (columns, labels et queries
+# suivent cet ordre : les plages de candidats sont contiguës en mémoire). Chaque morceau (rows, starts, counts)
+# ajoute à la ligne rows[i] les positions starts[i]:starts[i] + counts[i]. Matrice (requêtes × candidats) complétée
+# par +inf, puis sélection partielle par ligne. Avec labels, les candidats de même étiquette que la requête sont
+# exclus (sinon, seulement la requête elle-même). Retourne les indices d'origine (order) et les distances
+def _select_nearest(columns, order, queries, pieces, k, labels=None):
+    import numpy as np
+    num_queries = len(queries)
+    filled = np.zeros(num_queries, dtype=np.int64)
+    placed = []
+    for rows, starts, counts in pieces:
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        # Plusieurs plages pour une même ligne : décalage de chacune dans la ligne (lignes triées)
+        by_row = np.argsort(rows, kind="stable")
+        rows, starts, counts = rows[by_row], starts[by_row], counts[by_row]
+        before = np.cumsum(counts) - counts
+        offsets = filled[rows] + before - before[np.searchsorted(rows, rows)]
+        local = np.arange(total) - np.repeat(before, counts)
+        placed.append((np.repeat(rows, counts), np.repeat(offsets, counts) + local,
+                       np.repeat(starts, counts) + local))
+        np.add.at(filled, rows, counts)
+    width = max(int(filled.max(initial=0)), k + 1)
+    candidates = np.full((num_queries, width), -1, dtype=np.int64)
+    for pair_rows, positions, targets in placed:
+        candidates[pair_rows, positions] = targets
+    squared = np.zeros(candidates.shape)
+    for column in columns:
+        squared += (column[candidates] - column[queries][:, None]) ** 2
+    # Les cases vides et le point lui-même (ou les points de même étiquette) ne sont jamais retenus
+    excluded = candidates == queries[:, None] if labels is None else labels[candidates] == labels[queries][:, None]
+    squared[(candidates == -1) | excluded] = np.inf
+    best = np.argpartition(squared, k - 1, axis=1)[:, :k]
+    best_squared = np.take_along_axis(squared, best, axis=1)
+    ranked = np.argsort(best_squared, axis=1, kind="stable")
+    best = np.take_along_axis(best, ranked, axis=1)
+    best_squared = np.take_along_axis(best_squared, ranked, axis=1)
+    indices = np.where(np.isfinite(best_squared), order[np.take_along_axis(candidates, best, axis=1)], -1)
+    return indices, np.sqrt(best_squared)
+
+# Blocs de requêtes (positions) dont lignes × largeur maximale reste sous le budget : les requêtes sont groupées
+# par nombre de candidats croissant
+def _blocks(totals, max_block_entries):
+    import numpy as np
+    by_total = np.argsort(totals, kind="stable")
+    totals = np.maximum(totals[by_total], 1)
+    block_start = 0
+    while block_start < len(totals):
+        window = totals[block_start:block_start + max_block_entries // totals[block_start] + 1]
+        fits = max_block_entries // window >= np.arange(1, len(window) + 1)
+        block_end = block_start + max(1, int(np.argmin(fits)) if not fits.all() else len(fits))
+        yield by_total[block_start:block_end]
+        block_start = block_end
+
+# Index spatial en grille uniforme pour un nuage de N points en dimension d (tableau N×d) : les points sont triés
+# par cellule (order), cell_starts/cell_counts donnent la plage de chaque cellule. Adapté aux points de densité
+# à peu près uniforme en petite dimension (2 ou 3), où un voisinage de (2r+1)^d cellules reste petit
+class GridIndex:
+    def __init__(self, points, points_per_cell=DEFAULT_POINTS_PER_CELL):
+        import numpy as np
+        self.points = np.ascontiguousarray(points, dtype=np.float64)
+        if self.points.ndim != 2:
+            raise ValueError("Les points doivent former un tableau N×d")
+        num_points, dimension = self.points.shape
+        low = self.points.min(axis=0) if num_points else np.zeros(dimension)
+        span = self.points.max(axis=0) - low if num_points else np.zeros(dimension)
+
+        # Côté des cellules : volume de la boîte englobante (dimensions non plates) / nombre de cellules visé
+        flat = span <= 0
+        spread = span[~flat]
+        if len(spread) and num_points > points_per_cell:
+            volume_per_cell = math.exp(np.log(spread).sum()) * points_per_cell / num_points
+            self.cell_size = volume_per_cell ** (1 / len(spread))
+        else:
+            self.cell_size = float(spread.max()) if len(spread) else 1.0
+        self.shape = np.where(flat, 1, np.floor(span / self.cell_size).astype(np.int64) + 1)
+        # Au plus environ N cellules (et des identifiants qui tiennent sur 64 bits)
+        while np.prod(self.shape.astype(np.float64)) > max(num_points, 1) * 2:
+            self.cell_size *= 1.25
+            self.shape = np.where(flat, 1, np.floor(span / self.cell_size).astype(np.int64) + 1)
+        self.low = low
+
+        cells = np.minimum(((self.points - low) / self.cell_size).astype(np.int64), self.shape - 1)
+        cell_ids = np.ravel_multi_index(cells.T, self.shape) if num_points else np.empty(0, dtype=np.int64)
+        self.order = np.argsort(cell_ids, kind="stable")
+        self.cells = cells
+        self.position = np.empty(num_points, dtype=np.int64)
+        self.position[self.order] = np.arange(num_points)
+        # Début et nombre de points de chaque cellule (au plus ~2N cellules : tables denses)
+        self.cell_counts = np.bincount(cell_ids, minlength=int(np.prod(self.shape)))
+        self.cell_starts = np.cumsum(self.cell_counts) - self.cell_counts
+        # Coordonnées par dimension dans l'ordre de l'index (tableaux contigus : extraction par indices plus rapide)
+        self.columns = [np.ascontiguousarray(self.points[self.order, axis]) for axis in range(dimension)]
+
+    def __len__(self):
+        return len(self.points)
+
+    # Voisinage de Tchebychev radius de la cellule de chaque point de queries : pour chaque décalage de cellule,
+    # lignes (positions dans queries) des cellules voisines valides, début et nombre de points de ces cellules
+    def _neighbourhood(self, queries, radius):
+        import numpy as np
+        from itertools import product
+        for offset in product(range(-radius, radius + 1), repeat=len(self.shape)):
+            neighbours = self.cells[queries] + np.array(offset, dtype=np.int64)
+            rows = np.flatnonzero(((neighbours >= 0) & (neighbours < self.shape)).all(axis=1))
+            if not len(rows):
+                continue
+            neighbour_ids = np.ravel_multi_index(neighbours[rows].T, self.shape)
+            yield rows, self.cell_starts[neighbour_ids], self.cell_counts[neighbour_ids]
+
+    # k plus proches candidats de chaque point de queries dans son voisinage de rayon radius (tableaux len(queries)×k,
+    # -1 et +inf si moins de k candidats), par blocs de taille bornée
+    def search(self, queries, radius, k, labels=None, max_block_entries=DEFAULT_BLOCK_ENTRIES):
+        import numpy as np
+        indices = np.full((len(queries), k), -1, dtype=np.int64)
+        distances = np.full((len(queries), k), np.inf)
+        totals = np.zeros(len(queries), dtype=np.int64)
+        for rows, _, counts in self._neighbourhood(queries, radius):
+            totals[rows] += counts
+        placed_labels = labels[self.order] if labels is not None else None
+        for rows in _blocks(np.maximum(totals, k + 1), max_block_entries):
+            block = queries[rows]
+            indices[rows], distances[rows] = _select_nearest(self.columns, self.order, self.position[block],
+                                                             self._neighbourhood(block, radius), k, placed_labels)
+        return indices, distances
+
+    # Les k plus proches voisins de chaque point (lui-même exclu) : tableaux N×k d'indices et de distances,
+    # par distance croissante. Exact : un point est résolu quand sa k-ième distance est couverte par le voisinage
+    # parcouru (radius cellules), sinon le voisinage double pour les seuls points non résolus
+    def knn(self, k, max_block_entries=DEFAULT_BLOCK_ENTRIES):
+        import numpy as np
+        num_points = len(self.points)
+        k = min(k, num_points - 1)
+        indices = np.full((num_points, max(k, 0)), -1, dtype=np.int64)
+        distances = np.full((num_points, max(k, 0)), np.inf)
+        if k <= 0:
+            return indices, distances
+
+        pending = np.arange(num_points)
+        radius = 1
+        while len(pending):
+            found, gaps = self.search(pending, radius, k, max_block_entries=max_block_entries)
+            indices[pending], distances[pending] = found, gaps
+            # Tout point à distance <= radius * côté est dans le voisinage parcouru
+            if radius >= self.shape.max():
+                break
+            pending = pending[gaps[:, -1] > radius * self.cell_size]
+            radius *= 2
+        return indices, distances
+
+# Distances minimale et maximale entre deux séries de boîtes (coins low/high), ligne à ligne
+def _box_distances(low_a, high_a, low_b, high_b):
+    import numpy as np
+    gaps = np.maximum(np.maximum(low_b - high_a, low_a - high_b), 0)
+    spans = np.maximum(high_a - low_b, high_b - low_a)
+    return np.sqrt((gaps ** 2).sum(axis=1)), np.sqrt((spans ** 2).sum(axis=1))
+
+# Arbre k-d implicite sur un nuage de N points N×d : chaque nœud est une plage contiguë des points triés (order),
+# coupée en son milieu selon la dimension la plus étendue. Tous les niveaux sont complets : le nœud j du niveau L
+# couvre les positions [j N / 2^L, (j + 1) N / 2^L). Les feuilles ont au plus leaf_size points.
+# Contrairement à la grille, il s'adapte aux données très groupées (amas denses séparés par du vide)
+class KDTree:
+    def __init__(self, points, leaf_size=DEFAULT_LEAF_SIZE):
+        import numpy as np
+        self.points = np.ascontiguousarray(points, dtype=np.float64)
+        if self.points.ndim != 2:
+            raise ValueError("Les points doivent former un tableau N×d")
+        num_points, dimension = self.points.shape
+        self.depth = 0
+        while num_points > leaf_size << self.depth:
+            self.depth += 1
+
+        # Construction niveau par niveau : tri de chaque nœud selon sa dimension de coupe (clé nœud + fraction)
+        order = np.arange(num_points)
+        for level in range(self.depth):
+            bounds = self._bounds(level, num_points)
+            node_of = np.repeat(np.arange(1 << level), np.diff(bounds))
+            placed = self.points[order]
+            low = np.minimum.reduceat(placed, bounds[:-1], axis=0)
+            high = np.maximum.reduceat(placed, bounds[:-1], axis=0)
+            axis = np.argmax(high - low, axis=1)
+            span = np.maximum((high - low)[np.arange(1 << level), axis], 1e-300)
+            fraction = (placed[np.arange(num_points), axis[node_of]] - low[node_of, axis[node_of]]) / span[node_of]
+            order = order[np.argsort(node_of + fraction / (1 + 1e-9), kind="stable")]
+        self.order = order
+        self.position = np.empty(num_points, dtype=np.int64)
+        self.position[order] = np.arange(num_points)
+        self.columns = [np.ascontiguousarray(self.points[order, axis]) for axis in range(dimension)]
+
+        # Boîtes englobantes de tous les nœuds, des feuilles vers la racine
+        self.leaf_bounds = self._bounds(self.depth, num_points)
+        placed = self.points[order]
+        if num_points:
+            self.low = [np.minimum.reduceat(placed, self.leaf_bounds[:-1], axis=0)]
+            self.high = [np.maximum.reduceat(placed, self.leaf_bounds[:-1], axis=0)]
+        else:
+            self.low = [np.zeros((1, dimension))]
+            self.high = [np.zeros((1, dimension))]
+        for _ in range(self.depth):
+            self.low.insert(0, np.minimum(self.low[0][0::2], self.low[0][1::2]))
+            self.high.insert(0, np.maximum(self.high[0][0::2], self.high[0][1::2]))
+
+    # Débuts des 2^level nœuds d'un niveau (et fin du dernier)
+    @staticmethod
+    def _bounds(level, num_points):
+        import numpy as np
+        return (np.arange((1 << level) + 1, dtype=np.int64) * num_points) >> level
+
+    def __len__(self):
+        return len(self.points)
+
+    # Feuille de chaque point
+    def leaf_of(self, points):
+        import numpy as np
+        return np.searchsorted(self.leaf_bounds, self.position[points], side="right") - 1
+
+    # Étiquette de chaque nœud, niveau par niveau : étiquette commune de ses points, -1 s'ils en ont plusieurs
+    def node_labels(self, labels):
+        import numpy as np
+        placed = labels[self.order]
+        if not len(placed):
+            return [np.full(1, -1, dtype=np.int64) for _ in range(self.depth + 1)]
+        low = np.minimum.reduceat(placed, self.leaf_bounds[:-1])
+        high = np.maximum.reduceat(placed, self.leaf_bounds[:-1])
+        levels = [np.where(low == high, low, -1)]
+        for _ in range(self.depth):
+            left, right = levels[0][0::2], levels[0][1::2]
+            levels.insert(0, np.where(left == right, left, -1))
+        return levels
+
+    # Parcours simultané de l'arbre pour des feuilles requêtes : paires (requête, nœud) développées niveau par
+    # niveau, éliminées dès que la distance minimale entre boîtes dépasse la borne supérieure de la requête.
+    # Les bornes se resserrent en chemin par la distance maximale vers un nœud qui garantit un candidat à chaque
+    # point de la feuille : au moins min_count points (k plus proches voisins), ou un point d'une autre étiquette
+    # (node_labels : les nœuds de même étiquette que la feuille sont écartés). Avec group_bounds (borne par
+    # étiquette, mise à jour), toutes les feuilles d'une même étiquette partagent leur meilleure borne.
+    # Retourne les paires (indice de la requête, feuille candidate)
+    def _candidate_leaves(self, query_leaves, upper, min_count=None, node_labels=None, group_bounds=None):
+        import numpy as np
+        num_points = len(self.points)
+        upper = upper.copy()
+        query_low, query_high = self.low[-1][query_leaves], self.high[-1][query_leaves]
+        query_labels = node_labels[-1][query_leaves] if node_labels is not None else None
+        grouped = np.flatnonzero(query_labels >= 0) if group_bounds is not None else None
+        if node_labels is not None:
+            # Une feuille à plusieurs étiquettes offre à chacun de ses points un candidat dans sa propre boîte
+            mixed = query_labels < 0
+            upper[mixed] = np.minimum(upper[mixed], np.sqrt(((query_high - query_low)[mixed] ** 2).sum(axis=1)))
+        pair_queries = np.arange(len(query_leaves))
+        pair_nodes = np.zeros(len(query_leaves), dtype=np.int64)
+        for level in range(1, self.depth + 1):
+            pair_queries = np.repeat(pair_queries, 2)
+            pair_nodes = np.repeat(2 * pair_nodes, 2) + np.tile([0, 1], len(pair_nodes))
+            if node_labels is not None:
+                same = node_labels[level][pair_nodes] == query_labels[pair_queries]
+                keep = ~same | (query_labels[pair_queries] < 0)
+                pair_queries, pair_nodes = pair_queries[keep], pair_nodes[keep]
+            nearest, farthest = _box_distances(query_low[pair_queries], query_high[pair_queries],
+                                               self.low[level][pair_nodes], self.high[level][pair_nodes])
+            if min_count is not None:
+                sizes = np.diff(self._bounds(level, num_points))[pair_nodes]
+                guarantees = sizes >= min_count
+            else:
+                # Nœud d'une autre étiquette (ou mixte) vu d'une feuille d'une seule étiquette
+                guarantees = query_labels[pair_queries] >= 0
+            np.minimum.at(upper, pair_queries[guarantees], farthest[guarantees])
+            if grouped is not None and len(grouped):
+                np.minimum.at(group_bounds, query_labels[grouped], upper[grouped])
+                upper[grouped] = np.minimum(upper[grouped], group_bounds[query_labels[grouped]])
+            keep = nearest <= upper[pair_queries] * (1 + PRUNING_SLACK)
+            pair_queries, pair_nodes = pair_queries[keep], pair_nodes[keep]
+        return pair_queries, pair_nodes
+
+    # k plus proches candidats de chaque point de queries dans les feuilles candidates de sa feuille
+    # (pair_queries indexe query_leaves), par blocs de taille bornée. Avec upper (borne par point), les feuilles
+    # dont la boîte est plus loin que la borne du point ne sont pas examinées
+    def _search_leaves(self, queries, query_leaves, pair_queries, pair_nodes, k, labels=None, upper=None,
+                       max_block_entries=DEFAULT_BLOCK_ENTRIES):
+        import numpy as np
+        indices = np.full((len(queries), k), -1, dtype=np.int64)
+        distances = np.full((len(queries), k), np.inf)
+        # Paires regroupées par requête ; chaque point hérite des paires de sa feuille
+        by_query = np.argsort(pair_queries, kind="stable")
+        pair_queries, pair_nodes = pair_queries[by_query], pair_nodes[by_query]
+        first_pair = np.searchsorted(pair_queries, np.arange(len(query_leaves)))
+        pair_counts = np.searchsorted(pair_queries, np.arange(len(query_leaves)), side="right") - first_pair
+        leaf_sizes = np.diff(self.leaf_bounds)
+        pair_totals = np.concatenate([[0], np.cumsum(leaf_sizes[pair_nodes])])
+        query_index = np.searchsorted(query_leaves, self.leaf_of(queries))
+        placed_labels = labels[self.order] if labels is not None else None
+        totals = pair_totals[first_pair + pair_counts] - pair_totals[first_pair]
+        for rows in _blocks(np.maximum(totals[query_index], k + 1), max_block_entries):
+            block_queries = query_index[rows]
+            counts = pair_counts[block_queries]
+            pairs = np.repeat(first_pair[block_queries] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            leaves = pair_nodes[pairs]
+            pair_rows = np.repeat(np.arange(len(rows)), counts)
+            if upper is not None:
+                points = self.points[queries[rows]][pair_rows]
+                gaps = np.maximum(np.maximum(self.low[-1][leaves] - points, points - self.high[-1][leaves]), 0)
+                near = (gaps ** 2).sum(axis=1) <= (upper[rows][pair_rows] * (1 + PRUNING_SLACK)) ** 2
+                pair_rows, leaves = pair_rows[near], leaves[near]
+            pieces = [(pair_rows, self.leaf_bounds[leaves], leaf_sizes[leaves])]
+            indices[rows], distances[rows] = _select_nearest(self.columns, self.order, self.position[queries[rows]],
+                                                             pieces, k, placed_labels)
+        return indices, distances
+
+    # Les k plus proches voisins de chaque point (lui-même exclu) : tableaux N×k d'indices et de distances,
+    # par distance croissante (exact)
+    def knn(self, k, max_block_entries=DEFAULT_BLOCK_ENTRIES):
+        import numpy as np
+        num_points = len(self.points)
+        k = min(k, num_points - 1)
+        if k <= 0:
+            return np.full((num_points, max(k, 0)), -1, dtype=np.int64), np.full((num_points, max(k, 0)), np.inf)
+        leaves = np.arange(1 << self.depth)
+        # Requêtes dans l'ordre de l'arbre : les points d'une même feuille partagent leurs candidats
+        queries = self.order
+        # Première borne : k plus proches voisins dans le plus petit ancêtre d'au moins k + 1 points ; la borne
+        # d'une feuille est la plus grande k-ième distance de ses points
+        shift = 0
+        while shift < self.depth and num_points >> (self.depth - shift) < k + 1:
+            shift += 1
+        width = 1 << shift
+        seed_nodes = np.repeat((leaves >> shift) << shift, width) + np.tile(np.arange(width), len(leaves))
+        _, seed_distances = self._search_leaves(queries, leaves, np.repeat(leaves, width), seed_nodes, k,
+                                                max_block_entries=max_block_entries)
+        upper = np.zeros(len(leaves))
+        np.maximum.at(upper, self.leaf_of(queries), seed_distances[:, -1])
+        pair_queries, pair_nodes = self._candidate_leaves(leaves, upper, min_count=k + 1)
+        found, gaps = self._search_leaves(queries, leaves, pair_queries, pair_nodes, k, upper=seed_distances[:, -1],
+                                          max_block_entries=max_block_entries)
+        indices = np.empty_like(found)
+        distances = np.empty_like(gaps)
+        indices[queries], distances[queries] = found, gaps
+        return indices, distances
+
+    # Plus proche point d'une autre étiquette pour chaque point de queries (indices et distances, -1 et +inf si
+    # aucun n'est trouvé sous la borne). upper borne la distance utile de chaque requête : les points plus loin ne
+    # sont pas cherchés. group_bounds (borne par étiquette, mise à jour) partage les bornes d'une même étiquette
+    def nearest_other(self, queries, labels, upper=None, group_bounds=None, max_block_entries=DEFAULT_BLOCK_ENTRIES):
+        import numpy as np
+        upper = np.full(len(queries), np.inf) if upper is None else np.asarray(upper, dtype=np.float64)
+        # Requêtes dans l'ordre de l'arbre : les points d'une même feuille partagent leurs candidats
+        in_tree_order = np.argsort(self.position[queries], kind="stable")
+        queries, upper = queries[in_tree_order], upper[in_tree_order]
+        leaves = self.leaf_of(queries)
+        query_leaves = leaves[np.concatenate(([True], leaves[1:] != leaves[:-1]))]
+        # Borne d'une feuille : la plus large de ses requêtes
+        leaf_upper = np.full(len(query_leaves), -np.inf)
+        np.maximum.at(leaf_upper, np.searchsorted(query_leaves, leaves), upper)
+        pair_queries, pair_nodes = self._candidate_leaves(query_leaves, leaf_upper,
+                                                          node_labels=self.node_labels(labels),
+                                                          group_bounds=group_bounds)
+        if group_bounds is not None:
+            upper = np.minimum(upper, group_bounds[labels[queries]])
+        found, gaps = self._search_leaves(queries, query_leaves, pair_queries, pair_nodes, 1, labels, upper,
+                                          max_block_entries)
+        indices = np.empty(len(queries), dtype=np.int64)
+        distances = np.empty(len(queries))
+        indices[in_tree_order], distances[in_tree_order] = found[:, 0], gaps[:, 0]
+        return indices, distances
+
+# Graphe des k plus proches voisins (non orienté, sans doublons) d'un nuage de points N×d, pondéré par la distance
+# euclidienne : O(N k) arêtes au lieu des N(N-1)/2 du graphe complet. points peut aussi être un index déjà construit
+# (KDTree par défaut, qui s'adapte aux amas ; GridIndex pour des points de densité uniforme)
+def knn_edges(points, k=10, leaf_size=DEFAULT_LEAF_SIZE):
+    import numpy as np
+    index = points if isinstance(points, (GridIndex, KDTree)) else KDTree(points, leaf_size)
+    num_points = len(index)
+    neighbours, _ = index.knn(k)
+    sources = np.repeat(np.arange(num_points), neighbours.shape[1])
+    targets = neighbours.ravel()
+    found = targets >= 0
+    sources, targets = sources[found], targets[found]
+    low, high = np.minimum(sources, targets), np.maximum(sources, targets)
+    # Tri puis masque plutôt que np.unique (voir _simple_pairs)
+    keys = np.sort(low * num_points + high)
+    keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))] if len(keys) else keys
+    sources, targets = keys // num_points, keys % num_points
+    weights = np.sqrt(((index.points[sources] - index.points[targets]) ** 2).sum(axis=1))
+    return EdgeArrays(num_points, sources, targets, weights)
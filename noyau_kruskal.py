@@ -1,7 +1,14 @@
 import networkx as nx
-import matplotlib.pyplot as plt
 import random
-from itertools import combinations
+import heapq
+import os
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import partial
+from itertools import combinations, count
 
 # Structure de données "Ensemble disjoint" pour l'algorithme de Kruskal
 class DisjointSet:
@@ -29,8 +36,66 @@ class DisjointSet:
             return True
         return False
 
+# Instrumentation facultative : durée de chaque phase (ms) et compteurs union-find.
+# Elle n'est active que si elle est passée explicitement ; sinon le chemin rapide reste inchangé
+class KruskalInstrumentation:
+    def __init__(self):
+        self.phases = {}
+        self.counters = {"finds": 0, "path_hops": 0, "unions": 0, "rejections": 0}
+
+    @contextmanager
+    def phase(self, name):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start_time)
+
+    def add_phase(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds * 1000
+
+    def total_ms(self):
+        return sum(self.phases.values())
+
+    def as_dict(self):
+        return {"phases_ms": dict(self.phases), "counters": dict(self.counters), "total_ms": self.total_ms()}
+
+    def report(self):
+        total = self.total_ms() or 1.0
+        lines = [f"{name:<14} {duration:10.3f} ms  {duration / total:6.1%}" for name, duration in self.phases.items()]
+        lines.append(f"{'total':<14} {self.total_ms():10.3f} ms")
+        lines.extend(f"{name:<14} {value:10d}" for name, value in self.counters.items())
+        finds = self.counters["finds"]
+        if finds:
+            lines.append(f"{'sauts/find':<14} {self.counters['path_hops'] / finds:10.3f}")
+        return "\n".join(lines)
+
+# Ensemble disjoint qui compte les recherches, les sauts de chemin, les unions et les rejets
+class CountingDisjointSet(DisjointSet):
+    def __init__(self, vertices, counters):
+        super().__init__(vertices)
+        self.counters = counters
+
+    def find(self, vertex):
+        self.counters["finds"] += 1
+        root = vertex
+        while self.parent[root] != root:
+            root = self.parent[root]
+            self.counters["path_hops"] += 1
+        # Compression de chemin (itérative)
+        while self.parent[vertex] != root:
+            self.parent[vertex], vertex = root, self.parent[vertex]
+        return root
+
+    def union(self, vertex1, vertex2):
+        merged = super().union(vertex1, vertex2)
+        self.counters["unions" if merged else "rejections"] += 1
+        return merged
+
 # Algorithme de Kruskal pour trouver l'Arbre Couvrant Minimal
-def kruskal_mst(graph):
+def kruskal_mst(graph, instrumentation=None):
+    if instrumentation is not None:
+        return _kruskal_mst_instrumented(graph, instrumentation)
     edges = sorted((graph[u][v]['weight'], u, v) for u, v in graph.edges())
     vertices = list(graph.nodes())
     ds = DisjointSet(vertices)
@@ -39,65 +104,1006 @@ def kruskal_mst(graph):
 
     for weight, u, v in edges:
         if ds.union(u, v):
-            mst_edges.append((u, v))
+            mst_edges.append((u, v, weight))
+            total_weight += weight
+
+    # Résultat compact : pas de nx.Graph tant que l'appelant ne le demande pas (MSTResult.to_networkx)
+    return MSTResult.from_edge_list(vertices, mst_edges, total_weight, [ds.find(v) for v in vertices])
+
+# Même calcul que kruskal_mst, découpé en phases chronométrées avec un ensemble disjoint compteur
+def _kruskal_mst_instrumented(graph, instrumentation):
+    with instrumentation.phase("extraction"):
+        edges = [(graph[u][v]['weight'], u, v) for u, v in graph.edges()]
+        vertices = list(graph.nodes())
+    with instrumentation.phase("tri"):
+        edges.sort()
+    with instrumentation.phase("union_find"):
+        ds = CountingDisjointSet(vertices, instrumentation.counters)
+        mst_edges = []
+        total_weight = 0
+        for weight, u, v in edges:
+            if ds.union(u, v):
+                mst_edges.append((u, v, weight))
+                total_weight += weight
+    with instrumentation.phase("construction"):
+        result = MSTResult.from_edge_list(vertices, mst_edges, total_weight, [ds.find(v) for v in vertices])
+    return result
+
+# Tas binaire indexé (clé minimale en tête) avec diminution de clé en O(log n) : chaque élément 0..n-1 y figure
+# au plus une fois, position[élément] donne sa place dans le tas (-1 s'il n'y est pas)
+class IndexedHeap:
+    def __init__(self, capacity):
+        self.heap = []
+        self.keys = [0] * capacity
+        self.position = [-1] * capacity
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return self.position[item] != -1
+
+    # Insérer un élément, ou diminuer sa clé s'il est déjà présent avec une clé plus grande
+    def push(self, item, key):
+        if self.position[item] == -1:
+            self.heap.append(item)
+            self.position[item] = len(self.heap) - 1
+        elif key >= self.keys[item]:
+            return False
+        self.keys[item] = key
+        self._sift_up(self.position[item])
+        return True
+
+    def pop(self):
+        heap, position = self.heap, self.position
+        top = heap[0]
+        last = heap.pop()
+        position[top] = -1
+        if heap:
+            heap[0] = last
+            position[last] = 0
+            self._sift_down(0)
+        return top, self.keys[top]
+
+    def _sift_up(self, index):
+        heap, keys, position = self.heap, self.keys, self.position
+        item = heap[index]
+        key = keys[item]
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_item = heap[parent]
+            if keys[parent_item] <= key:
+                break
+            heap[index] = parent_item
+            position[parent_item] = index
+            index = parent
+        heap[index] = item
+        position[item] = index
+
+    def _sift_down(self, index):
+        heap, keys, position = self.heap, self.keys, self.position
+        size = len(heap)
+        item = heap[index]
+        key = keys[item]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            if keys[heap[child]] >= key:
+                break
+            heap[index] = heap[child]
+            position[heap[child]] = index
+            index = child
+        heap[index] = item
+        position[item] = index
+
+# Algorithme de Prim avec tas indexé (diminution de clé) : O(E log V), une arête par sommet dans le tas.
+# Relancé depuis chaque sommet non atteint, il retourne une forêt couvrante ; même résultat que kruskal_mst
+def prim_mst(graph):
+    vertices = list(graph.nodes())
+    index = {v: i for i, v in enumerate(vertices)}
+    adjacency = [[(index[x], data.get('weight', 1)) for x, data in graph[v].items()] for v in vertices]
+    heap = IndexedHeap(len(vertices))
+    in_tree = [False] * len(vertices)
+    parent = [-1] * len(vertices)
+    roots = [None] * len(vertices)
+    mst_edges = []
+    total_weight = 0
+
+    for start in range(len(vertices)):
+        if in_tree[start]:
+            continue
+        heap.push(start, 0)
+        while heap:
+            u, weight = heap.pop()
+            in_tree[u] = True
+            roots[u] = start
+            if parent[u] != -1:
+                mst_edges.append((vertices[parent[u]], vertices[u], weight))
+                total_weight += weight
+            for x, edge_weight in adjacency[u]:
+                if not in_tree[x] and heap.push(x, edge_weight):
+                    parent[x] = u
+    return MSTResult.from_edge_list(vertices, mst_edges, total_weight, roots)
+
+# Au-delà, la matrice d'adjacence de Prim dense (V² flottants) devient trop coûteuse en mémoire
+DENSE_PRIM_MAX_VERTICES = 6000
+
+# Algorithme de Prim en O(V²) sur une matrice d'adjacence numpy : sans tas, chaque étape est un argmin vectorisé.
+# Le plus rapide pour les graphes complets ou presque
+def prim_dense_mst(graph):
+    import numpy as np
+    vertices = list(graph.nodes())
+    num_vertices = len(vertices)
+    if num_vertices > DENSE_PRIM_MAX_VERTICES:
+        raise ValueError(f"Prim dense limité à {DENSE_PRIM_MAX_VERTICES} sommets (matrice V x V)")
+    index = {v: i for i, v in enumerate(vertices)}
+    num_edges = graph.number_of_edges()
+    sources = np.fromiter((index[u] for u, _ in graph.edges()), dtype=np.int64, count=num_edges)
+    targets = np.fromiter((index[v] for _, v in graph.edges()), dtype=np.int64, count=num_edges)
+    matrix = np.full((num_vertices, num_vertices), np.inf)
+    matrix[sources, targets] = matrix[targets, sources] = np.fromiter(
+        (weight for _, _, weight in graph.edges(data='weight', default=1)), dtype=np.float64, count=num_edges)
+
+    in_tree = np.zeros(num_vertices, dtype=bool)
+    best = np.full(num_vertices, np.inf)
+    parent = np.full(num_vertices, -1, dtype=np.int64)
+    roots = [None] * num_vertices
+    mst_edges = []
+    total_weight = 0
+    root = 0
+    for _ in range(num_vertices):
+        u = int(np.argmin(best))
+        if best[u] == np.inf:
+            # Composante épuisée : repartir du premier sommet non atteint
+            u = root = int(np.argmin(in_tree))
+        else:
+            source = vertices[parent[u]]
+            weight = graph[source][vertices[u]].get('weight', 1)  # Poids d'origine (entier ou flottant)
+            mst_edges.append((source, vertices[u], weight))
             total_weight += weight
+        in_tree[u] = True
+        roots[u] = root
+        best[u] = np.inf
+        closer = ~in_tree & (matrix[u] < best)
+        best[closer] = matrix[u][closer]
+        parent[closer] = u
+    return MSTResult.from_edge_list(vertices, mst_edges, total_weight, roots)
+
+# Seuils du choix automatique, mesurés sur des graphes G(n, p) de 200 à 3000 sommets : Prim dense l'emporte
+# dès 10 % de densité (2E / V(V - 1)), Prim avec tas sur Kruskal au-delà d'environ 40 voisins par sommet
+DENSE_PRIM_MIN_DENSITY = 0.1
+HEAP_PRIM_MIN_AVERAGE_DEGREE = 40
+
+# Choisir l'algorithme ACM le plus rapide selon la densité du graphe
+def select_mst_algorithm(graph):
+    num_vertices = graph.number_of_nodes()
+    if num_vertices < 2:
+        return "kruskal"
+    num_edges = graph.number_of_edges()
+    if 2 * num_edges >= DENSE_PRIM_MIN_DENSITY * num_vertices * (num_vertices - 1) and \
+            num_vertices <= DENSE_PRIM_MAX_VERTICES:
+        return "prim_dense"
+    if 2 * num_edges >= HEAP_PRIM_MIN_AVERAGE_DEGREE * num_vertices:
+        return "prim"
+    return "kruskal"
+
+# ACM par l'algorithme choisi automatiquement ("auto") ou imposé ("kruskal", "prim", "prim_dense")
+def minimum_spanning_tree(graph, algorithm="auto"):
+    if algorithm == "auto":
+        algorithm = select_mst_algorithm(graph)
+    return MST_ALGORITHMS[algorithm](graph)
+
+# Exécuter une fonction sous profileur ; retourne (résultat, rapport texte).
+# pyinstrument est facultatif : à défaut, cProfile (bibliothèque standard) est utilisé
+def profile_call(func, *args, profiler="cprofile", limit=25, **kwargs):
+    if profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            profiler = "cprofile"
+        else:
+            session = Profiler()
+            session.start()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                session.stop()
+            return result, session.output_text()
+
+    import cProfile
+    import io
+    import pstats
+    session = cProfile.Profile()
+    result = session.runcall(func, *args, **kwargs)
+    output = io.StringIO()
+    pstats.Stats(session, stream=output).sort_stats("cumulative").print_stats(limit)
+    return result, output.getvalue()
+
+# Trace de Kruskal : chaque arête examinée avec la décision prise (u, v, poids, acceptée)
+def kruskal_trace(graph):
+    edges = sorted(((u, v, data['weight']) for u, v, data in graph.edges(data=True)), key=lambda e: e[2])
+    ds = DisjointSet(graph.nodes())
+    return [(u, v, weight, ds.union(u, v)) for u, v, weight in edges]
+
+# Trace de Prim (tas paresseux) : chaque arête extraite du tas, acceptée si elle atteint un nouveau sommet
+def prim_trace(graph):
+    trace = []
+    visited = set()
+    tie_breaker = count()  # Évite de comparer des sommets de types différents à poids égal
+    # Relancer depuis chaque sommet non visité pour couvrir toutes les composantes
+    for start in graph.nodes():
+        if start in visited:
+            continue
+        visited.add(start)
+        heap = [(data['weight'], next(tie_breaker), start, v) for v, data in graph[start].items()]
+        heapq.heapify(heap)
+        while heap:
+            weight, _, u, v = heapq.heappop(heap)
+            if v in visited:
+                trace.append((u, v, weight, False))
+                continue
+            visited.add(v)
+            trace.append((u, v, weight, True))
+            for x, data in graph[v].items():
+                if x not in visited:
+                    heapq.heappush(heap, (data['weight'], next(tie_breaker), v, x))
+    return trace
+
+# Trace de Borůvka : à chaque tour, l'arête la moins chère sortant de chaque composante
+def boruvka_trace(graph):
+    edges = [(u, v, data['weight']) for u, v, data in graph.edges(data=True)]
+    ds = DisjointSet(graph.nodes())
+    trace = []
+    while True:
+        cheapest = {}
+        for index, (u, v, weight) in enumerate(edges):
+            root_u, root_v = ds.find(u), ds.find(v)
+            if root_u == root_v:
+                continue
+            # Départager les poids égaux par l'indice pour garantir l'absence de cycle
+            for root in (root_u, root_v):
+                best = cheapest.get(root)
+                if best is None or (weight, index) < (edges[best][2], best):
+                    cheapest[root] = index
+        if not cheapest:
+            break
+        for index in sorted(set(cheapest.values())):
+            u, v, weight = edges[index]
+            trace.append((u, v, weight, ds.union(u, v)))
+        # Les arêtes internes à une composante ne seront plus jamais candidates
+        edges = [(u, v, weight) for u, v, weight in edges if ds.find(u) != ds.find(v)]
+    return trace
+
+# Trace des moteurs de référence networkx (seules les arêtes retenues sont visibles)
+def networkx_trace(graph, algorithm='kruskal'):
+    edges = nx.minimum_spanning_edges(graph, algorithm=algorithm, weight='weight', data=True)
+    return [(u, v, data['weight'], True) for u, v, data in edges]
+
+# Algorithmes ACM retournant un MSTResult, indexés par nom
+MST_ALGORITHMS = {
+    "kruskal": kruskal_mst,
+    "prim": prim_mst,
+    "prim_dense": prim_dense_mst,
+}
+
+# Moteurs ACM disponibles pour la comparaison, indexés par nom (les noms sont transmis aux processus)
+MST_ENGINES = {
+    "Kruskal": kruskal_trace,
+    "Prim": prim_trace,
+    "Borůvka": boruvka_trace,
+    "NetworkX (Kruskal)": partial(networkx_trace, algorithm='kruskal'),
+    "NetworkX (Prim)": partial(networkx_trace, algorithm='prim'),
+    "NetworkX (Borůvka)": partial(networkx_trace, algorithm='boruvka'),
+}
+
+# Moteurs dont la trace contient chaque arête examinée, acceptée ou rejetée (Borůvka ne trace que l'arête choisie
+# par composante, networkx que les arêtes retenues)
+EXAMINING_ENGINES = frozenset({"Kruskal", "Prim"})
+
+# Exécuter un moteur sur un graphe et mesurer son temps de calcul
+def run_engine(graph, engine_name):
+    engine = MST_ENGINES[engine_name]
+    start_time = time.perf_counter()
+    trace = engine(graph)
+    execution_time = time.perf_counter() - start_time
+    return trace, execution_time
+
+# Exécuter plusieurs couples (graphe, moteur) en parallèle dans un pool de processus
+def run_engines_parallel(jobs, max_workers=None):
+    if len(jobs) <= 1:
+        return [run_engine(graph, engine_name) for graph, engine_name in jobs]
+    workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_engine, graph, engine_name) for graph, engine_name in jobs]
+            return [future.result() for future in futures]
+    except (OSError, BrokenProcessPool):
+        # Plateforme sans multiprocessus disponible : repli séquentiel
+        return [run_engine(graph, engine_name) for graph, engine_name in jobs]
+
+# Analyse d'une forêt couvrante en une passe union-find sur ses arêtes :
+# composantes, poids par composante, profondeur, diamètre et distribution des degrés
+def forest_analytics(vertices, mst_edges):
+    ds = DisjointSet(vertices)
+    degree = {v: 0 for v in vertices}
+    adjacency = {v: [] for v in vertices}
+    for u, v, _ in mst_edges:
+        ds.union(u, v)
+        degree[u] += 1
+        degree[v] += 1
+        adjacency[u].append(v)
+        adjacency[v].append(u)
+
+    components = {}
+    for v in vertices:
+        root = ds.find(v)
+        if root not in components:
+            components[root] = {"root": root, "size": 0, "edges": 0, "weight": 0, "depth": 0, "diameter": 0}
+        components[root]["size"] += 1
+    for u, _, weight in mst_edges:
+        component = components[ds.find(u)]
+        component["edges"] += 1
+        component["weight"] += weight
+
+    # Profondeur depuis le représentant de la composante, diamètre par double parcours en largeur
+    def farthest(source):
+        distances = {source: 0}
+        frontier = [source]
+        last = source
+        while frontier:
+            next_frontier = []
+            for x in frontier:
+                for y in adjacency[x]:
+                    if y not in distances:
+                        distances[y] = distances[x] + 1
+                        next_frontier.append(y)
+                        last = y
+            frontier = next_frontier
+        return last, distances[last]
+
+    for root, component in components.items():
+        end, component["depth"] = farthest(root)
+        _, component["diameter"] = farthest(end)
+
+    degree_distribution = {}
+    for d in degree.values():
+        degree_distribution[d] = degree_distribution.get(d, 0) + 1
+
+    component_list = list(components.values())
+    return {
+        "num_components": len(component_list),
+        "components": component_list,
+        "total_weight": sum(component["weight"] for component in component_list),
+        "depth": max((component["depth"] for component in component_list), default=0),
+        "diameter": max((component["diameter"] for component in component_list), default=0),
+        "degree_distribution": dict(sorted(degree_distribution.items())),
+        "max_degree": max(degree.values(), default=0)
+    }
+
+# Graphe sous forme de tableaux d'arêtes (numpy) : sommets 0..n-1, une arête i = (sources[i], targets[i], weights[i]).
+# Bien plus compact qu'un nx.Graph pour les graphes de banc d'essai de plusieurs millions d'arêtes
+class EdgeArrays:
+    __slots__ = ("num_vertices", "sources", "targets", "weights", "nodes")
+
+    def __init__(self, num_vertices, sources, targets, weights, nodes=None):
+        self.num_vertices = num_vertices
+        self.sources = sources
+        self.targets = targets
+        self.weights = weights
+        self.nodes = nodes  # Identifiants d'origine des sommets (None : entiers 0..n-1)
+
+    def __len__(self):
+        return len(self.weights)
+
+    @property
+    def num_edges(self):
+        return len(self.weights)
+
+    @property
+    def nbytes(self):
+        return self.sources.nbytes + self.targets.nbytes + self.weights.nbytes
+
+    @classmethod
+    def from_networkx(cls, graph):
+        import numpy as np
+        nodes = list(graph.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        num_edges = graph.number_of_edges()
+        sources = np.empty(num_edges, dtype=np.int64)
+        targets = np.empty(num_edges, dtype=np.int64)
+        weights = np.empty(num_edges, dtype=np.float64)
+        for i, (u, v, weight) in enumerate(graph.edges(data='weight', default=1.0)):
+            sources[i], targets[i], weights[i] = index[u], index[v], weight
+        return cls(len(nodes), sources, targets, weights, nodes)
+
+    def to_networkx(self):
+        graph = nx.Graph()
+        nodes = self.nodes if self.nodes is not None else range(self.num_vertices)
+        graph.add_nodes_from(nodes)
+        if self.nodes is None:
+            graph.add_weighted_edges_from(zip(self.sources.tolist(), self.targets.tolist(), self.weights.tolist()))
+        else:
+            graph.add_weighted_edges_from((self.nodes[u], self.nodes[v], w) for u, v, w in
+                                          zip(self.sources.tolist(), self.targets.tolist(), self.weights.tolist()))
+        return graph
+
+# Résultat compact d'un ACM (ou d'une forêt couvrante) : indices des arêtes retenues dans les tableaux d'arêtes source,
+# poids total et étiquette de composante de chaque sommet. Le graphe networkx n'est construit qu'à la demande
+class MSTResult:
+    __slots__ = ("edges", "edge_indices", "total_weight", "components", "num_components", "_graph")
+
+    def __init__(self, edges, edge_indices, total_weight, components):
+        self.edges = edges  # EdgeArrays source, référencé sans copie
+        self.edge_indices = edge_indices  # None : toutes les arêtes de edges sont retenues
+        self.total_weight = total_weight
+        self.components = components  # Étiquette 0..c-1 de chaque sommet
+        self.num_components = int(components.max()) + 1 if len(components) else 0
+        self._graph = None
+
+    # Construire le résultat à partir de la liste (u, v, poids) des arêtes retenues et des représentants union-find
+    @classmethod
+    def from_edge_list(cls, vertices, mst_edges, total_weight, roots):
+        import numpy as np
+        index = {v: i for i, v in enumerate(vertices)}
+        sources = np.fromiter((index[u] for u, _, _ in mst_edges), dtype=np.int64, count=len(mst_edges))
+        targets = np.fromiter((index[v] for _, v, _ in mst_edges), dtype=np.int64, count=len(mst_edges))
+        weights = np.fromiter((w for _, _, w in mst_edges), dtype=np.float64, count=len(mst_edges))
+        labels = {}
+        components = np.fromiter((labels.setdefault(root, len(labels)) for root in roots), dtype=np.int64,
+                                 count=len(vertices))
+        return cls(EdgeArrays(len(vertices), sources, targets, weights, vertices), None, total_weight, components)
 
-    mst = nx.Graph()
-    mst.add_nodes_from(vertices)
-    mst.add_edges_from(mst_edges)
-    return mst, total_weight
+    def __len__(self):
+        return len(self.edges) if self.edge_indices is None else len(self.edge_indices)
 
-# Fonction pour assurer la connectivité du graphe
-def ensure_connectivity(graph):
-    if nx.is_connected(graph):
+    @property
+    def num_vertices(self):
+        return self.edges.num_vertices
+
+    # Tableaux des arêtes retenues : vues sans copie si toutes les arêtes sont retenues, sinon extraction par indices
+    @property
+    def sources(self):
+        return self.edges.sources if self.edge_indices is None else self.edges.sources[self.edge_indices]
+
+    @property
+    def targets(self):
+        return self.edges.targets if self.edge_indices is None else self.edges.targets[self.edge_indices]
+
+    @property
+    def weights(self):
+        return self.edges.weights if self.edge_indices is None else self.edges.weights[self.edge_indices]
+
+    def is_spanning_tree(self):
+        return self.num_components == 1
+
+    # Une forêt couvrante a exactement n - c arêtes
+    def is_forest(self):
+        return len(self) == self.num_vertices - self.num_components
+
+    # Statistiques par composante, lues sur les étiquettes de la passe Kruskal : nombre de sommets, nombre d'arêtes
+    # de la forêt (taille - 1) et poids de l'arbre de chaque composante
+    def component_sizes(self):
+        import numpy as np
+        return np.bincount(self.components, minlength=self.num_components)
+
+    def component_edge_counts(self):
+        import numpy as np
+        return np.bincount(self.components[self.sources], minlength=self.num_components)
+
+    def component_weights(self):
+        import numpy as np
+        return np.bincount(self.components[self.sources], weights=self.weights, minlength=self.num_components)
+
+    # Sommets (identifiants d'origine) de chaque composante, dans l'ordre des sommets du graphe
+    def component_members(self):
+        import numpy as np
+        order = np.argsort(self.components, kind="stable")
+        boundaries = np.cumsum(self.component_sizes())[:-1]
+        nodes = self.edges.nodes
+        return [[nodes[i] for i in group] if nodes is not None else group
+                for group in (group.tolist() for group in np.split(order, boundaries))]
+
+    # Arêtes retenues (u, v, poids) avec les identifiants d'origine des sommets
+    def edge_list(self):
+        nodes = self.edges.nodes
+        triples = zip(self.sources.tolist(), self.targets.tolist(), self.weights.tolist())
+        if nodes is None:
+            return list(triples)
+        return [(nodes[u], nodes[v], w) for u, v, w in triples]
+
+    # Graphe networkx de l'ACM (tous les sommets, arêtes pondérées), construit au premier appel puis conservé
+    def to_networkx(self):
+        if self._graph is None:
+            graph = nx.Graph()
+            graph.add_nodes_from(self.edges.nodes if self.edges.nodes is not None else range(self.num_vertices))
+            graph.add_weighted_edges_from(self.edge_list())
+            self._graph = graph
+        return self._graph
+
+# Paires (u, v) sans boucles ni doublons, avec u < v
+def _simple_pairs(num_vertices, sources, targets):
+    import numpy as np
+    low, high = np.minimum(sources, targets), np.maximum(sources, targets)
+    keys = np.sort(low[low != high] * num_vertices + high[low != high])
+    # Tri puis masque plutôt que np.unique, nettement plus lent sur des millions de clés
+    keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))] if len(keys) else keys
+    return keys // num_vertices, keys % num_vertices
+
+# Arbre couvrant aléatoire : chaque sommet (dans un ordre aléatoire) se relie à un sommet déjà placé
+def _random_tree_pairs(num_vertices, rng):
+    import numpy as np
+    order = rng.permutation(num_vertices)
+    parents = (rng.random(num_vertices - 1) * np.arange(1, num_vertices)).astype(np.int64)
+    return order[1:], order[parents]
+
+def _connected_pairs(num_vertices, sources, targets, rng, connected):
+    import numpy as np
+    if connected and num_vertices > 1:
+        tree_sources, tree_targets = _random_tree_pairs(num_vertices, rng)
+        sources = np.concatenate([sources, tree_sources])
+        targets = np.concatenate([targets, tree_targets])
+    return _simple_pairs(num_vertices, sources, targets)
+
+# Graphe géométrique aléatoire : n points du carré unité, arête entre deux points à distance <= radius,
+# de poids égal à la distance. Les paires candidates viennent d'une grille de cellules de côté radius
+def random_geometric_edges(num_vertices, radius, seed=None, chunk_size=200000):
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    points = rng.random((num_vertices, 2))
+    cells_per_side = max(1, int(1 / radius))
+    cells = np.minimum((points * cells_per_side).astype(np.int64), cells_per_side - 1)
+    cell_ids = cells[:, 0] * cells_per_side + cells[:, 1]
+    order = np.argsort(cell_ids, kind="stable")
+    points, cells, cell_ids = points[order], cells[order], cell_ids[order]
+    all_cells = np.arange(cells_per_side * cells_per_side)
+    starts = np.searchsorted(cell_ids, all_cells)
+    ends = np.searchsorted(cell_ids, all_cells, side="right")
+
+    sources, targets, weights = [], [], []
+    # Demi-voisinage (chaque paire de cellules n'est visitée qu'une fois), par blocs pour borner la mémoire
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        for block_start in range(0, num_vertices, chunk_size):
+            i = np.arange(block_start, min(block_start + chunk_size, num_vertices))
+            neighbor_x, neighbor_y = cells[i, 0] + dx, cells[i, 1] + dy
+            valid = (neighbor_x >= 0) & (neighbor_x < cells_per_side) & (neighbor_y >= 0) & (neighbor_y < cells_per_side)
+            i = i[valid]
+            neighbor = neighbor_x[valid] * cells_per_side + neighbor_y[valid]
+            # Dans la même cellule, seuls les points suivants (j > i) sont candidats
+            low = i + 1 if (dx, dy) == (0, 0) else starts[neighbor]
+            counts = np.maximum(ends[neighbor] - low, 0)
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            candidate_i = np.repeat(i, counts)
+            candidate_j = np.repeat(low - np.cumsum(counts) + counts, counts) + np.arange(total)
+            distances = np.sqrt(((points[candidate_i] - points[candidate_j]) ** 2).sum(axis=1))
+            keep = distances <= radius
+            sources.append(candidate_i[keep])
+            targets.append(candidate_j[keep])
+            weights.append(distances[keep])
+
+    if not sources:
+        empty = np.empty(0, dtype=np.int64)
+        return EdgeArrays(num_vertices, empty, empty, np.empty(0))
+    return EdgeArrays(num_vertices, np.concatenate(sources), np.concatenate(targets), np.concatenate(weights))
+
+# Graphe à degrés en loi de puissance (modèle de Chung-Lu) : les extrémités sont tirées proportionnellement
+# à un poids i^(-1/(exponent-1)) ; un arbre aléatoire est ajouté pour garantir la connexité si demandé
+def power_law_edges(num_vertices, average_degree=8, exponent=2.5, seed=None, connected=True):
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    expected_degree = np.arange(1, num_vertices + 1) ** (-1.0 / (exponent - 1))
+    probabilities = expected_degree / expected_degree.sum()
+    num_samples = num_vertices * average_degree // 2
+    # Tirage par inversion de la fonction de répartition
+    cumulative = np.cumsum(probabilities)
+    sources = np.minimum(np.searchsorted(cumulative, rng.random(num_samples), side="right"), num_vertices - 1)
+    targets = np.minimum(np.searchsorted(cumulative, rng.random(num_samples), side="right"), num_vertices - 1)
+    sources, targets = _connected_pairs(num_vertices, sources, targets, rng, connected)
+    return EdgeArrays(num_vertices, sources, targets, rng.uniform(1, 100, len(sources)))
+
+# Grille rows x cols (sommet r * cols + c) avec poids aléatoires : plusieurs millions de cellules sans difficulté
+def grid_edges(rows, cols, seed=None):
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    index = np.arange(rows * cols).reshape(rows, cols)
+    sources = np.concatenate([index[:, :-1].ravel(), index[:-1, :].ravel()])
+    targets = np.concatenate([index[:, 1:].ravel(), index[1:, :].ravel()])
+    return EdgeArrays(rows * cols, sources, targets, rng.uniform(1, 100, len(sources)))
+
+# Graphe presque complet : chaque paire est conservée avec la probabilité density (O(n²) arêtes)
+def near_complete_edges(num_vertices, density=0.9, seed=None):
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    sources, targets = np.triu_indices(num_vertices, 1)
+    keep = rng.random(len(sources)) < density
+    sources, targets = sources[keep].astype(np.int64), targets[keep].astype(np.int64)
+    return EdgeArrays(num_vertices, sources, targets, rng.uniform(1, 100, len(sources)))
+
+# Cas défavorable : poids égaux (ou très peu de valeurs distinctes), toutes les comparaisons sont des égalités
+def equal_weight_edges(num_vertices, average_degree=8, distinct_weights=1, seed=None, connected=True):
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    num_samples = num_vertices * average_degree // 2
+    sources = rng.integers(0, num_vertices, num_samples)
+    targets = rng.integers(0, num_vertices, num_samples)
+    sources, targets = _connected_pairs(num_vertices, sources, targets, rng, connected)
+    weights = (rng.integers(0, distinct_weights, len(sources)) + 1).astype(np.float64)
+    return EdgeArrays(num_vertices, sources, targets, weights)
+
+# Familles de graphes synthétiques, paramétrées par le nombre de sommets (degré moyen d'environ 8)
+SYNTHETIC_FAMILIES = {
+    "geometrique": lambda n, seed: random_geometric_edges(n, (8 / (3.14159 * max(n, 1))) ** 0.5, seed),
+    "loi_puissance": lambda n, seed: power_law_edges(n, 8, 2.5, seed),
+    "grille": lambda n, seed: grid_edges(max(1, int(n ** 0.5)), max(1, n // max(1, int(n ** 0.5))), seed),
+    "presque_complet": lambda n, seed: near_complete_edges(n, 0.9, seed),
+    "poids_egaux": lambda n, seed: equal_weight_edges(n, 8, 1, seed),
+}
+
+def generate_synthetic(family, num_vertices, seed=None):
+    return SYNTHETIC_FAMILIES[family](num_vertices, seed)
+
+# Kruskal directement sur des tableaux d'arêtes : tri numpy puis union-find sur des listes d'entiers.
+# Retourne un MSTResult qui référence edges sans le copier (indices des arêtes retenues)
+def kruskal_edge_arrays(edges, chunk_size=65536):
+    import numpy as np
+    order = np.argsort(edges.weights, kind="stable")
+    # Au plus n - 1 arêtes : arrêt anticipé, les blocs suivants ne sont jamais convertis
+    selected, parent = _kruskal_select(edges.num_vertices, order, edges.sources, edges.targets, chunk_size)
+    selected = np.array(selected, dtype=np.int64)
+    return MSTResult(edges, selected, float(edges.weights[selected].sum()), _component_labels(parent))
+
+# Étiquettes de composantes 0..c-1 à partir d'un tableau de parents union-find (sauts de pointeurs vectorisés)
+def _component_labels(parent):
+    import numpy as np
+    roots = np.array(parent, dtype=np.int64)
+    while True:
+        grand_parents = roots[roots]
+        if np.array_equal(grand_parents, roots):
+            break
+        roots = grand_parents
+    is_root = roots == np.arange(len(roots))
+    return (np.cumsum(is_root) - 1)[roots]
+
+# Kruskal pour un ordre d'arêtes donné (tableau numpy d'indices) : retourne les indices retenus et le tableau de
+# parents union-find. Les extrémités sont extraites par blocs (numpy), avec arrêt après n - 1 arêtes
+def _kruskal_select(num_vertices, order, sources, targets, chunk_size=65536):
+    parent = list(range(num_vertices))
+    size = [1] * num_vertices
+    selected = []
+    needed = num_vertices - 1
+    for block_start in range(0, len(order), chunk_size):
+        block = order[block_start:block_start + chunk_size]
+        for index, u, v in zip(block.tolist(), sources[block].tolist(), targets[block].tolist()):
+            # Recherche avec réduction de moitié du chemin
+            while parent[u] != u:
+                parent[u] = parent[parent[u]]
+                u = parent[u]
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            if u == v:
+                continue
+            # Union par taille
+            if size[u] < size[v]:
+                u, v = v, u
+            parent[v] = u
+            size[u] += size[v]
+            selected.append(index)
+        if len(selected) >= needed:
+            break
+    return selected, parent
+
+# ACM d'un lot de scénarios (lignes de weights) sur une même topologie : poids totaux et bitmaps compactés
+# (np.packbits) des arêtes retenues. Fonction exécutée telle quelle dans les processus du pool
+def _batch_mst_chunk(num_vertices, sources, targets, weights):
+    import numpy as np
+    totals = np.empty(len(weights))
+    bitmaps = np.zeros((len(weights), (len(sources) + 7) // 8), dtype=np.uint8)
+    accepted = np.zeros(len(sources), dtype=bool)
+    for row, scenario_weights in enumerate(weights):
+        selected, _ = _kruskal_select(num_vertices, np.argsort(scenario_weights, kind="stable"), sources, targets)
+        accepted[:] = False
+        accepted[selected] = True
+        bitmaps[row] = np.packbits(accepted)
+        totals[row] = scenario_weights[selected].sum()
+    return totals, bitmaps
+
+# ACM de chaque scénario d'un calcul par lots (mêmes arêtes, poids différents)
+class ScenarioMSTs:
+    __slots__ = ("edges", "weight_matrix", "totals", "bitmaps", "components")
+
+    def __init__(self, edges, weight_matrix, totals, bitmaps, components):
+        self.edges = edges  # Topologie partagée (EdgeArrays)
+        self.weight_matrix = weight_matrix  # Scénarios x arêtes
+        self.totals = totals  # Poids total de l'ACM de chaque scénario
+        self.bitmaps = bitmaps  # Arêtes retenues, un bit par arête (np.packbits), une ligne par scénario
+        self.components = components  # Étiquettes de composantes, identiques pour tous les scénarios
+
+    def __len__(self):
+        return len(self.totals)
+
+    # Masque booléen des arêtes retenues dans un scénario
+    def accepted(self, scenario):
+        import numpy as np
+        return np.unpackbits(self.bitmaps[scenario], count=len(self.edges)).astype(bool)
+
+    def edge_indices(self, scenario):
+        import numpy as np
+        return np.flatnonzero(self.accepted(scenario))
+
+    # MSTResult d'un scénario : la topologie et la ligne de poids sont partagées, sans copie
+    def result(self, scenario):
+        edges = self.edges
+        scenario_edges = EdgeArrays(edges.num_vertices, edges.sources, edges.targets, self.weight_matrix[scenario],
+                                    edges.nodes)
+        return MSTResult(scenario_edges, self.edge_indices(scenario), float(self.totals[scenario]), self.components)
+
+    # Part des scénarios dont l'ACM retient chaque arête (arêtes robustes ou sensibles au scénario)
+    def acceptance_frequency(self):
+        import numpy as np
+        counts = np.zeros(len(self.edges), dtype=np.int64)
+        for bitmap in self.bitmaps:
+            counts += np.unpackbits(bitmap, count=len(self.edges))
+        return counts / max(len(self), 1)
+
+# ACM de nombreux scénarios de poids sur une même topologie : la topologie (nx.Graph ou EdgeArrays) est extraite
+# une seule fois, weight_matrix a une ligne par scénario et une colonne par arête (dans l'ordre de EdgeArrays).
+# Avec parallel=True, les scénarios sont répartis par lots dans un pool de processus
+def batch_mst(topology, weight_matrix, parallel=False, max_workers=None):
+    import numpy as np
+    edges = topology if isinstance(topology, EdgeArrays) else EdgeArrays.from_networkx(topology)
+    weight_matrix = np.atleast_2d(np.asarray(weight_matrix, dtype=np.float64))
+    if weight_matrix.shape[1] != len(edges):
+        raise ValueError(f"La matrice de poids a {weight_matrix.shape[1]} colonnes pour {len(edges)} arêtes")
+
+    num_scenarios = len(weight_matrix)
+    workers = (max_workers or os.cpu_count() or 1) if parallel else 1
+    workers = max(1, min(workers, num_scenarios))
+    bounds = [num_scenarios * i // workers for i in range(workers + 1)]
+    chunks = [weight_matrix[start:end] for start, end in zip(bounds, bounds[1:])]
+    job = partial(_batch_mst_chunk, edges.num_vertices, edges.sources, edges.targets)
+
+    if workers == 1:
+        outputs = [job(chunk) for chunk in chunks]
+    else:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outputs = list(pool.map(job, chunks))
+        except (OSError, BrokenProcessPool):
+            # Plateforme sans multiprocessus disponible : repli séquentiel
+            outputs = [job(chunk) for chunk in chunks]
+
+    totals = np.concatenate([output[0] for output in outputs])
+    bitmaps = np.concatenate([output[1] for output in outputs])
+    # La forêt couvrante a les mêmes composantes quel que soit le scénario : elles se lisent sur la topologie seule
+    # (une passe union-find dans l'ordre des arêtes), y compris pour un lot vide
+    _, parent = _kruskal_select(edges.num_vertices, np.arange(len(edges)), edges.sources, edges.targets)
+    components = _component_labels(parent)
+    return ScenarioMSTs(edges, weight_matrix, totals, bitmaps, components)
+
+# Stratégies de raccordement des composantes : chaîne, étoile autour de la plus grande composante,
+# ou ponts de poids minimal d'après des coordonnées ou une fonction de distance
+BRIDGE_STRATEGIES = ("chaine", "etoile", "minimal")
+
+# Forêts couvrantes déjà calculées, par graphe (sans référence forte : la table ne garde pas les graphes en vie,
+# et rien n'est ajouté à graph.graph, que graph.copy() et pickle propageraient)
+_SPANNING_FORESTS = weakref.WeakKeyDictionary()
+
+# Signature d'un graphe : sommets (dans leur ordre) et arêtes avec leurs poids. Change dès qu'un poids est modifié
+# ou qu'une arête est remplacée par une autre, même à nombre de sommets et d'arêtes égal
+def _graph_signature(graph):
+    return (graph.number_of_nodes(), graph.number_of_edges(),
+            hash((tuple(graph.nodes()), tuple(graph.edges(data='weight', default=1)))))
+
+# ACM (forêt couvrante) d'un graphe networkx, calculé une seule fois puis réutilisé tant que le graphe n'a pas
+# changé : ses étiquettes et statistiques de composantes servent à l'application, à la disposition et à la
+# validation sans nouveau Kruskal. refresh=True force le recalcul
+def spanning_forest(graph, refresh=False):
+    signature = _graph_signature(graph)
+    cached = _SPANNING_FORESTS.get(graph)
+    if refresh or cached is None or cached[0] != signature:
+        cached = (signature, kruskal_mst(graph))
+        _SPANNING_FORESTS[graph] = cached
+    return cached[1]
+
+# Composantes connexes d'un graphe networkx (listes de sommets, dans l'ordre du graphe) : une passe union-find sur
+# les arêtes, sans tri ni poids. Suffit quand seules les composantes comptent ; spanning_forest reste là pour l'ACM
+def graph_components(graph):
+    ds = DisjointSet(graph.nodes())
+    for u, v in graph.edges():
+        ds.union(u, v)
+    groups = {}
+    for vertex in graph.nodes():
+        groups.setdefault(ds.find(vertex), []).append(vertex)
+    return list(groups.values())
+
+# Ponts de poids minimal entre composantes : Prim dense sur les sommets, une composante entière entrant à coût nul.
+# O(V²) évaluations de distance, vectorisées avec numpy quand des coordonnées sont fournies
+def _minimum_bridges(vertices, labels, num_components, position=None, distance=None):
+    import numpy as np
+    if position is not None:
+        lookup = position if callable(position) else position.__getitem__
+        points = np.array([lookup(v) for v in vertices], dtype=np.float64)
+        distances_from = lambda i: np.sqrt(((points - points[i]) ** 2).sum(axis=1))
+    else:
+        distances_from = lambda i: np.fromiter((distance(vertices[i], w) for w in vertices), dtype=np.float64,
+                                               count=len(vertices))
+    members = [[] for _ in range(num_components)]
+    for i, label in enumerate(labels):
+        members[label].append(i)
+
+    in_tree = np.zeros(len(vertices), dtype=bool)
+    best = np.full(len(vertices), np.inf)
+    best_from = np.full(len(vertices), -1, dtype=np.int64)
+
+    def add_component(label):
+        in_tree[members[label]] = True
+        for i in members[label]:
+            distances = distances_from(i)
+            closer = ~in_tree & (distances < best)
+            best[closer] = distances[closer]
+            best_from[closer] = i
+        best[in_tree] = np.inf
+
+    bridges = []
+    add_component(0)
+    for _ in range(num_components - 1):
+        j = int(np.argmin(best))
+        bridges.append((vertices[best_from[j]], vertices[j], float(best[j])))
+        add_component(labels[j])
+    return bridges
+
+# Fonction pour assurer la connectivité du graphe : composantes lues par une passe union-find linéaire
+# (graph_components, sans le tri de Kruskal) puis c - 1 ponts.
+# weight : poids des ponts (nombre ou fonction (u, v)) pour "chaine" et "etoile" ; par défaut le poids maximal
+# du graphe, déterministe. "minimal" pèse chaque pont par la distance entre ses extrémités (position ou distance) :
+# elle évalue O(V²) distances, à réserver aux graphes de taille modérée
+def ensure_connectivity(graph, strategy="chaine", weight=None, position=None, distance=None):
+    if strategy not in BRIDGE_STRATEGIES:
+        raise ValueError(f"Stratégie de raccordement inconnue : {strategy}")
+    components = graph_components(graph)
+    if len(components) <= 1:
+        return graph
+    sizes = [len(members) for members in components]
+
+    if strategy == "minimal":
+        if position is None and distance is None:
+            raise ValueError("La stratégie 'minimal' demande des coordonnées (position) ou une fonction distance")
+        label = {vertex: i for i, members in enumerate(components) for vertex in members}
+        vertices = list(graph.nodes())
+        labels = [label[vertex] for vertex in vertices]
+        graph.add_weighted_edges_from(_minimum_bridges(vertices, labels, len(sizes), position, distance))
         return graph
-    # Ajouter des arêtes minimales pour connecter les composantes
-    components = list(nx.connected_components(graph))
-    for i in range(len(components) - 1):
-        u = list(components[i])[0]
-        v = list(components[i + 1])[0]
-        weight = random.randint(1, 10)  # Poids raisonnable pour éviter de fausser l'ACM
-        graph.add_edge(u, v, weight=weight)
+
+    # Premier sommet (dans l'ordre du graphe) de chaque composante
+    representatives = [members[0] for members in components]
+    if strategy == "etoile":
+        hub = representatives[max(range(len(sizes)), key=sizes.__getitem__)]
+        pairs = [(hub, v) for v in representatives if v != hub]
+    else:
+        pairs = list(zip(representatives, representatives[1:]))
+
+    if weight is None:
+        weight = max((w for _, _, w in graph.edges(data='weight', default=1)), default=1)
+    for u, v in pairs:
+        graph.add_edge(u, v, weight=weight(u, v) if callable(weight) else weight)
     return graph
 
-# Fonction pour vérifier qu'un ACM est acyclique
+# Fonction pour vérifier qu'un ACM est acyclique : une passe union-find, sans parcours networkx
 def is_acyclic(graph):
-    try:
-        nx.find_cycle(graph)
-        return False
-    except nx.NetworkXNoCycle:
-        return True
+    ds = DisjointSet(graph.nodes())
+    return all(ds.union(u, v) for u, v in graph.edges())
+
+# Fonction pour visualiser et enregistrer le graphe et son ACM (MSTResult, tel que retourné par kruskal_mst, ou
+# graphe networkx de l'ACM)
+def visualize_graph(original_graph, mst, title, filename, dpi=100):
+    # Importé ici : le noyau reste utilisable sans matplotlib (application, tâches sans affichage)
+    from rendu_graphes import render_graph
+    mst_edges = mst.edge_list() if isinstance(mst, MSTResult) else list(mst.edges(data='weight', default=1))
+    render_graph(original_graph, mst_edges, title, filename, dpi=dpi)
+
+# Graine de base du catalogue intégré : le graphe d'indice i utilise DEFAULT_CATALOG_SEED + i
+DEFAULT_CATALOG_SEED = 42
+
+# Catalogue de graphes : fabriques nommées avec leurs métadonnées, construites à la demande puis mises en cache.
+# Chaque fabrique reçoit un random.Random initialisé avec la graine de son entrée : un même couple (nom, graine)
+# donne toujours le même graphe, d'un lancement à l'autre
+class GraphCatalog:
+    def __init__(self):
+        self.entries = []
+
+    def register(self, name, factory, filename=None, category=None, num_vertices=None, num_edges=None, connected=None,
+                 seed=None):
+        # num_edges peut être None quand il n'est connu qu'après construction (graphes aléatoires)
+        self.entries.append({
+            "name": name,
+            "factory": factory,
+            "filename": filename,
+            "category": category,
+            "num_vertices": num_vertices,
+            "num_edges": num_edges,
+            "connected": connected,
+            "seed": seed,
+            "graph": None
+        })
+
+    def add(self, graph, name, category, connected=None):
+        # Graphe déjà construit (personnalisé ou importé)
+        if connected is None:
+            connected = spanning_forest(graph).is_spanning_tree()
+        self.register(name, None, None, category, graph.number_of_nodes(), graph.number_of_edges(), connected)
+        self.entries[-1]["graph"] = graph
+
+    def __len__(self):
+        return len(self.entries)
+
+    def names(self):
+        return [entry["name"] for entry in self.entries]
 
-# Fonction pour visualiser et enregistrer le graphe et son ACM
-def visualize_graph(original_graph, mst, title, filename):
-    pos = nx.spring_layout(original_graph, seed=42)
-    plt.figure(figsize=(12, 8))
+    def index(self, name):
+        return self.names().index(name)
 
-    # Dessiner le graphe original
-    nx.draw(original_graph, pos, with_labels=True, node_color='lightblue', edge_color='gray', node_size=500, font_size=10)
-    edge_labels = nx.get_edge_attributes(original_graph, 'weight')
-    nx.draw_networkx_edge_labels(original_graph, pos, edge_labels=edge_labels, font_size=8)
+    def set_seed(self, index, seed):
+        # Changer la graine d'un graphe intégré : il sera reconstruit à la prochaine demande
+        entry = self.entries[index]
+        if entry["factory"] is not None and entry["seed"] != seed:
+            entry["seed"] = seed
+            entry["graph"] = None
 
-    # Mettre en évidence les arêtes de l'ACM en rouge
-    nx.draw_networkx_edges(mst, pos, edge_color='red', width=2)
+    def metadata(self, index):
+        return {key: value for key, value in self.entries[index].items() if key not in ("factory", "graph")}
 
-    plt.title(title)
-    plt.savefig(filename)
-    plt.close()
+    def is_built(self, index):
+        return self.entries[index]["graph"] is not None
 
-# Fonction pour créer tous les graphes de test (originaux + complexes)
-def create_test_graphs():
-    graphs = []
+    def get(self, index):
+        entry = self.entries[index]
+        if entry["graph"] is None:
+            entry["graph"] = entry["factory"](random.Random(entry["seed"]))
+            # La graine accompagne le graphe (copies, bancs d'essai)
+            entry["graph"].graph["seed"] = entry["seed"]
+            # Compléter les métadonnées avec les valeurs réelles
+            entry["num_vertices"] = entry["graph"].number_of_nodes()
+            entry["num_edges"] = entry["graph"].number_of_edges()
+        return entry["graph"]
 
-    # Graphe 1: Petit graphe manuel (7 sommets)
+    # Compatibilité avec l'ancienne liste de tuples (graphe, titre, fichier)
+    def __getitem__(self, index):
+        return self.get(index), self.entries[index]["name"], self.entries[index]["filename"]
+
+BUILTIN_GRAPHS = []
+
+# Enregistrer une fabrique de graphe du catalogue intégré
+def _builtin_graph(name, filename, category, num_vertices, num_edges, connected):
+    def decorator(factory):
+        BUILTIN_GRAPHS.append((name, factory, filename, category, num_vertices, num_edges, connected))
+        return factory
+    return decorator
+
+# Nouveau catalogue contenant les graphes intégrés (aucun n'est construit avant d'être demandé)
+def create_graph_catalog(seed=DEFAULT_CATALOG_SEED):
+    catalog = GraphCatalog()
+    for i, (name, factory, filename, category, num_vertices, num_edges, connected) in enumerate(BUILTIN_GRAPHS):
+        catalog.register(name, factory, filename, category, num_vertices, num_edges, connected, seed=seed + i)
+    return catalog
+
+# Graphe 1: Petit graphe manuel (7 sommets)
+@_builtin_graph("Petit Graphe (7 sommets)", "graphF1.png", category="Manuel", num_vertices=7, num_edges=9, connected=True)
+def _graphe_1(rng):
     G1 = nx.Graph()
     G1.add_nodes_from(range(7))
     edges1 = [(0, 1, 4), (0, 2, 3), (1, 2, 5), (1, 3, 2), 
               (2, 4, 6), (3, 4, 3), (3, 5, 4), (4, 6, 2), (5, 6, 5)]
     G1.add_weighted_edges_from(edges1)
-    graphs.append((G1, "Petit Graphe (7 sommets)", "graphF1.png"))
+    return G1
 
-    # Graphe 2: Graphe de taille moyenne (12 sommets) - Exemple classique d'ACM
+# Graphe 2: Graphe de taille moyenne (12 sommets) - Exemple classique d'ACM
+@_builtin_graph("Exemple Classique d'ACM (12 sommets)", "graphF2.png", category="Manuel", num_vertices=12, num_edges=19, connected=True)
+def _graphe_2(rng):
     G2 = nx.Graph()
     G2.add_nodes_from(range(12))
     edges2 = [(0, 1, 4), (0, 2, 3), (1, 3, 2), (1, 4, 5), 
@@ -106,9 +1112,11 @@ def create_test_graphs():
               (9, 11, 2), (10, 11, 3), (0, 5, 7), (1, 8, 6),
               (2, 9, 5), (3, 10, 8), (4, 11, 7)]
     G2.add_weighted_edges_from(edges2)
-    graphs.append((G2, "Exemple Classique d'ACM (12 sommets)", "graphF2.png"))
+    return G2
 
-    # Graphe 3: Graphe de taille moyenne (15 sommets) - Clairsemé avec ACM unique
+# Graphe 3: Graphe de taille moyenne (15 sommets) - Clairsemé avec ACM unique
+@_builtin_graph("Graphe Clairsemé avec ACM Unique (15 sommets)", "graphF3.png", category="Arbre", num_vertices=15, num_edges=20, connected=True)
+def _graphe_3(rng):
     G3 = nx.Graph()
     G3.add_nodes_from(range(15))
     # Créer un arbre pour garantir un ACM unique
@@ -118,9 +1126,11 @@ def create_test_graphs():
     additional_edges = [(0, 3, 15), (1, 5, 12), (2, 7, 14), 
                         (4, 10, 16), (6, 11, 13), (8, 14, 15)]
     G3.add_weighted_edges_from(additional_edges)
-    graphs.append((G3, "Graphe Clairsemé avec ACM Unique (15 sommets)", "graphF3.png"))
+    return G3
 
-    # Graphe 4: Graphe de taille moyenne (10 sommets) - Dense avec plusieurs ACM potentiels
+# Graphe 4: Graphe de taille moyenne (10 sommets) - Dense avec plusieurs ACM potentiels
+@_builtin_graph("Graphe Dense avec Multiples ACM (10 sommets)", "graphF4.png", category="Dense", num_vertices=10, num_edges=31, connected=True)
+def _graphe_4(rng):
     G4 = nx.Graph()
     G4.add_nodes_from(range(10))
     # Créer une structure de base
@@ -131,10 +1141,12 @@ def create_test_graphs():
     for i in range(10):
         for j in range(i+2, min(i+5, 10)):
             if j % 10 != i:  # Éviter les boucles sur soi-même
-                G4.add_edge(i, j % 10, weight=random.randint(4, 10))
-    graphs.append((G4, "Graphe Dense avec Multiples ACM (10 sommets)", "graphF4.png"))
+                G4.add_edge(i, j % 10, weight=rng.randint(4, 10))
+    return G4
 
-    # Graphe 5: Graphe déconnecté avec des composantes distinctes (20 sommets)
+# Graphe 5: Graphe déconnecté avec des composantes distinctes (20 sommets)
+@_builtin_graph("Graphe Déconnecté Complexe (20 sommets, 4 composantes)", "graphF5.png", category="Déconnecté", num_vertices=20, num_edges=23, connected=False)
+def _graphe_5(rng):
     G5 = nx.Graph()
     G5.add_nodes_from(range(20))
     # Créer 4 composantes séparées avec des structures plus complexes
@@ -142,7 +1154,7 @@ def create_test_graphs():
     # Composante 1: Un petit graphe complet (K4)
     for i in range(4):
         for j in range(i+1, 4):
-            G5.add_edge(i, j, weight=random.randint(1, 7))
+            G5.add_edge(i, j, weight=rng.randint(1, 7))
 
     # Composante 2: Une structure similaire à un arbre binaire
     edges_comp2 = [(4, 5, 2), (4, 6, 3), (5, 7, 4), (5, 8, 2), (6, 9, 5), (6, 10, 1)]
@@ -157,48 +1169,55 @@ def create_test_graphs():
     star_edges = [(16, 17, 1), (16, 18, 2), (16, 19, 3)]
     satellite_edge = [(19, 17, 9)]  # Crée un petit cycle dans l'étoile
     G5.add_weighted_edges_from(star_edges + satellite_edge)
+    return G5
 
-    graphs.append((G5, "Graphe Déconnecté Complexe (20 sommets, 4 composantes)", "graphF5.png"))
-
-    # Graphe 6: Graphe avec des poids négatifs (12 sommets)
+# Graphe 6: Graphe avec des poids négatifs (12 sommets)
+@_builtin_graph("Graphe avec Poids Négatifs (12 sommets)", "graphF6.png", category="Poids Négatifs", num_vertices=12, num_edges=18, connected=True)
+def _graphe_6(rng):
     G6 = nx.Graph()
     G6.add_nodes_from(range(12))
     # Créer une structure de base
     for i in range(11):
-        G6.add_edge(i, i+1, weight=random.randint(-5, 5))
+        G6.add_edge(i, i+1, weight=rng.randint(-5, 5))
     # Ajouter quelques arêtes transversales
     cross_edges = [(0, 5, -3), (0, 6, 2), (1, 7, -4), (2, 8, -2), 
                   (3, 9, 3), (4, 10, -5), (5, 11, 4)]
     G6.add_weighted_edges_from(cross_edges)
-    graphs.append((G6, "Graphe avec Poids Négatifs (12 sommets)", "graphF6.png"))
+    return G6
 
-    # Graphe 7: Graphe en grille (16 sommets) - Meilleur pour la visualisation
+# Graphe 7: Graphe en grille (16 sommets) - Meilleur pour la visualisation
+@_builtin_graph("Graphe en Grille avec Motif (16 sommets)", "graphF7.png", category="Grille", num_vertices=16, num_edges=24, connected=True)
+def _graphe_7(rng):
     G7 = nx.grid_2d_graph(4, 4)  # Grille 4x4
     # Convertir en graphe normal avec des nœuds entiers
     G7 = nx.convert_node_labels_to_integers(G7)
     # Ajouter des poids - faire en sorte que les arêtes horizontales aient des poids plus faibles que les verticales
     for u, v in G7.edges():
         if abs(u-v) == 1:  # Arête horizontale
-            G7[u][v]['weight'] = random.randint(1, 5)
+            G7[u][v]['weight'] = rng.randint(1, 5)
         else:  # Arête verticale
-            G7[u][v]['weight'] = random.randint(6, 10)
-    graphs.append((G7, "Graphe en Grille avec Motif (16 sommets)", "graphF7.png"))
+            G7[u][v]['weight'] = rng.randint(6, 10)
+    return G7
 
-    # Graphe 8: Très grand graphe (50 sommets) - Test de performance
+# Graphe 8: Très grand graphe (50 sommets) - Test de performance
+@_builtin_graph("Grand Graphe (50 sommets)", "graphF8.png", category="Aléatoire", num_vertices=50, num_edges=None, connected=True)
+def _graphe_8(rng):
     G8 = nx.Graph()
     G8.add_nodes_from(range(50))
     # Assurer la connectivité
     for i in range(49):
-        G8.add_edge(i, i+1, weight=random.randint(1, 10))
+        G8.add_edge(i, i+1, weight=rng.randint(1, 10))
     # Ajouter des arêtes supplémentaires
     for _ in range(100):
-        u = random.randint(0, 49)
-        v = random.randint(0, 49)
+        u = rng.randint(0, 49)
+        v = rng.randint(0, 49)
         if u != v and not G8.has_edge(u, v):
-            G8.add_edge(u, v, weight=random.randint(1, 30))
-    graphs.append((G8, "Grand Graphe (50 sommets)", "graphF8.png"))
+            G8.add_edge(u, v, weight=rng.randint(1, 30))
+    return G8
 
-    # Graphe 9: Graphe circulaire avec connexions transversales (14 sommets)
+# Graphe 9: Graphe circulaire avec connexions transversales (14 sommets)
+@_builtin_graph("Graphe Circulaire avec Raccourcis Stratégiques (14 sommets)", "graphF9.png", category="Cycle", num_vertices=14, num_edges=21, connected=True)
+def _graphe_9(rng):
     G9 = nx.Graph()
     n = 14
     G9.add_nodes_from(range(n))
@@ -209,38 +1228,44 @@ def create_test_graphs():
     cross_edges = [(0, 7, 2), (1, 8, 3), (2, 9, 1), (3, 10, 2), 
                   (4, 11, 1), (5, 12, 3), (6, 13, 2)]
     G9.add_weighted_edges_from(cross_edges)
-    graphs.append((G9, "Graphe Circulaire avec Raccourcis Stratégiques (14 sommets)", "graphF9.png"))
+    return G9
 
-    # Graphe 10: Graphe complet avec des poids uniques (10 sommets)
+# Graphe 10: Graphe complet avec des poids uniques (10 sommets)
+@_builtin_graph("Graphe Complet avec Motif ACM en Étoile (10 sommets)", "graphF10.png", category="Complet", num_vertices=10, num_edges=45, connected=True)
+def _graphe_10(rng):
     G10 = nx.complete_graph(10)
     # Générer des poids pour créer un motif spécifique d'ACM (étoile-like)
     weights = {}
     for u, v in G10.edges():
         if u == 0 or v == 0:  # Arêtes connectées au nœud 0 ont un faible poids
-            weights[(u, v)] = random.randint(1, 5)
+            weights[(u, v)] = rng.randint(1, 5)
         else:
-            weights[(u, v)] = random.randint(10, 20)
+            weights[(u, v)] = rng.randint(10, 20)
     
     nx.set_edge_attributes(G10, values=weights, name='weight')
-    graphs.append((G10, "Graphe Complet avec Motif ACM en Étoile (10 sommets)", "graphF10.png"))
+    return G10
 
-    # Graphe 11: Graphe de taille moyenne (15 sommets) avec une arête de pont critique
+# Graphe 11: Graphe de taille moyenne (15 sommets) avec une arête de pont critique
+@_builtin_graph("Graphe avec Arête Pont Critique (15 sommets)", "graphF11.png", category="Pont", num_vertices=15, num_edges=50, connected=True)
+def _graphe_11(rng):
     G11 = nx.Graph()
     G11.add_nodes_from(range(15))
     # Créer deux sous-graphes denses
     for i in range(7):
         for j in range(i+1, 7):
-            G11.add_edge(i, j, weight=random.randint(5, 15))
+            G11.add_edge(i, j, weight=rng.randint(5, 15))
     
     for i in range(7, 15):
         for j in range(i+1, 15):
-            G11.add_edge(i, j, weight=random.randint(5, 15))
+            G11.add_edge(i, j, weight=rng.randint(5, 15))
     
     # Ajouter un pont avec très faible poids - cet arc sera toujours dans l'ACM
     G11.add_edge(3, 10, weight=1)
-    graphs.append((G11, "Graphe avec Arête Pont Critique (15 sommets)", "graphF11.png"))
+    return G11
 
-    # Graphe 12: Graphe avec un piège de cycle proche (12 sommets)
+# Graphe 12: Graphe avec un piège de cycle proche (12 sommets)
+@_builtin_graph("Graphe Cyclique avec Motif de Poids (12 sommets)", "graphF12.png", category="Cycle", num_vertices=12, num_edges=12, connected=True)
+def _graphe_12(rng):
     G12 = nx.Graph()
     G12.add_nodes_from(range(12))
     # Créer un cycle avec des poids décroissants sauf pour une arête
@@ -248,9 +1273,11 @@ def create_test_graphs():
                   (4, 5, 6), (5, 6, 5), (6, 7, 4), (7, 8, 3),
                   (8, 9, 2), (9, 10, 1), (10, 11, 11), (11, 0, 12)]
     G12.add_weighted_edges_from(cycle_edges)
-    graphs.append((G12, "Graphe Cyclique avec Motif de Poids (12 sommets)", "graphF12.png"))
+    return G12
 
-    # Graphe 13: Grand Graphe Biparti (40 sommets)
+# Graphe 13: Grand Graphe Biparti (40 sommets)
+@_builtin_graph("Grand Graphe Biparti (40 sommets)", "graphF13.png", category="Biparti", num_vertices=40, num_edges=134, connected=False)
+def _graphe_13(rng):
     G13 = nx.Graph()
     # Créer deux ensembles de nœuds
     set_a = range(0, 20)
@@ -262,49 +1289,66 @@ def create_test_graphs():
         for b in set_b:
             # Seulement connecter certains nœuds pour garder le graphe gérable
             if (a + b) % 3 == 0:
-                G13.add_edge(a, b, weight=random.randint(1, 20))
-    graphs.append((G13, "Grand Graphe Biparti (40 sommets)", "graphF13.png"))
+                G13.add_edge(a, b, weight=rng.randint(1, 20))
+    return G13
 
-    # Graphe 14: Réseau Invariant d'Échelle (60 sommets)
+# Graphe 14: Réseau Invariant d'Échelle (60 sommets)
+@_builtin_graph("Réseau Invariant d'Échelle (60 sommets)", "graphF14.png", category="Invariant d'Échelle", num_vertices=60, num_edges=171, connected=True)
+def _graphe_14(rng):
     # Utiliser le modèle Barabási–Albert pour générer un réseau invariant d'échelle
-    G14 = nx.barabasi_albert_graph(60, 3, seed=42)
+    G14 = nx.barabasi_albert_graph(60, 3, seed=rng)
     # Ajouter des poids aux arêtes
     for u, v in G14.edges():
-        G14[u][v]['weight'] = random.randint(1, 15)
-    graphs.append((G14, "Réseau Invariant d'Échelle (60 sommets)", "graphF14.png"))
-
+        G14[u][v]['weight'] = rng.randint(1, 15)
+    return G14
 
-    
-    return graphs
+# Fonction pour créer tous les graphes de test (originaux + complexes), construits dans l'ordre
+def create_test_graphs(seed=DEFAULT_CATALOG_SEED):
+    catalog = create_graph_catalog(seed)
+    return [catalog[i] for i in range(len(catalog))]
 
 # Exécution principale
-def main():
-    random.seed(42)  # Assurer la reproductibilité pour les graphes aléatoires
-    test_graphs = create_test_graphs()
+def main(image_format="png", dpi=100, seed=DEFAULT_CATALOG_SEED):
+    from validation_acm import validate_mst
+    test_graphs = create_test_graphs(seed)  # Graphes reproductibles : chacun a sa propre graine
     results = []
+    render_jobs = []
 
     for graph, title, filename in test_graphs:
-        # Vérifier la connectivité
-        if not nx.is_connected(graph):
+        start_time = time.perf_counter()
+        mst = kruskal_mst(graph)
+        mst_time = time.perf_counter() - start_time
+        # Vérifier la connectivité : l'ACM d'un graphe connexe n'a qu'une composante
+        if not mst.is_spanning_tree():
             print(f"Erreur: {title} n'est pas connecté malgré ensure_connectivity.")
             continue
-        mst, total_weight = kruskal_mst(graph)
-        # Vérifier que l'ACM est acyclique
-        if not is_acyclic(mst):
-            print(f"Erreur: L'ACM pour {title} contient un cycle.")
+        # Valider l'ACM (acyclique, couvrant, n - 1 arêtes, poids, propriété du cycle) par union-find
+        report = validate_mst(mst, graph, check_optimality=True)
+        if not report["valid"]:
+            print(f"Erreur: L'ACM pour {title} est invalide: {'; '.join(report['errors'])}")
             continue
-        visualize_graph(graph, mst, title, filename)
+        # Les images sont dessinées ensemble, en parallèle, une fois tous les ACM calculés
+        filename = f"{os.path.splitext(filename)[0]}.{image_format}"
+        mst_edges = mst.edge_list()
+        render_jobs.append((graph, mst_edges, title, filename))
         results.append({
             'title': title,
             'filename': filename,
             'num_vertices': graph.number_of_nodes(),
             'num_edges': graph.number_of_edges(),
-            'mst_edges': list(mst.edges()),
-            'mst_num_edges': mst.number_of_edges(),
-            'total_weight': total_weight,
-            'is_acyclic': is_acyclic(mst)
+            'mst_edges': [(u, v) for u, v, _ in mst_edges],
+            'mst_num_edges': len(mst),
+            'total_weight': mst.total_weight,
+            'is_acyclic': report['acyclic'],
+            'is_optimal': report['optimal'],
+            'mst_time': mst_time
         })
 
+    from rendu_graphes import render_graphs
+    start_time = time.perf_counter()
+    render_graphs(render_jobs, dpi=dpi)
+    render_time = time.perf_counter() - start_time
+
     # Afficher les résultats pour le rapport
     for result in results:
         print(f"\nGraphe: {result['title']}")
@@ -314,7 +1358,16 @@ def main():
         print(f"Nombre d'arêtes de l'ACM: {result['mst_num_edges']}")
         print(f"Poids total de l'ACM: {result['total_weight']}")
         print(f"L'ACM est acyclique: {result['is_acyclic']}")
+        print(f"Certificat d'optimalité (propriété du cycle): {result['is_optimal']}")
+        print(f"Temps de calcul de l'ACM: {result['mst_time'] * 1000:.3f} ms")
         print(f"Visualisation sauvegardée sous: {result['filename']}")
+    print(f"\nRendu des {len(render_jobs)} images: {render_time:.2f} s")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Calcul des ACM des graphes de test et rendu des images")
+    parser.add_argument("--format", choices=["png", "svg"], default="png")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=DEFAULT_CATALOG_SEED, help="Graine de base des graphes de test")
+    args = parser.parse_args()
+    main(args.format, args.dpi, args.seed)
\ No newline at end of file
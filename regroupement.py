@@ -0,0 +1,105 @@
+from noyau_kruskal import EdgeArrays, MSTResult, kruskal_edge_arrays, kruskal_mst, _component_labels
+
+# Nombre de voisins par point du graphe k-NN utilisé pour les nuages de points
+DEFAULT_NEIGHBOURS = 10
+
+# Dendrogramme du regroupement hiérarchique à lien simple, sous forme de tableaux compacts : la fusion i réunit les
+# groupes children[i] (0..n-1 : sommets, n + j : groupe formé par la fusion j) à la hauteur heights[i] (croissante),
+# en un groupe de sizes[i] sommets. sources/targets sont les arêtes de l'ACM qui réalisent chaque fusion.
+# Une forêt de c composantes donne n - c fusions
+class Dendrogram:
+    __slots__ = ("num_vertices", "children", "heights", "sizes", "sources", "targets", "nodes")
+
+    def __init__(self, num_vertices, children, heights, sizes, sources, targets, nodes=None):
+        self.num_vertices = num_vertices
+        self.children = children
+        self.heights = heights
+        self.sizes = sizes
+        self.sources = sources
+        self.targets = targets
+        self.nodes = nodes  # Identifiants d'origine des sommets (None : 0..n-1)
+
+    # Fusions de Kruskal : les arêtes de l'ACM par poids croissant, un union-find suivant le groupe de chaque racine
+    @classmethod
+    def from_mst(cls, result):
+        import numpy as np
+        order = np.argsort(result.weights, kind="stable")
+        sources, targets = result.sources[order], result.targets[order]
+        heights = result.weights[order].astype(np.float64)
+        num_vertices = result.num_vertices
+        parent = list(range(num_vertices))
+        cluster = list(range(num_vertices))
+        size = [1] * num_vertices
+        children = np.empty((len(order), 2), dtype=np.int64)
+        sizes = np.empty(len(order), dtype=np.int64)
+        for step, (u, v) in enumerate(zip(sources.tolist(), targets.tolist())):
+            # Recherche avec réduction de moitié du chemin
+            while parent[u] != u:
+                parent[u] = parent[parent[u]]
+                u = parent[u]
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            children[step] = cluster[u], cluster[v]
+            if size[u] < size[v]:
+                u, v = v, u
+            parent[v] = u
+            size[u] += size[v]
+            cluster[u] = num_vertices + step
+            sizes[step] = size[u]
+        return cls(num_vertices, children, heights, sizes, sources, targets, result.edges.nodes)
+
+    def __len__(self):
+        return len(self.heights)
+
+    # Nombre de fusions appliquées pour obtenir k groupes, ou pour fusionner tout ce qui est à distance <= threshold
+    def _merge_count(self, k=None, threshold=None):
+        import numpy as np
+        if (k is None) == (threshold is None):
+            raise ValueError("Indiquer soit un nombre de groupes k, soit un seuil de distance")
+        if k is not None:
+            if k < 1:
+                raise ValueError("Le nombre de groupes doit être au moins 1")
+            # Une forêt ne descend pas sous son nombre de composantes
+            return min(max(self.num_vertices - k, 0), len(self))
+        return int(np.searchsorted(self.heights, threshold, side="right"))
+
+    # Étiquette 0..g-1 du groupe de chaque sommet (numérotation dans l'ordre des sommets), sans recalculer l'ACM
+    def labels(self, k=None, threshold=None):
+        merges = self._merge_count(k, threshold)
+        parent = list(range(self.num_vertices))
+        for u, v in zip(self.sources[:merges].tolist(), self.targets[:merges].tolist()):
+            while parent[u] != u:
+                parent[u] = parent[parent[u]]
+                u = parent[u]
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            parent[v] = u
+        return _component_labels(parent)
+
+    # Matrice de liaison (fusions × 4 : groupe a, groupe b, hauteur, taille), au format de scipy.cluster.hierarchy
+    def linkage_matrix(self):
+        import numpy as np
+        return np.column_stack([self.children.astype(np.float64), self.heights, self.sizes.astype(np.float64)])
+
+# Arbre couvrant des données : MSTResult tel quel, Kruskal sur un graphe networkx ou des EdgeArrays, ou sur le
+# graphe des k plus proches voisins d'un nuage de points N×d (ACM approché si ce graphe ne contient pas l'ACM
+# euclidien exact, forêt s'il n'est pas connexe)
+def _spanning_tree(data, neighbours):
+    if isinstance(data, MSTResult):
+        return data
+    if isinstance(data, EdgeArrays):
+        return kruskal_edge_arrays(data)
+    if hasattr(data, "edges") and hasattr(data, "nodes"):
+        return kruskal_mst(data)
+    from index_spatial import knn_edges
+    return kruskal_edge_arrays(knn_edges(data, neighbours))
+
+# Regroupement à lien simple : Kruskal arrêté à k groupes, ou aux arêtes de poids <= threshold. data est un
+# nx.Graph, des EdgeArrays, un MSTResult déjà calculé ou un tableau de points N×d (graphe des `neighbours` plus
+# proches voisins, sans graphe complet). Retourne (étiquettes des sommets, dendrogramme complet) : d'autres
+# coupes s'obtiennent ensuite avec dendrogram.labels(k=...) ou dendrogram.labels(threshold=...)
+def single_linkage(data, k=None, threshold=None, neighbours=DEFAULT_NEIGHBOURS):
+    dendrogram = Dendrogram.from_mst(_spanning_tree(data, neighbours))
+    return dendrogram.labels(k, threshold), dendrogram
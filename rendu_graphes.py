@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import networkx as nx
+
+# Au-delà de ces tailles, les étiquettes (sommets, poids) sont omises : ce sont elles qui coûtent le plus à dessiner
+NODE_LABEL_LIMIT = 60
+EDGE_LABEL_LIMIT = 150
+
+# Au-delà, spring_layout est trop coûteux : disposition aléatoire (reproductible)
+SPRING_LAYOUT_LIMIT = 1000
+
+# Cache des dispositions du processus courant, indexé par la structure du graphe
+_layout_cache = {}
+
+# Sous-dossier (à côté des images) où render_graphs partage les dispositions entre ses processus et d'une exécution à l'autre
+LAYOUT_CACHE_DIRNAME = ".dispositions"
+
+
+def layout_key(graph, seed):
+    """Empreinte de la structure du graphe (sommets et arêtes, sans les poids) et de la graine"""
+    digest = hashlib.sha1(repr(seed).encode())
+    digest.update(repr(sorted(map(repr, graph.nodes()))).encode())
+    digest.update(repr(sorted(repr(sorted((repr(u), repr(v)))) for u, v in graph.edges())).encode())
+    return digest.hexdigest()
+
+
+def compute_layout(graph, seed=42, cache_dir=None):
+    """Disposition du graphe, réutilisée depuis le cache mémoire ou disque si la structure est inchangée"""
+    key = layout_key(graph, seed)
+    if key in _layout_cache:
+        return _layout_cache[key]
+
+    cache_file = os.path.join(cache_dir, f"{key}.json") if cache_dir else None
+    pos = _read_layout(cache_file, graph) if cache_file else None
+    if pos is None:
+        if graph.number_of_nodes() <= SPRING_LAYOUT_LIMIT:
+            try:
+                pos = nx.spring_layout(graph, seed=seed, iterations=50 if graph.number_of_nodes() <= 200 else 30)
+            except ImportError:
+                # Les grands graphes demandent scipy à networkx
+                pos = nx.random_layout(graph, seed=seed)
+        else:
+            pos = nx.random_layout(graph, seed=seed)
+        pos = {node: (float(x), float(y)) for node, (x, y) in pos.items()}
+        if cache_file:
+            _write_layout(cache_file, pos)
+
+    _layout_cache[key] = pos
+    return pos
+
+
+def _read_layout(cache_file, graph):
+    """Disposition lue depuis un fichier JSON du cache, ou None si elle est absente, illisible ou d'un autre graphe"""
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+        # Les sommets sont enregistrés par leur repr, qui fait partie de l'empreinte du graphe
+        nodes = {repr(node): node for node in graph.nodes()}
+        pos = {nodes[name]: (float(x), float(y)) for name, (x, y) in zip(data["nodes"], data["positions"])}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return pos if len(pos) == len(nodes) else None
+
+
+def _write_layout(cache_file, pos):
+    """Enregistrer une disposition en JSON ; fichier temporaire puis remplacement, car plusieurs processus partagent le cache"""
+    os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+    data = {"nodes": [repr(node) for node in pos], "positions": [list(xy) for xy in pos.values()]}
+    temporary = f"{cache_file}.{os.getpid()}.part"
+    try:
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temporary, cache_file)
+    except OSError:
+        # Le cache n'est qu'une optimisation : un dossier en lecture seule ne doit pas empêcher le rendu
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def render_graph(graph, mst_edges, title, filename, dpi=100, figsize=(12, 8), layout_cache_dir=None, seed=42):
+    """Dessiner un graphe et son ACM avec une figure Agg orientée objet (sans l'état global de pyplot)"""
+    # Importés ici : matplotlib n'est chargé que si l'on dessine
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    pos = compute_layout(graph, seed, layout_cache_dir)
+    num_nodes = graph.number_of_nodes()
+    node_size = 500 if num_nodes <= NODE_LABEL_LIMIT else max(4, 20000 // num_nodes)
+
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+    ax.set_axis_off()
+
+    # Dessiner le graphe original
+    nx.draw_networkx_edges(graph, pos, ax=ax, edge_color='gray', width=1.0 if num_nodes <= NODE_LABEL_LIMIT else 0.3)
+    nx.draw_networkx_nodes(graph, pos, ax=ax, node_color='lightblue', node_size=node_size)
+    if num_nodes <= NODE_LABEL_LIMIT:
+        nx.draw_networkx_labels(graph, pos, ax=ax, font_size=10)
+    if graph.number_of_edges() <= EDGE_LABEL_LIMIT:
+        edge_labels = nx.get_edge_attributes(graph, 'weight')
+        nx.draw_networkx_edge_labels(graph, pos, ax=ax, edge_labels=edge_labels, font_size=8)
+
+    # Mettre en évidence les arêtes de l'ACM en rouge
+    nx.draw_networkx_edges(graph, pos, ax=ax, edgelist=[(u, v) for u, v, *_ in mst_edges], edge_color='red',
+                           width=2 if num_nodes <= NODE_LABEL_LIMIT else 0.8)
+
+    ax.set_title(title)
+    # Le format (png, svg...) est déduit de l'extension du fichier ; compression PNG rapide (fichiers un peu plus gros)
+    options = {"pil_kwargs": {"compress_level": 1}} if filename.lower().endswith(".png") else {}
+    figure.savefig(filename, dpi=dpi, **options)
+    return filename
+
+
+def _render_job(job, options):
+    graph, mst_edges, title, filename = job
+    return render_graph(graph, mst_edges, title, filename, **options)
+
+
+def render_graphs(jobs, max_workers=None, dpi=100, figsize=(12, 8), layout_cache_dir=None, seed=42):
+    """Dessiner une série de (graphe, arêtes de l'ACM, titre, fichier) dans un pool de processus.
+
+    Les dispositions sont partagées par un cache disque, par défaut dans LAYOUT_CACHE_DIRNAME à côté de la première
+    image : le cache mémoire de chaque processus du pool disparaît avec lui.
+    """
+    if layout_cache_dir is None and jobs:
+        layout_cache_dir = os.path.join(os.path.dirname(os.path.abspath(jobs[0][3])), LAYOUT_CACHE_DIRNAME)
+    options = {"dpi": dpi, "figsize": figsize, "layout_cache_dir": layout_cache_dir, "seed": seed}
+    if len(jobs) <= 1:
+        return [_render_job(job, options) for job in jobs]
+    workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_render_job, job, options) for job in jobs]
+            return [future.result() for future in futures]
+    except (OSError, BrokenProcessPool):
+        # Plateforme sans multiprocessus disponible : repli séquentiel
+        return [_render_job(job, options) for job in jobs]
@@ -0,0 +1,78 @@
+import math
+import random
+
+import networkx as nx
+import pytest
+
+from acm_dynamique import DynamicMST
+from noyau_kruskal import kruskal_mst
+from validation_acm import validate_mst
+
+
+# Même arbre couvrant (poids, composantes, optimalité) que Kruskal recalculé sur le graphe miroir
+def check_against_kruskal(dynamic, mirror, rng):
+    expected = kruskal_mst(mirror)
+    assert math.isclose(dynamic.total_weight, expected.total_weight, abs_tol=1e-9)
+    assert dynamic.num_components == expected.num_components
+    report = validate_mst(dynamic.result(), mirror, check_optimality=True)
+    assert report["valid"], report["errors"]
+    vertices = list(mirror.nodes())
+    for _ in range(10):
+        u, v = rng.choice(vertices), rng.choice(vertices)
+        assert dynamic.connected(u, v) == nx.has_path(mirror, u, v)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_random_operations_match_recomputed_mst(seed):
+    rng = random.Random(seed)
+    num_vertices = 25
+    # Poids entiers pour la moitié des graines (égalités fréquentes), flottants pour les autres
+    draw = (lambda: rng.randint(1, 5)) if seed % 2 else rng.random
+    mirror = nx.gnm_random_graph(num_vertices, 40, seed=seed)
+    for u, v in mirror.edges():
+        mirror[u][v]["weight"] = draw()
+    dynamic = DynamicMST(mirror)
+    check_against_kruskal(dynamic, mirror, rng)
+
+    for _ in range(300):
+        operation = rng.random()
+        edges = list(mirror.edges())
+        if operation < 0.4 or not edges:
+            u, v = rng.sample(range(num_vertices), 2)
+            weight = draw()
+            dynamic.insert_edge(u, v, weight)
+            mirror.add_edge(u, v, weight=weight)
+        elif operation < 0.7:
+            u, v = rng.choice(edges)
+            weight = draw()
+            assert dynamic.update_weight(u, v, weight) == dynamic.in_tree(u, v)
+            mirror[u][v]["weight"] = weight
+        else:
+            u, v = rng.choice(edges)
+            dynamic.delete_edge(u, v)
+            mirror.remove_edge(u, v)
+            assert not dynamic.has_edge(u, v)
+        check_against_kruskal(dynamic, mirror, rng)
+
+
+def test_unknown_vertices_leave_the_structure_unchanged():
+    graph = nx.path_graph(4)
+    nx.set_edge_attributes(graph, 1, "weight")
+    dynamic = DynamicMST(graph)
+    assert dynamic.num_components == 1
+
+    assert not dynamic.in_tree(8, 9)
+    assert not dynamic.has_edge(8, 9)
+    assert not dynamic.connected(8, 9)
+    assert not dynamic.connected(0, 9)
+    with pytest.raises(KeyError):
+        dynamic.update_weight(8, 9, 2)
+    with pytest.raises(KeyError):
+        dynamic.delete_edge(0, 9)
+    with pytest.raises(KeyError):
+        dynamic.delete_edge(0, 2)
+    assert dynamic.num_components == 1
+    assert len(dynamic.vertices) == 4
+
+    with pytest.raises(ValueError):
+        dynamic.insert_edge(1, 1, 3)
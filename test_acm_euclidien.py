@@ -0,0 +1,46 @@
+import math
+
+import numpy as np
+import pytest
+
+from acm_euclidien import euclidean_mst
+from noyau_kruskal import EdgeArrays, kruskal_edge_arrays
+from validation_acm import validate_mst
+
+
+# Graphe complet d'un nuage de points, pondéré par la distance euclidienne
+def complete_edges(points):
+    sources, targets = np.triu_indices(len(points), k=1)
+    weights = np.sqrt(((points[sources] - points[targets]) ** 2).sum(axis=1))
+    return EdgeArrays(len(points), sources.astype(np.int64), targets.astype(np.int64), weights)
+
+
+# Nuages reproductibles : uniformes, en amas, sur une grille entière (distances égales et doublons), en 1D et 3D
+def point_clouds():
+    rng = np.random.default_rng(2024)
+    yield "uniforme", rng.random((300, 2))
+    yield "amas", np.vstack([rng.normal(center, 0.02, size=(60, 2)) for center in rng.random((5, 2)) * 10])
+    yield "grille", rng.integers(0, 6, size=(150, 2)).astype(np.float64)
+    yield "1d", rng.random((120, 1))
+    yield "3d", rng.random((200, 3))
+    yield "petit", rng.random((3, 2))
+
+
+@pytest.mark.parametrize("name, points", list(point_clouds()))
+@pytest.mark.parametrize("neighbours, leaf_size", [(8, 16), (2, 4), (1, 1)])
+def test_matches_complete_graph_mst(name, points, neighbours, leaf_size):
+    expected = kruskal_edge_arrays(complete_edges(points))
+    result = euclidean_mst(points, neighbours=neighbours, leaf_size=leaf_size)
+    assert math.isclose(result.total_weight, expected.total_weight, rel_tol=1e-9)
+    assert len(result) == len(points) - 1
+    assert result.num_components == 1
+    report = validate_mst(result, complete_edges(points), check_optimality=True)
+    assert report["valid"], report["errors"]
+
+
+def test_trivial_inputs():
+    assert len(euclidean_mst(np.zeros((0, 2)))) == 0
+    single = euclidean_mst(np.array([[1.0, 2.0]]))
+    assert len(single) == 0 and single.total_weight == 0
+    duplicates = euclidean_mst(np.ones((10, 2)))
+    assert len(duplicates) == 9 and duplicates.total_weight == 0
@@ -0,0 +1,67 @@
+import math
+import random
+from itertools import combinations
+
+import networkx as nx
+import pytest
+
+from arbres_k_meilleurs import k_best_spanning_trees
+from noyau_kruskal import EdgeArrays
+
+
+# Petit graphe aléatoire reproductible ; des poids entiers de 1 à 4 donnent beaucoup d'égalités
+def small_graph(seed, num_vertices=6, num_edges=9, connected=True):
+    rng = random.Random(seed)
+    graph = nx.gnm_random_graph(num_vertices, num_edges, seed=seed)
+    if connected:
+        nx.add_path(graph, range(num_vertices))
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = rng.randint(1, 4)
+    return graph
+
+
+# Tous les arbres (forêts) couvrants par énumération des sous-ensembles de n - c arêtes acycliques
+def brute_force_trees(edges):
+    num_components = nx.number_connected_components(edges.to_networkx())
+    pairs = list(zip(edges.sources.tolist(), edges.targets.tolist()))
+    trees = []
+    for subset in combinations(range(len(pairs)), edges.num_vertices - num_components):
+        forest = nx.Graph()
+        forest.add_nodes_from(range(edges.num_vertices))
+        forest.add_edges_from(pairs[i] for i in subset)
+        if nx.is_forest(forest):
+            trees.append((float(edges.weights[list(subset)].sum()), frozenset(subset)))
+    return sorted(trees, key=lambda tree: tree[0])
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_enumeration_matches_brute_force(seed):
+    edges = EdgeArrays.from_networkx(small_graph(seed))
+    expected = brute_force_trees(edges)
+    trees = list(k_best_spanning_trees(edges))
+
+    assert len(trees) == len(expected)
+    assert len({frozenset(tree.edge_indices.tolist()) for tree in trees}) == len(trees)
+    assert {frozenset(tree.edge_indices.tolist()) for tree in trees} == {subset for _, subset in expected}
+    weights = [tree.total_weight for tree in trees]
+    assert all(math.isclose(a, b) for a, b in zip(weights, [weight for weight, _ in expected]))
+    assert all(a <= b + 1e-9 for a, b in zip(weights, weights[1:]))
+
+
+def test_disconnected_graph_yields_spanning_forests():
+    graph = nx.disjoint_union(small_graph(1, num_vertices=4, num_edges=5), small_graph(2, num_vertices=4, num_edges=5))
+    edges = EdgeArrays.from_networkx(graph)
+    expected = brute_force_trees(edges)
+    trees = list(k_best_spanning_trees(edges))
+    assert len(trees) == len(expected)
+    assert all(tree.num_components == 2 for tree in trees)
+    assert all(math.isclose(tree.total_weight, weight) for tree, (weight, _) in zip(trees, expected))
+
+
+def test_k_limits_the_number_of_trees():
+    graph = small_graph(3)
+    expected = brute_force_trees(EdgeArrays.from_networkx(graph))
+    trees = list(k_best_spanning_trees(graph, k=5))
+    assert len(trees) == 5
+    assert all(math.isclose(tree.total_weight, weight) for tree, (weight, _) in zip(trees, expected))
+    assert list(k_best_spanning_trees(graph, k=0)) == []
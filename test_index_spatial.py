@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from index_spatial import GridIndex, KDTree, knn_edges
+
+
+def pairwise_distances(points):
+    return np.sqrt(((points[:, None, :] - points[None, :, :]) ** 2).sum(axis=2))
+
+
+# Nuages reproductibles : uniformes, en amas, sur une grille entière (distances égales et doublons), en 1D et 3D
+def point_clouds():
+    rng = np.random.default_rng(77)
+    yield "uniforme", rng.random((250, 2))
+    yield "amas", np.vstack([rng.normal(center, 0.01, size=(40, 2)) for center in rng.random((6, 2)) * 20])
+    yield "grille", rng.integers(0, 5, size=(120, 2)).astype(np.float64)
+    yield "1d", rng.random((100, 1))
+    yield "3d", rng.random((150, 3))
+    yield "petit", rng.random((3, 2))
+
+
+def indexes(points):
+    yield GridIndex(points)
+    yield GridIndex(points, points_per_cell=1)
+    for leaf_size in (1, 3, 16):
+        yield KDTree(points, leaf_size)
+
+
+# Les distances retournées sont les k plus petites (le point lui-même exclu), par ordre croissant, et chaque
+# indice est bien à la distance annoncée (les égalités peuvent départager les indices autrement)
+def check_knn(points, indices, distances, k):
+    expected = pairwise_distances(points)
+    np.fill_diagonal(expected, np.inf)
+    k = min(k, len(points) - 1)
+    assert indices.shape == distances.shape == (len(points), k)
+    assert np.allclose(distances, np.sort(expected, axis=1)[:, :k])
+    rows = np.arange(len(points))[:, None]
+    assert (indices != rows).all()
+    assert np.allclose(expected[rows, indices], distances)
+    assert all(len(set(row)) == k for row in indices.tolist())
+
+
+@pytest.mark.parametrize("name, points", list(point_clouds()))
+@pytest.mark.parametrize("k", [1, 4, 10])
+def test_knn_matches_brute_force(name, points, k):
+    for index in indexes(points):
+        indices, distances = index.knn(k)
+        check_knn(points, indices, distances, k)
+
+
+@pytest.mark.parametrize("name, points", list(point_clouds()))
+def test_nearest_other_matches_brute_force(name, points):
+    rng = np.random.default_rng(5)
+    labels = rng.integers(0, 4, len(points))
+    expected = pairwise_distances(points)
+    expected[labels[:, None] == labels[None, :]] = np.inf
+    for leaf_size in (1, 3, 16):
+        tree = KDTree(points, leaf_size)
+        queries = np.arange(len(points))
+        found, distances = tree.nearest_other(queries, labels)
+        assert np.allclose(distances, expected.min(axis=1))
+        reached = np.isfinite(distances)
+        assert (labels[found[reached]] != labels[reached]).all()
+        assert np.allclose(expected[queries[reached], found[reached]], distances[reached])
+        assert (found[~reached] == -1).all()
+
+
+@pytest.mark.parametrize("name, points", list(point_clouds()))
+def test_knn_edges_is_the_symmetric_knn_graph(name, points):
+    k = 5
+    edges = knn_edges(points, k=k)
+    distances = pairwise_distances(points)
+    np.fill_diagonal(distances, np.inf)
+    kth = np.sort(distances, axis=1)[:, min(k, len(points) - 1) - 1]
+    pairs = set(zip(edges.sources.tolist(), edges.targets.tolist()))
+    assert all(u < v for u, v in pairs) and len(pairs) == len(edges)
+    assert np.allclose(edges.weights, distances[edges.sources, edges.targets])
+    # Chaque arête relie l'une de ses extrémités à l'un de ses k plus proches voisins ; chaque point a au moins k arêtes
+    assert (np.maximum(kth[edges.sources], kth[edges.targets]) >= edges.weights - 1e-12).all()
+    degrees = np.bincount(np.concatenate([edges.sources, edges.targets]), minlength=len(points))
+    assert (degrees >= min(k, len(points) - 1)).all()
+
+
+def test_invalid_and_degenerate_inputs():
+    with pytest.raises(ValueError):
+        KDTree(np.zeros(5))
+    with pytest.raises(ValueError):
+        GridIndex(np.zeros(5))
+    for index in (KDTree(np.ones((1, 2))), GridIndex(np.ones((1, 2)))):
+        indices, distances = index.knn(3)
+        assert indices.shape == distances.shape == (1, 0)
+    duplicates = np.ones((6, 2))
+    for index in indexes(duplicates):
+        indices, distances = index.knn(2)
+        check_knn(duplicates, indices, distances, 2)
@@ -0,0 +1,92 @@
+import math
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from noyau_kruskal import (DENSE_PRIM_MAX_VERTICES, EdgeArrays, batch_mst, kruskal_mst, prim_dense_mst, prim_mst,
+                           select_mst_algorithm)
+from validation_acm import validate_mst
+
+
+# Graphe G(n, p) reproductible ; weights : "float" (poids distincts presque sûrement) ou "ties" (entiers 1..3)
+def random_dense_graph(seed, num_vertices=60, density=0.5, weights="float"):
+    rng = random.Random(seed)
+    graph = nx.gnp_random_graph(num_vertices, density, seed=seed)
+    for u, v in graph.edges():
+        graph[u][v]["weight"] = rng.random() if weights == "float" else rng.randint(1, 3)
+    return graph
+
+
+def partition(result):
+    return {frozenset(members) for members in result.component_members()}
+
+
+@pytest.mark.parametrize("weights", ["float", "ties"])
+def test_dense_prim_matches_kruskal_weight(weights):
+    for seed in range(8):
+        graph = random_dense_graph(seed, weights=weights)
+        expected = kruskal_mst(graph)
+        for result in (prim_dense_mst(graph), prim_mst(graph)):
+            assert math.isclose(result.total_weight, expected.total_weight)
+            assert len(result) == len(expected)
+            assert result.is_spanning_tree() == expected.is_spanning_tree()
+
+
+def test_dense_prim_spans_every_component():
+    for seed in range(5):
+        # Plusieurs graphes denses disjoints et un sommet isolé : une forêt couvrante
+        graph = nx.disjoint_union_all([random_dense_graph(seed + i, num_vertices=15 + 5 * i) for i in range(3)])
+        graph.add_node("isolé")
+        expected = kruskal_mst(graph)
+        result = prim_dense_mst(graph)
+        assert result.num_components == expected.num_components == 4
+        assert partition(result) == partition(expected)
+        assert math.isclose(result.total_weight, expected.total_weight)
+        assert len(result) == graph.number_of_nodes() - 4
+
+
+def test_dense_prim_is_selected_for_dense_graphs():
+    assert select_mst_algorithm(random_dense_graph(0, num_vertices=200, density=0.5)) == "prim_dense"
+    assert select_mst_algorithm(nx.path_graph(200)) == "kruskal"
+
+
+def test_dense_prim_rejects_too_many_vertices():
+    graph = nx.empty_graph(DENSE_PRIM_MAX_VERTICES + 1)
+    with pytest.raises(ValueError):
+        prim_dense_mst(graph)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_batch_mst_matches_kruskal_per_scenario(parallel):
+    rng = np.random.default_rng(5)
+    # Topologie déconnectée (deux morceaux et un sommet isolé) partagée par tous les scénarios
+    topology = nx.disjoint_union(nx.gnm_random_graph(30, 70, seed=1), nx.gnm_random_graph(12, 20, seed=2))
+    topology.add_node("isolé")
+    edges = EdgeArrays.from_networkx(topology)
+    weight_matrix = np.vstack([rng.random(len(edges)), rng.integers(1, 4, len(edges)), rng.random(len(edges))])
+    batch = batch_mst(topology, weight_matrix, parallel=parallel, max_workers=2)
+    assert len(batch) == len(weight_matrix)
+
+    for scenario, weights in enumerate(weight_matrix):
+        graph = topology.copy()
+        for u, v, w in zip(edges.sources.tolist(), edges.targets.tolist(), weights.tolist()):
+            graph[edges.nodes[u]][edges.nodes[v]]["weight"] = w
+        expected = kruskal_mst(graph)
+        result = batch.result(scenario)
+        assert math.isclose(batch.totals[scenario], expected.total_weight)
+        assert math.isclose(result.total_weight, weights[batch.accepted(scenario)].sum())
+        assert result.num_components == expected.num_components
+        assert partition(result) == partition(expected)
+        report = validate_mst(result, graph, check_optimality=True)
+        assert report["valid"], report["errors"]
+
+    frequency = batch.acceptance_frequency()
+    assert frequency.shape == (len(edges),) and ((0 <= frequency) & (frequency <= 1)).all()
+
+
+def test_batch_mst_rejects_mismatched_weight_matrix():
+    topology = nx.cycle_graph(5)
+    with pytest.raises(ValueError):
+        batch_mst(topology, np.ones((2, 4)))
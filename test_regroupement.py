@@ -0,0 +1,91 @@
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from regroupement import single_linkage
+
+
+# Graphe connexe reproductible, poids distincts : le regroupement à lien simple est unique
+def random_graph(seed, num_vertices=25, num_edges=60):
+    rng = random.Random(seed)
+    graph = nx.gnm_random_graph(num_vertices, num_edges, seed=seed)
+    nx.add_path(graph, range(num_vertices))
+    for (u, v), weight in zip(graph.edges(), rng.sample(range(1, 1000), graph.number_of_edges())):
+        graph[u][v]["weight"] = weight
+    return graph
+
+
+def groups(labels):
+    clusters = {}
+    for vertex, label in enumerate(labels.tolist()):
+        clusters.setdefault(label, set()).add(vertex)
+    return {frozenset(members) for members in clusters.values()}
+
+
+# Agglomération naïve : fusionner à chaque étape les deux groupes reliés par l'arête la plus légère
+def brute_force_k_groups(graph, k):
+    clusters = [{v} for v in graph.nodes()]
+    while len(clusters) > k:
+        _, i, j = min((min((graph[u][v]["weight"] for u in a for v in b if graph.has_edge(u, v)), default=np.inf),
+                       i, j) for i, a in enumerate(clusters) for j, b in enumerate(clusters) if i < j)
+        clusters[i] |= clusters.pop(j)
+    return {frozenset(members) for members in clusters}
+
+
+# Groupes au seuil t : composantes du graphe réduit aux arêtes de poids <= t
+def brute_force_threshold(graph, threshold):
+    light = nx.Graph()
+    light.add_nodes_from(graph.nodes())
+    light.add_edges_from((u, v) for u, v, w in graph.edges(data="weight") if w <= threshold)
+    return {frozenset(component) for component in nx.connected_components(light)}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cuts_match_brute_force(seed):
+    graph = random_graph(seed)
+    _, dendrogram = single_linkage(graph, k=1)
+    for k in (1, 2, 5, 10, 25):
+        assert groups(dendrogram.labels(k=k)) == brute_force_k_groups(graph, k)
+    for threshold in (50, 200, 400, 800):
+        labels, _ = single_linkage(graph, threshold=threshold)
+        assert groups(labels) == brute_force_threshold(graph, threshold)
+
+
+def test_linkage_matrix_is_consistent():
+    graph = random_graph(9)
+    _, dendrogram = single_linkage(graph, k=1)
+    linkage = dendrogram.linkage_matrix()
+    n = graph.number_of_nodes()
+    assert linkage.shape == (n - 1, 4)
+    assert (np.diff(linkage[:, 2]) >= 0).all()
+    assert linkage[-1, 3] == n
+    # Chaque groupe (sommet ou fusion précédente) est fusionné une seule fois, après sa création
+    merged = linkage[:, :2].astype(int)
+    assert len(set(merged.ravel().tolist())) == 2 * (n - 1)
+    assert all((row < n + step).all() for step, row in enumerate(merged))
+
+
+def test_point_cloud_matches_complete_graph():
+    rng = np.random.default_rng(3)
+    # Trois amas bien séparés
+    points = np.vstack([rng.normal(center, 0.1, size=(15, 2)) for center in ((0, 0), (5, 0), (0, 5))])
+    complete = nx.Graph()
+    for i in range(len(points)):
+        for j in range(i + 1, len(points)):
+            complete.add_edge(i, j, weight=float(np.linalg.norm(points[i] - points[j])))
+    labels, _ = single_linkage(points, k=3, neighbours=len(points) - 1)
+    expected, _ = single_linkage(complete, k=3)
+    assert groups(labels) == groups(expected)
+    assert groups(labels) == {frozenset(range(i, i + 15)) for i in (0, 15, 30)}
+
+
+def test_forest_keeps_its_components():
+    graph = nx.disjoint_union(random_graph(1, num_vertices=6, num_edges=8),
+                              random_graph(2, num_vertices=5, num_edges=6))
+    labels, dendrogram = single_linkage(graph, k=1)
+    assert len(dendrogram) == graph.number_of_nodes() - 2
+    assert groups(labels) == {frozenset(c) for c in nx.connected_components(graph)}
+    with pytest.raises(ValueError):
+        single_linkage(graph)
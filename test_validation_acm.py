@@ -0,0 +1,91 @@
+import math
+import random
+
+import networkx as nx
+
+from noyau_kruskal import EdgeArrays, MSTResult, kruskal_edge_arrays, kruskal_mst
+from validation_acm import PathMaximum, validate_mst
+
+
+# Graphe aléatoire reproductible, poids entiers distincts (ACM unique)
+def random_graph(seed, num_vertices=30, num_edges=80):
+    rng = random.Random(seed)
+    graph = nx.gnm_random_graph(num_vertices, num_edges, seed=seed)
+    for (u, v), weight in zip(graph.edges(), rng.sample(range(1, 10 * num_edges), num_edges)):
+        graph[u][v]["weight"] = weight
+    return graph
+
+
+def tree_result(graph, tree_edges):
+    vertices = list(graph.nodes())
+    edges = [(u, v, graph[u][v]["weight"]) for u, v in tree_edges]
+    roots = [0] * len(vertices)
+    return MSTResult.from_edge_list(vertices, edges, sum(w for _, _, w in edges), roots)
+
+
+def test_kruskal_results_are_valid_and_optimal():
+    for seed in range(10):
+        graph = random_graph(seed)
+        report = validate_mst(kruskal_mst(graph), graph, check_optimality=True)
+        assert report["valid"], report["errors"]
+        assert report["optimal"] and report["spanning"] and report["acyclic"]
+
+
+def test_suboptimal_spanning_tree_is_rejected():
+    for seed in range(10):
+        graph = random_graph(seed, num_edges=120)
+        if not nx.is_connected(graph):
+            continue
+        bfs_tree = list(nx.bfs_edges(graph, 0))
+        result = tree_result(graph, bfs_tree)
+        report = validate_mst(result, graph, check_optimality=True)
+        # Poids distincts : l'arbre du parcours est optimal si et seulement s'il est l'ACM
+        is_mst = math.isclose(result.total_weight, kruskal_mst(graph).total_weight)
+        assert report["acyclic"] and report["spanning"]
+        assert report["optimal"] == is_mst
+        assert report["valid"] == is_mst
+
+
+def test_cycle_and_wrong_weight_are_reported():
+    graph = random_graph(3)
+    mst = kruskal_mst(graph)
+    edges = mst.edge_list()
+    extra = next((u, v, w) for u, v, w in graph.edges(data="weight") if not any(
+        {u, v} == {a, b} for a, b, _ in edges))
+    vertices = list(graph.nodes())
+    cyclic = MSTResult.from_edge_list(vertices, edges + [extra], mst.total_weight + extra[2], [0] * len(vertices))
+    report = validate_mst(cyclic, graph)
+    assert not report["valid"] and not report["acyclic"]
+
+    wrong_weight = MSTResult.from_edge_list(vertices, edges, mst.total_weight + 1, [0] * len(vertices))
+    report = validate_mst(wrong_weight, graph)
+    assert not report["valid"] and not report["weight"]
+
+
+def test_path_maximum_matches_brute_force():
+    rng = random.Random(7)
+    for seed in range(5):
+        # Forêt de plusieurs arbres : ACM d'un graphe peu dense
+        graph = random_graph(seed, num_vertices=40, num_edges=45)
+        mst = kruskal_mst(graph)
+        forest = nx.Graph()
+        forest.add_nodes_from(range(mst.num_vertices))
+        forest.add_weighted_edges_from(zip(mst.sources.tolist(), mst.targets.tolist(), mst.weights.tolist()))
+        path_maximum = PathMaximum(mst.num_vertices, mst.sources, mst.targets, mst.weights)
+
+        pairs = [(rng.randrange(mst.num_vertices), rng.randrange(mst.num_vertices)) for _ in range(200)]
+        maxima = path_maximum.query([u for u, _ in pairs], [v for _, v in pairs])
+        for (u, v), maximum in zip(pairs, maxima.tolist()):
+            if not nx.has_path(forest, u, v):
+                assert math.isnan(maximum)
+                continue
+            path = nx.shortest_path(forest, u, v)
+            expected = max((forest[a][b]["weight"] for a, b in zip(path, path[1:])), default=-math.inf)
+            assert maximum == expected
+
+
+def test_edge_arrays_input_is_accepted():
+    for seed in range(5):
+        edges = EdgeArrays.from_networkx(random_graph(seed))
+        report = validate_mst(kruskal_edge_arrays(edges), edges, check_optimality=True)
+        assert report["valid"], report["errors"]
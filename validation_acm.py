@@ -0,0 +1,227 @@
+import math
+
+from noyau_kruskal import EdgeArrays
+
+# Tolérance par défaut sur les comparaisons de poids (flottants)
+DEFAULT_TOLERANCE = 1e-9
+
+# Arêtes (sources, targets, weights) du graphe d'origine, numérotées comme les sommets du résultat
+def graph_arrays(graph, result):
+    import numpy as np
+    if isinstance(graph, EdgeArrays):
+        if graph.num_vertices != result.num_vertices:
+            raise ValueError("Le graphe et l'ACM n'ont pas le même nombre de sommets")
+        return graph.sources, graph.targets, graph.weights
+
+    nodes = result.edges.nodes if result.edges.nodes is not None else range(result.num_vertices)
+    index = {node: i for i, node in enumerate(nodes)}
+    if graph.number_of_nodes() != len(index):
+        raise ValueError("Le graphe et l'ACM n'ont pas le même nombre de sommets")
+    num_edges = graph.number_of_edges()
+    sources = np.empty(num_edges, dtype=np.int64)
+    targets = np.empty(num_edges, dtype=np.int64)
+    weights = np.empty(num_edges, dtype=np.float64)
+    try:
+        for i, (u, v, weight) in enumerate(graph.edges(data='weight', default=1.0)):
+            sources[i], targets[i], weights[i] = index[u], index[v], weight
+    except KeyError as error:
+        raise ValueError(f"Sommet {error.args[0]!r} absent de l'ACM") from None
+    return sources, targets, weights
+
+# Passe union-find sur des indices entiers : nombre de composantes et nombre d'arêtes fermant un cycle
+def union_find_pass(num_vertices, sources, targets):
+    parent = list(range(num_vertices))
+    size = [1] * num_vertices
+    components = num_vertices
+    redundant = 0
+    for u, v in zip(sources.tolist(), targets.tolist()):
+        # Recherche avec réduction de moitié du chemin
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        if u == v:
+            redundant += 1
+            continue
+        if size[u] < size[v]:
+            u, v = v, u
+        parent[v] = u
+        size[u] += size[v]
+        components -= 1
+    return components, redundant
+
+# Requêtes « poids maximal sur le chemin de la forêt entre u et v » par sauts binaires (binary lifting).
+# Construction en O(n log n), requêtes vectorisées en O(log n) chacune. Avec edge_ids (identifiant de chaque
+# arête de la forêt), les requêtes peuvent aussi retourner l'arête qui atteint le maximum
+class PathMaximum:
+    def __init__(self, num_vertices, sources, targets, weights, edge_ids=None):
+        import numpy as np
+        ends = np.concatenate([sources, targets])
+        others = np.concatenate([targets, sources]).tolist()
+        edge_weights = np.concatenate([weights, weights]).astype(np.float64).tolist()
+        ids = np.arange(len(sources)) if edge_ids is None else np.asarray(edge_ids)
+        edge_labels = np.concatenate([ids, ids]).tolist()
+        order = np.argsort(ends, kind="stable").tolist()
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(ends, minlength=num_vertices))]).tolist()
+
+        # Parcours en largeur de chaque arbre : parent, poids de l'arête vers le parent, profondeur, racine
+        parent = list(range(num_vertices))
+        parent_weight = [-math.inf] * num_vertices
+        parent_edge = [-1] * num_vertices
+        depth = [0] * num_vertices
+        tree = [-1] * num_vertices
+        for root in range(num_vertices):
+            if tree[root] != -1:
+                continue
+            tree[root] = root
+            queue = [root]
+            for vertex in queue:
+                for position in order[offsets[vertex]:offsets[vertex + 1]]:
+                    neighbour = others[position]
+                    if tree[neighbour] == -1:
+                        tree[neighbour] = root
+                        parent[neighbour] = vertex
+                        parent_weight[neighbour] = edge_weights[position]
+                        parent_edge[neighbour] = edge_labels[position]
+                        depth[neighbour] = depth[vertex] + 1
+                        queue.append(neighbour)
+
+        self.depth = np.array(depth, dtype=np.int64)
+        self.tree = np.array(tree, dtype=np.int64)
+        # up[k][v] : ancêtre de v à distance 2^k ; best[k][v] : poids maximal sur ce segment de chemin,
+        # best_edge[k][v] : arête qui l'atteint
+        self.up = [np.array(parent, dtype=np.int64)]
+        self.best = [np.array(parent_weight, dtype=np.float64)]
+        self.best_edge = [np.array(parent_edge, dtype=np.int64)]
+        for _ in range(1, max(1, int(self.depth.max(initial=0)).bit_length())):
+            previous_up, previous_best, previous_edge = self.up[-1], self.best[-1], self.best_edge[-1]
+            upper_best = previous_best[previous_up]
+            self.up.append(previous_up[previous_up])
+            self.best.append(np.maximum(previous_best, upper_best))
+            self.best_edge.append(np.where(previous_best >= upper_best, previous_edge, previous_edge[previous_up]))
+
+    # Poids maximal sur le chemin entre us[i] et vs[i] (-inf si us[i] == vs[i], nan s'ils sont dans deux arbres).
+    # Avec return_edges=True, retourne aussi l'identifiant de l'arête maximale (-1 si le chemin est vide)
+    def query(self, us, vs, return_edges=False):
+        import numpy as np
+        us = np.asarray(us, dtype=np.int64)
+        vs = np.asarray(vs, dtype=np.int64)
+        different_trees = self.tree[us] != self.tree[vs]
+        swap = self.depth[us] < self.depth[vs]
+        us, vs = np.where(swap, vs, us), np.where(swap, us, vs)
+        maxima = np.full(len(us), -math.inf)
+        arg_edges = np.full(len(us), -1, dtype=np.int64)
+
+        # Intégrer le segment best[k][sommets] pour les requêtes sélectionnées par mask
+        def absorb(mask, best, best_edge, vertices):
+            candidates = best[vertices[mask]]
+            better = candidates > maxima[mask]
+            selected = np.flatnonzero(mask)[better]
+            maxima[selected] = candidates[better]
+            arg_edges[selected] = best_edge[vertices[selected]]
+
+        # Remonter le sommet le plus profond au niveau de l'autre
+        difference = self.depth[us] - self.depth[vs]
+        for k, (up, best, best_edge) in enumerate(zip(self.up, self.best, self.best_edge)):
+            mask = ((difference >> k) & 1).astype(bool)
+            absorb(mask, best, best_edge, us)
+            us[mask] = up[us[mask]]
+
+        # Remonter les deux sommets ensemble jusque sous leur plus proche ancêtre commun
+        for up, best, best_edge in zip(reversed(self.up), reversed(self.best), reversed(self.best_edge)):
+            mask = up[us] != up[vs]
+            absorb(mask, best, best_edge, us)
+            absorb(mask, best, best_edge, vs)
+            us[mask] = up[us[mask]]
+            vs[mask] = up[vs[mask]]
+        mask = us != vs
+        absorb(mask, self.best[0], self.best_edge[0], us)
+        absorb(mask, self.best[0], self.best_edge[0], vs)
+
+        maxima[different_trees] = math.nan
+        if return_edges:
+            arg_edges[different_trees] = -1
+            return maxima, arg_edges
+        return maxima
+
+# Certificat d'optimalité (propriété du cycle) : chaque arête du graphe pèse au moins autant que l'arête la plus
+# lourde du chemin de la forêt entre ses extrémités. Retourne les indices des arêtes qui violent la propriété
+def cycle_property_violations(result, sources, targets, weights, tolerance=DEFAULT_TOLERANCE):
+    import numpy as np
+    path_maximum = PathMaximum(result.num_vertices, result.sources, result.targets, result.weights)
+    maxima = path_maximum.query(sources, targets)
+    # Une comparaison avec nan (extrémités dans deux arbres) est fausse : ce cas relève de la couverture
+    return np.flatnonzero(weights < maxima - tolerance)
+
+# Arêtes de l'ACM absentes du graphe (ou de poids différent), via un dictionnaire des paires du graphe
+def _missing_edges(result, sources, targets, weights, tolerance):
+    graph_weights = {}
+    for u, v, weight in zip(sources.tolist(), targets.tolist(), weights.tolist()):
+        key = (u, v) if u <= v else (v, u)
+        graph_weights.setdefault(key, set()).add(weight)
+    missing = []
+    for u, v, weight in zip(result.sources.tolist(), result.targets.tolist(), result.weights.tolist()):
+        candidates = graph_weights.get((u, v) if u <= v else (v, u), ())
+        if not any(abs(weight - candidate) <= tolerance for candidate in candidates):
+            missing.append((u, v, weight))
+    return missing
+
+# Valider un MSTResult en temps quasi linéaire (union-find uniquement) : acyclicité, nombre d'arêtes n - c,
+# étiquettes de composantes, poids total et, si le graphe d'origine est fourni, couverture et appartenance des
+# arêtes. check_optimality ajoute le certificat de la propriété du cycle (O(E log V)).
+# Retourne un rapport (dictionnaire) dont la clé "valid" résume la validation et "errors" liste les problèmes
+def validate_mst(result, graph=None, check_optimality=False, tolerance=DEFAULT_TOLERANCE):
+    num_vertices = result.num_vertices
+    errors = []
+
+    mst_components, redundant = union_find_pass(num_vertices, result.sources, result.targets)
+    if redundant:
+        errors.append(f"{redundant} arête(s) de l'ACM ferment un cycle")
+    if len(result) != num_vertices - mst_components:
+        errors.append(f"{len(result)} arêtes au lieu de n - c = {num_vertices - mst_components}")
+
+    components = result.components
+    if len(components) != num_vertices or result.num_components != mst_components or \
+            (len(result) and not (components[result.sources] == components[result.targets]).all()):
+        errors.append("Les étiquettes de composantes ne correspondent pas aux arêtes de l'ACM")
+
+    edge_weight_sum = float(result.weights.sum())
+    weight_ok = math.isclose(edge_weight_sum, result.total_weight, rel_tol=tolerance, abs_tol=tolerance)
+    if not weight_ok:
+        errors.append(f"Poids total {result.total_weight} différent de la somme des arêtes {edge_weight_sum}")
+
+    report = {
+        "num_vertices": num_vertices,
+        "num_edges": len(result),
+        "num_components": mst_components,
+        "acyclic": redundant == 0,
+        "edge_count": len(result) == num_vertices - mst_components,
+        "weight": weight_ok,
+        "spanning": None,
+        "optimal": None,
+        "violations": None,
+        "errors": errors
+    }
+
+    if graph is not None:
+        sources, targets, weights = graph_arrays(graph, result)
+        graph_components, _ = union_find_pass(num_vertices, sources, targets)
+        report["spanning"] = graph_components == mst_components
+        if not report["spanning"]:
+            errors.append(f"La forêt a {mst_components} composantes, le graphe {graph_components}")
+        # Inutile de vérifier l'appartenance si le résultat référence directement les tableaux du graphe
+        if result.edges is not graph:
+            missing = _missing_edges(result, sources, targets, weights, tolerance)
+            if missing:
+                errors.append(f"{len(missing)} arête(s) de l'ACM absentes du graphe, par exemple {missing[0]}")
+        if check_optimality:
+            violations = cycle_property_violations(result, sources, targets, weights, tolerance)
+            report["optimal"] = len(violations) == 0
+            report["violations"] = violations.tolist()
+            if len(violations):
+                errors.append(f"{len(violations)} arête(s) violent la propriété du cycle")
+
+    report["valid"] = not errors
+    return report
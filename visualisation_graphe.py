@@ -3,14 +3,14 @@ from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QPu
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWebEngineWidgets import QWebEngineView
 import networkx as nx
-import numpy as np
+import math
 import json
 import random
 import time
 import os
 
 # Importer l'implémentation existante
-from noyau_kruskal import create_test_graphs
+from noyau_kruskal import create_graph_catalog, graph_components
 
 class CytoscapeGraphView(QWebEngineView):
     def __init__(self, parent=None):
@@ -249,9 +249,8 @@ class CytoscapeGraphView(QWebEngineView):
         
     def _generate_cytoscape_data(self, graph):
         """Générer les données pour Cytoscape.js à partir du graphe NetworkX"""
-        # Générer les positions de disposition
-        is_disconnected = not nx.is_connected(graph)
-        pos = self._generate_layout(graph, is_disconnected)
+        # Générer les positions de disposition (composantes par une passe union-find, sans calculer d'ACM)
+        pos = self._generate_layout(graph, graph_components(graph))
         
         # Stocker la disposition
         self.layout_cache[id(graph)] = pos
@@ -325,7 +324,7 @@ class CytoscapeGraphView(QWebEngineView):
                 
         return edge_ids
         
-    def _generate_layout(self, graph, is_disconnected):
+    def _generate_layout(self, graph, components):
         """Générer les positions de disposition pour le graphe"""
         # Utiliser la disposition mise en cache si disponible pour la cohérence
         graph_id = id(graph)
@@ -336,12 +335,11 @@ class CytoscapeGraphView(QWebEngineView):
         pos = {}
         
         # Gérer différents types de graphes
-        if is_disconnected:
-            components = list(nx.connected_components(graph))
+        if len(components) > 1:
             component_count = len(components)
             
             # Placer les composantes dans une disposition en grille avec plus d'espacement
-            grid_size = max(2, int(np.ceil(np.sqrt(component_count))))
+            grid_size = max(2, int(math.ceil(math.sqrt(component_count))))
             grid_width = 3.0 / grid_size  # Augmenté de 2.0 à 3.0
             grid_height = 3.0 / grid_size # Augmenté de 2.0 à 3.0
             
@@ -358,7 +356,7 @@ class CytoscapeGraphView(QWebEngineView):
                     sub_pos = nx.circular_layout(subgraph)
                 elif len(component) <= 15:
                     sub_pos = nx.spring_layout(subgraph, seed=self.layout_seed + i, 
-                                             k=3.0/np.sqrt(len(component)), # Augmenté de 2.0 à 3.0
+                                             k=3.0/math.sqrt(len(component)), # Augmenté de 2.0 à 3.0
                                              iterations=150) # Augmenté le nombre d'itérations
                 else:
                     sub_pos = nx.kamada_kawai_layout(subgraph, scale=2.0) # Ajout du paramètre scale
@@ -374,7 +372,7 @@ class CytoscapeGraphView(QWebEngineView):
         elif num_nodes <= 20:
             # Pour les petits graphes, utiliser la disposition Fruchterman-Reingold (layout spring)
             pos = nx.spring_layout(graph, seed=self.layout_seed, 
-                                 k=3.0/np.sqrt(num_nodes), # Augmenté de 2.0 à 3.0
+                                 k=3.0/math.sqrt(num_nodes), # Augmenté de 2.0 à 3.0
                                  iterations=150) # Augmenté le nombre d'itérations
         elif num_nodes <= 50:
             # Pour les graphes moyens, utiliser la disposition Kamada-Kawai avec mise à l'échelle
@@ -382,13 +380,13 @@ class CytoscapeGraphView(QWebEngineView):
         else:
             # Pour les grands graphes, utiliser Fruchterman-Reingold avec plus d'espace
             pos = nx.spring_layout(graph, seed=self.layout_seed, 
-                                 k=4.0/np.sqrt(num_nodes), # Augmenté de 3.0 à 4.0
+                                 k=4.0/math.sqrt(num_nodes), # Augmenté de 3.0 à 4.0
                                  iterations=100) # Augmenté le nombre d'itérations
             
             # Ajouter un espacement supplémentaire pour les grands graphes
             for node in graph.nodes():
                 x, y = pos[node]
-                magnitude = np.sqrt(x**2 + y**2)
+                magnitude = math.sqrt(x**2 + y**2)
                 if magnitude > 0:
                     # Pousser les sommets plus loin du centre pour un meilleur espacement
                     factor = 1.0 + 0.5 * (1.0 - magnitude)
@@ -437,7 +435,7 @@ if __name__ == "__main__":
     window.setCentralWidget(central_widget)
     
     # Créer un graphe de test
-    test_graphs = create_test_graphs()
+    test_graphs = create_graph_catalog()
     
     def on_test_click():
         graph_idx = random.randint(0, len(test_graphs)-1)